@@ -0,0 +1,95 @@
+"""
+Compare the aiosqlite and threadpool session backends under concurrency.
+
+Concurrent workers read customers by guid, or update them, through
+CustomerRepository against a file database using the balanced pragma
+profile, so that fsync does not hide the cost of the driver path.
+Throughput and per-call latency are reported for each backend, workload
+and concurrency level.
+"""
+
+import asyncio
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+from benchmarks.bench_write_batching import customer_inputs
+from benchmarks.common import (
+    create_database_client,
+    dispose_database_client,
+    print_table,
+)
+from src.repositories.customer_repository import CustomerRepository
+from src.schemas.customer.customer_update import CustomerUpdate
+
+CUSTOMERS = 200
+CALLS = 800
+CONCURRENCY = [1, 8, 32]
+
+
+async def measure(concurrency: int, call):
+    latencies = []
+
+    async def worker(worker_index: int):
+        for index in range(worker_index, CALLS, concurrency):
+            start = time.perf_counter()
+            await call(index)
+            latencies.append((time.perf_counter() - start) * 1000)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker(i) for i in range(concurrency)))
+    elapsed = time.perf_counter() - start
+
+    return [
+        CALLS / elapsed,
+        statistics.median(latencies),
+        statistics.quantiles(latencies, n=100)[98],
+    ]
+
+
+async def run(db_path: Path, backend: str):
+    db_client = await create_database_client(
+        DATABASE_URL=f"sqlite+aiosqlite:///{db_path}",
+        SQLITE_PRAGMA_PROFILE="balanced",
+        DB_BACKEND=backend,
+        DB_POOL_SIZE=max(CONCURRENCY),
+    )
+    customer_repo = CustomerRepository(db_client)
+    guids = [
+        (await customer_repo.create(*customer_inputs(index)))[0].guid
+        for index in range(CUSTOMERS)
+    ]
+    workloads = {
+        "read": lambda index: customer_repo.find_by_guid(guids[index % CUSTOMERS]),
+        "update": lambda index: customer_repo.update(
+            guids[index % CUSTOMERS], CustomerUpdate(address=f"{index} Road")
+        ),
+    }
+
+    rows = []
+    for workload, call in workloads.items():
+        for concurrency in CONCURRENCY:
+            rows.append(
+                [backend, workload, concurrency, *await measure(concurrency, call)]
+            )
+
+    await dispose_database_client(db_client)
+    return rows
+
+
+async def main():
+    rows = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for backend in ["aiosqlite", "threadpool"]:
+            rows.extend(await run(Path(tmp) / f"{backend}.db", backend))
+
+    rows.sort(key=lambda row: (row[1], row[2], row[0]))
+    print(f"{CALLS} calls per run")
+    print_table(
+        ["backend", "workload", "concurrency", "calls/s", "p50 ms", "p99 ms"], rows
+    )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,101 @@
+"""
+Measure writer latency while an online backup runs.
+
+The database is seeded with customers, then customers are created one at a
+time, first with no backup running and then while a backup started through
+DatabaseClient copies the database. The stepped backup is compared with one
+copying every page in a single step.
+"""
+
+import asyncio
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+from benchmarks.bench_write_batching import customer_inputs
+from benchmarks.common import (
+    create_database_client,
+    dispose_database_client,
+    print_table,
+)
+from src.repositories.customer_repository import CustomerRepository
+
+SEED_CUSTOMERS = 5000
+WRITES = 300
+
+
+async def timed_writes(customer_repo, first_index: int, backup_running=None):
+    latencies = []
+    index = first_index
+
+    while len(latencies) < WRITES or (backup_running and backup_running()):
+        start = time.perf_counter()
+        await customer_repo.create(*customer_inputs(index))
+        latencies.append((time.perf_counter() - start) * 1000)
+        index += 1
+
+    return latencies
+
+
+async def run(db_path: Path, pages_per_step: int):
+    db_client = await create_database_client(
+        DATABASE_URL=f"sqlite+aiosqlite:///{db_path}",
+        SQLITE_PRAGMA_PROFILE="balanced",
+        DB_BACKUP_DIR=str(db_path.parent / f"backups{pages_per_step}"),
+        DB_BACKUP_PAGES_PER_STEP=pages_per_step,
+        DB_BACKUP_STEP_PAUSE_MS=1,
+    )
+    customer_repo = CustomerRepository(db_client)
+
+    for index in range(SEED_CUSTOMERS):
+        await customer_repo.create(*customer_inputs(index))
+
+    idle = await timed_writes(customer_repo, SEED_CUSTOMERS)
+
+    await db_client.start_backup()
+    during = await timed_writes(
+        customer_repo,
+        SEED_CUSTOMERS + WRITES,
+        backup_running=lambda: db_client.get_backup_status()[0].state
+        in ("pending", "running"),
+    )
+    (backup,) = db_client.get_backup_status()
+    await dispose_database_client(db_client)
+
+    return [
+        statistics.median(idle),
+        max(idle),
+        statistics.median(during),
+        max(during),
+        backup.total_pages,
+        backup.restarts,
+        backup.pages_per_second,
+    ]
+
+
+async def main():
+    rows = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for label, pages_per_step in [("stepped (64)", 64), ("single step", -1)]:
+            results = await run(Path(tmp) / f"{pages_per_step}.db", pages_per_step)
+            rows.append([label, *results])
+
+    print(f"{WRITES}+ sequential creates on a database of {SEED_CUSTOMERS} customers")
+    print_table(
+        [
+            "backup",
+            "idle p50 ms",
+            "idle max ms",
+            "backup p50 ms",
+            "backup max ms",
+            "pages",
+            "restarts",
+            "pages/s",
+        ],
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,109 @@
+"""
+Compare bulk-load throughput with random (v4) and time-ordered (v7) guids.
+
+Transactions are inserted in committed batches, as a high ingest rate would
+write them, once keyed by uuid4 and once by uuid7. Random keys land all
+over the primary key index, splitting pages and dirtying a different page
+for almost every row; time-ordered keys append to its right-most page. The
+cache is kept small relative to the index, as it is once a table has grown.
+
+Rows are built before the timed inserts, which run through the sqlite3
+module, so the timings compare SQLite's work rather than SQLAlchemy's.
+"""
+
+import random
+import sqlite3
+import tempfile
+import time
+import uuid
+from datetime import datetime, timezone
+from pathlib import Path
+
+from sqlalchemy import create_engine
+
+from benchmarks.common import print_table
+from src.db.sqlite_pragmas import get_pragma_profile
+from src.models.banking_models import SQLModel, Transaction
+from src.utils.guid_functions import uuid7
+
+ROWS = 1_000_000
+BATCH_SIZE = 5_000
+CACHE_KIB = 8_000
+ACCOUNTS = [uuid.uuid4().bytes for _ in range(1_000)]
+
+
+def load(path: Path, new_guid) -> tuple:
+    engine = create_engine(f"sqlite:///{path}")
+    SQLModel.metadata.create_all(engine, tables=[Transaction.__table__])
+    engine.dispose()
+
+    columns = list(Transaction.__table__.columns)
+    statement = (
+        f'INSERT INTO "transaction" ({", ".join(column.name for column in columns)}) '
+        f"VALUES ({', '.join('?' for _ in columns)})"
+    )
+    timings = []
+
+    with sqlite3.connect(path) as conn:
+        for name, value in get_pragma_profile("balanced").items():
+            conn.execute(f"PRAGMA {name}={value}")
+        conn.execute(f"PRAGMA cache_size=-{CACHE_KIB}")
+
+        for _ in range(ROWS // BATCH_SIZE):
+            now = datetime.now(timezone.utc).isoformat(" ")
+            rows = [
+                (
+                    new_guid().bytes,
+                    now,
+                    "Credit",
+                    random.choice(ACCOUNTS),
+                    random.choice(ACCOUNTS),
+                    random.randint(1, 100_000),
+                    "GBP",
+                    now,
+                    "Completed",
+                    now,
+                    0,
+                )
+                for _ in range(BATCH_SIZE)
+            ]
+            start = time.perf_counter()
+            conn.executemany(statement, rows)
+            conn.commit()
+            timings.append(time.perf_counter() - start)
+
+        index_kib = (
+            conn.execute(
+                "SELECT SUM(pgsize) FROM dbstat "
+                "WHERE name = 'sqlite_autoindex_transaction_1'"
+            ).fetchone()[0]
+            / 1024
+        )
+
+    last_tenth = timings[-len(timings) // 10 :]
+    return (
+        ROWS / sum(timings),
+        BATCH_SIZE * len(last_tenth) / sum(last_tenth),
+        index_kib,
+    )
+
+
+def main():
+    rows = []
+
+    with tempfile.TemporaryDirectory() as directory:
+        for name, new_guid in (("uuid4", uuid.uuid4), ("uuid7", uuid7)):
+            rows.append([name, *load(Path(directory) / f"{name}.db", new_guid)])
+
+    print(
+        f"{ROWS:,} transactions in batches of {BATCH_SIZE:,}, "
+        f"{CACHE_KIB:,} KiB page cache\n"
+    )
+    print_table(
+        ["guid", "rows/s", "rows/s (last 10%)", "primary key index (KiB)"],
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    main()
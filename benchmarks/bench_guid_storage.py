@@ -0,0 +1,183 @@
+"""
+Compare the size of the key indexes, and the time of key lookups, with GUIDs
+stored as 16-byte blobs and as 36 character text.
+
+One database is seeded through the models, which store blobs, then copied
+with every GUID rewritten as text and vacuumed. The lookups run through the
+sqlite3 module with each database's native key values, so the timings
+compare SQLite's work rather than SQLAlchemy's.
+"""
+
+import random
+import shutil
+import sqlite3
+import tempfile
+import time
+import uuid
+from datetime import datetime, timezone
+from pathlib import Path
+
+from sqlalchemy import create_engine, insert
+
+from benchmarks.common import account_data, customer_data, print_table
+from src.enums.currency_code import CurrencyCode
+from src.enums.transaction_status import TransactionStatus
+from src.enums.transaction_type import TransactionType
+from src.models.banking_models import (
+    Account,
+    Customer,
+    CustomerAccountLink,
+    SQLModel,
+    Transaction,
+)
+from src.models.types import BinaryGuid
+
+CUSTOMERS = 100_000
+TRANSACTIONS = 300_000
+LOOKUPS = 50_000
+
+LOOKUP_QUERIES = {
+    "customer by guid": "SELECT * FROM customer WHERE guid = ?",
+    "account's customers": (
+        "SELECT customer.* FROM customer JOIN customeraccountlink "
+        "ON customer.guid = customeraccountlink.customer_guid "
+        "WHERE customeraccountlink.account_guid = ?"
+    ),
+    "account's credits": (
+        'SELECT * FROM "transaction" WHERE creditor_account = ? '
+        "ORDER BY transaction_date DESC LIMIT 20"
+    ),
+}
+
+
+def seed(path: Path) -> list:
+    engine = create_engine(f"sqlite:///{path}")
+    customers = [customer_data(index) for index in range(CUSTOMERS)]
+    accounts = [account_data(index) for index in range(CUSTOMERS)]
+    guids = [account["guid"] for account in accounts]
+
+    with engine.begin() as conn:
+        SQLModel.metadata.create_all(conn)
+        conn.execute(insert(Customer), customers)
+        conn.execute(insert(Account), accounts)
+        conn.execute(
+            insert(CustomerAccountLink),
+            [
+                {"customer_guid": customer["guid"], "account_guid": account["guid"]}
+                for customer, account in zip(customers, accounts)
+            ],
+        )
+        conn.execute(
+            insert(Transaction),
+            [
+                {
+                    "guid": str(uuid.uuid4()),
+                    "transaction_type": TransactionType.DEBIT,
+                    "creditor_account": random.choice(guids),
+                    "debtor_account": random.choice(guids),
+                    "amount": random.randint(1, 100_000),
+                    "currency": CurrencyCode.GBP,
+                    "transaction_date": datetime.now(timezone.utc),
+                    "transaction_status": TransactionStatus.COMPLETED,
+                }
+                for _ in range(TRANSACTIONS)
+            ],
+        )
+
+    engine.dispose()
+    return guids
+
+
+def rewrite_as_text(path: Path) -> None:
+    with sqlite3.connect(path, isolation_level=None) as conn:
+        conn.create_function(
+            "guid_text",
+            1,
+            lambda value: str(uuid.UUID(bytes=value)),
+            deterministic=True,
+        )
+        conn.execute("BEGIN")
+        for table in SQLModel.metadata.sorted_tables:
+            for column in table.columns:
+                if isinstance(column.type, BinaryGuid):
+                    conn.execute(
+                        f'UPDATE "{table.name}" '
+                        f"SET {column.name} = guid_text({column.name})"
+                    )
+        conn.execute("COMMIT")
+        conn.execute("VACUUM")
+
+
+def key_index_sizes(path: Path) -> dict:
+    with sqlite3.connect(path) as conn:
+        return dict(
+            conn.execute(
+                "SELECT dbstat.name, SUM(pgsize) FROM dbstat "
+                "JOIN sqlite_master ON sqlite_master.name = dbstat.name "
+                "WHERE sqlite_master.type = 'index' GROUP BY dbstat.name"
+            ).fetchall()
+        )
+
+
+def lookup_times(path: Path, keys: list) -> dict:
+    times = {}
+
+    with sqlite3.connect(path) as conn:
+        for name, query in LOOKUP_QUERIES.items():
+            start = time.perf_counter()
+            for key in keys:
+                conn.execute(query, (key,)).fetchall()
+            times[name] = (time.perf_counter() - start) / len(keys) * 1_000_000
+
+    return times
+
+
+def main():
+    with tempfile.TemporaryDirectory() as directory:
+        binary = Path(directory) / "binary.db"
+        text = Path(directory) / "text.db"
+
+        guids = seed(binary)
+        with sqlite3.connect(binary) as conn:
+            conn.execute("VACUUM")
+        shutil.copyfile(binary, text)
+        rewrite_as_text(text)
+
+        text_sizes = key_index_sizes(text)
+        binary_sizes = key_index_sizes(binary)
+        file_sizes = (text.stat().st_size, binary.stat().st_size)
+
+        keys = random.choices(guids, k=LOOKUPS)
+        text_times = lookup_times(text, keys)
+        binary_times = lookup_times(binary, [uuid.UUID(key).bytes for key in keys])
+
+    print(f"{CUSTOMERS:,} customers and accounts, {TRANSACTIONS:,} transactions\n")
+    print_table(
+        ["index", "text (KiB)", "16-byte blob (KiB)", "saved (%)"],
+        [
+            [
+                name,
+                text_sizes[name] / 1024,
+                binary_sizes[name] / 1024,
+                (1 - binary_sizes[name] / text_sizes[name]) * 100,
+            ]
+            for name in sorted(text_sizes)
+        ]
+        + [
+            [
+                "whole file",
+                file_sizes[0] / 1024,
+                file_sizes[1] / 1024,
+                (1 - file_sizes[1] / file_sizes[0]) * 100,
+            ]
+        ],
+    )
+    print(f"\n{LOOKUPS:,} random lookups\n")
+    print_table(
+        ["query", "text (us/lookup)", "16-byte blob (us/lookup)"],
+        [[name, text_times[name], binary_times[name]] for name in LOOKUP_QUERIES],
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""
+Compare request latency of the file-backed and in-memory database modes.
+
+Customers are created and then read back by guid through CustomerRepository,
+one request at a time, so each figure is the latency of a single request.
+The file-backed database uses the durable pragma profile (fsync on every
+commit). The in-memory database takes a snapshot only on shutdown, which is
+timed separately: it bounds the cost of each periodic snapshot.
+"""
+
+import asyncio
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+from benchmarks.bench_write_batching import customer_inputs
+from benchmarks.common import (
+    create_database_client,
+    dispose_database_client,
+    print_table,
+)
+from src.repositories.customer_repository import CustomerRepository
+
+CUSTOMERS = 500
+
+
+async def timed_calls(calls):
+    latencies = []
+    for call in calls:
+        start = time.perf_counter()
+        await call()
+        latencies.append((time.perf_counter() - start) * 1_000_000)
+
+    return statistics.median(latencies), statistics.quantiles(latencies, n=100)[98]
+
+
+async def run(db_path: Path, in_memory: bool):
+    db_client = await create_database_client(
+        DATABASE_URL=f"sqlite+aiosqlite:///{db_path}",
+        SQLITE_PRAGMA_PROFILE="durable",
+        DB_IN_MEMORY=in_memory,
+        DB_SNAPSHOT_INTERVAL_S=0,
+    )
+    customer_repo = CustomerRepository(db_client)
+    inputs = [customer_inputs(index) for index in range(CUSTOMERS)]
+
+    write_p50, write_p99 = await timed_calls(
+        [lambda data=data: customer_repo.create(*data) for data in inputs]
+    )
+    read_p50, read_p99 = await timed_calls(
+        [
+            lambda guid=customer.guid: customer_repo.find_by_guid(guid)
+            for customer, _ in inputs
+        ]
+    )
+
+    start = time.perf_counter()
+    await dispose_database_client(db_client)
+    close_ms = (time.perf_counter() - start) * 1000
+
+    return [write_p50, write_p99, read_p50, read_p99, close_ms]
+
+
+async def main():
+    rows = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for label, in_memory in [("file (durable)", False), ("in-memory", True)]:
+            results = await run(Path(tmp) / f"{in_memory}.db", in_memory)
+            rows.append([label, *results])
+
+    print(f"{CUSTOMERS} sequential creates, then reads by guid")
+    print_table(
+        [
+            "mode",
+            "create p50 us",
+            "create p99 us",
+            "read p50 us",
+            "read p99 us",
+            "shutdown ms",
+        ],
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,196 @@
+"""
+Show the secondary indexes turn relationship loads and history queries into
+index searches on a large seeded database.
+
+One database is seeded with customers, their accounts and a few
+transactions per account, then copied with the secondary indexes dropped.
+Each query is explained and timed against both copies.
+"""
+
+import asyncio
+import random
+import shutil
+import tempfile
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+from sqlalchemy import insert, or_, text
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from benchmarks.common import account_data, customer_data, print_table
+from src.db.sqlite_pragmas import register_pragma_profile
+from src.enums.currency_code import CurrencyCode
+from src.enums.transaction_status import TransactionStatus
+from src.enums.transaction_type import TransactionType
+from src.models.banking_models import (
+    Account,
+    Customer,
+    CustomerAccountLink,
+    SQLModel,
+    Transaction,
+)
+
+CUSTOMERS = 20_000
+TRANSACTIONS = 200_000
+CALLS = 50
+PAGE_SIZE = 20
+SECONDARY_INDEXES = [
+    index.name for table in SQLModel.metadata.sorted_tables for index in table.indexes
+]
+
+
+def history_queries():
+    """Build the timed queries, each for a random account guid."""
+    return [
+        (
+            "account with customers",
+            lambda guid: select(Account).where(Account.guid == guid),
+        ),
+        (
+            "credits to account",
+            lambda guid: select(Transaction)
+            .where(Transaction.creditor_account == guid)
+            .order_by(Transaction.transaction_date.desc())
+            .limit(PAGE_SIZE),
+        ),
+        (
+            "account history",
+            lambda guid: select(Transaction)
+            .where(
+                or_(
+                    Transaction.creditor_account == guid,
+                    Transaction.debtor_account == guid,
+                )
+            )
+            .order_by(Transaction.transaction_date.desc())
+            .limit(PAGE_SIZE),
+        ),
+    ]
+
+
+async def seed(path: Path) -> list:
+    engine = create_async_engine(f"sqlite+aiosqlite:///{path}")
+    register_pragma_profile(engine, "throughput")
+
+    customers = [customer_data(index) for index in range(CUSTOMERS)]
+    accounts = [account_data(index) for index in range(CUSTOMERS)]
+    guids = [account["guid"] for account in accounts]
+    start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+    async with engine.begin() as conn:
+        await conn.run_sync(SQLModel.metadata.create_all)
+        await conn.execute(insert(Customer), customers)
+        await conn.execute(insert(Account), accounts)
+        await conn.execute(
+            insert(CustomerAccountLink),
+            [
+                {"customer_guid": customer["guid"], "account_guid": account["guid"]}
+                for customer, account in zip(customers, accounts)
+            ],
+        )
+        await conn.execute(
+            insert(Transaction),
+            [
+                {
+                    "guid": str(uuid.uuid4()),
+                    "transaction_type": TransactionType.DEBIT,
+                    "creditor_account": random.choice(guids),
+                    "debtor_account": random.choice(guids),
+                    "amount": random.randint(1, 100_000),
+                    "currency": CurrencyCode.GBP,
+                    "transaction_date": start + timedelta(seconds=index * 60),
+                    "transaction_status": TransactionStatus.COMPLETED,
+                }
+                for index in range(TRANSACTIONS)
+            ],
+        )
+        await conn.execute(text("ANALYZE"))
+
+    await engine.dispose()
+    return guids
+
+
+async def drop_indexes(path: Path) -> None:
+    engine = create_async_engine(f"sqlite+aiosqlite:///{path}")
+
+    async with engine.begin() as conn:
+        for name in SECONDARY_INDEXES:
+            await conn.execute(text(f"DROP INDEX {name}"))
+        await conn.execute(text("ANALYZE"))
+
+    await engine.dispose()
+
+
+async def measure(path: Path, guids: list) -> dict:
+    engine = create_async_engine(f"sqlite+aiosqlite:///{path}")
+    register_pragma_profile(engine, "balanced")
+    results = {}
+
+    for name, build in history_queries():
+        async with engine.connect() as conn:
+            compiled = build(guids[0]).compile(engine)
+            plan = await conn.exec_driver_sql(
+                f"EXPLAIN QUERY PLAN {compiled}",
+                tuple(compiled.params[key] for key in compiled.positiontup),
+            )
+            details = "; ".join(row[3] for row in plan)
+
+        async with AsyncSession(engine) as session:
+            start = time.perf_counter()
+            for _ in range(CALLS):
+                (await session.exec(build(random.choice(guids)))).all()
+                session.expunge_all()
+            elapsed = (time.perf_counter() - start) / CALLS * 1000
+
+        results[name] = (elapsed, details)
+
+    # Plan of the selectin load of an account's customers, run by the first query
+    async with engine.connect() as conn:
+        plan = await conn.exec_driver_sql(
+            "EXPLAIN QUERY PLAN SELECT customer.guid FROM customer "
+            "JOIN customeraccountlink ON customer.guid = "
+            "customeraccountlink.customer_guid "
+            "WHERE customeraccountlink.account_guid IN (?)",
+            (guids[0],),
+        )
+        results["  selectin: account -> customers"] = (
+            None,
+            "; ".join(row[3] for row in plan),
+        )
+
+    await engine.dispose()
+    return results
+
+
+async def main():
+    with tempfile.TemporaryDirectory() as directory:
+        indexed = Path(directory) / "indexed.db"
+        unindexed = Path(directory) / "unindexed.db"
+
+        guids = await seed(indexed)
+        shutil.copyfile(indexed, unindexed)
+        await drop_indexes(unindexed)
+
+        before = await measure(unindexed, guids)
+        after = await measure(indexed, guids)
+
+    print(
+        f"{CUSTOMERS:,} customers and accounts, {TRANSACTIONS:,} transactions, "
+        f"{CALLS} calls per query\n"
+    )
+    print_table(
+        ["query", "no indexes (ms/call)", "indexed (ms/call)"],
+        [[name, before[name][0] or "-", after[name][0] or "-"] for name in after],
+    )
+
+    for name in after:
+        print(f"\n{name.strip()}\n  no indexes: {before[name][1]}")
+        print(f"  indexed:    {after[name][1]}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
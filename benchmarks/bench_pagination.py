@@ -0,0 +1,97 @@
+"""
+Compare listing customers in full with fetching one keyset page of them.
+
+Customers, each with an account, are seeded in growing numbers. At each
+size an unbounded listing of every customer is timed against get_page() for
+the first page and for a page deep in the key order, with the peak memory
+allocated by each call. A keyset page is a range search of the primary key,
+so its time and memory stay flat as the table grows.
+"""
+
+import asyncio
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+from sqlalchemy import insert
+
+from benchmarks.common import (
+    account_data,
+    create_database_client,
+    customer_data,
+    dispose_database_client,
+    load_customer_entities,
+    print_table,
+)
+from src.models.banking_models import Account, Customer, CustomerAccountLink
+from src.repositories.customer_repository import CustomerRepository
+from src.utils.constants import DEFAULT_PAGE_SIZE
+
+SIZES = [1_000, 10_000, 50_000]
+CALLS = 5
+
+
+async def seed(db_client, size: int) -> list:
+    customers = [customer_data(index) for index in range(size)]
+    accounts = [account_data(index) for index in range(size)]
+
+    async with db_client._engine.begin() as conn:
+        await conn.execute(insert(Customer), customers)
+        await conn.execute(insert(Account), accounts)
+        await conn.execute(
+            insert(CustomerAccountLink),
+            [
+                {"customer_guid": customer["guid"], "account_guid": account["guid"]}
+                for customer, account in zip(customers, accounts)
+            ],
+        )
+
+    return sorted(customer["guid"] for customer in customers)
+
+
+async def measure(call) -> tuple:
+    """Return the mean milliseconds and peak MiB allocated by a call."""
+    await call()
+    start = time.perf_counter()
+    for _ in range(CALLS):
+        await call()
+    elapsed = (time.perf_counter() - start) / CALLS * 1_000
+
+    tracemalloc.start()
+    await call()
+    peak = tracemalloc.get_traced_memory()[1] / 2**20
+    tracemalloc.stop()
+
+    return elapsed, peak
+
+
+async def main():
+    rows = []
+
+    for size in SIZES:
+        with tempfile.TemporaryDirectory() as directory:
+            db_client = await create_database_client(
+                DATABASE_URL=f"sqlite+aiosqlite:///{Path(directory) / 'bank.db'}"
+            )
+            guids = await seed(db_client, size)
+            repository = CustomerRepository(db_client)
+
+            calls = {
+                "full listing": lambda: load_customer_entities(db_client),
+                "first page": lambda: repository.get_page(None, DEFAULT_PAGE_SIZE),
+                "deep page": lambda: repository.get_page(
+                    guids[-DEFAULT_PAGE_SIZE * 2], DEFAULT_PAGE_SIZE
+                ),
+            }
+            for name, call in calls.items():
+                rows.append([f"{size:,}", name, *await measure(call)])
+
+            await dispose_database_client(db_client)
+
+    print(f"Customers with one account each, pages of {DEFAULT_PAGE_SIZE}\n")
+    print_table(["customers", "call", "ms/call", "peak MiB"], rows)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,91 @@
+"""
+Compare read/write throughput of the SQLite pragma profiles.
+
+Writers commit one customer per transaction while readers repeatedly look
+customers up by primary key, mirroring POST /customers and GET /customers/{guid}
+traffic. "none" is SQLite's default configuration (rollback journal).
+"""
+
+import asyncio
+import random
+import tempfile
+from pathlib import Path
+
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from benchmarks.common import customer_data, print_table, timed
+from src.db.sqlite_pragmas import PRAGMA_PROFILES, register_pragma_profile
+from src.models.banking_models import Customer, SQLModel
+
+WRITERS = 4
+READERS = 8
+WRITES_PER_WRITER = 250
+
+
+async def run_profile(db_path: Path, profile_name: str):
+    engine = create_async_engine(
+        f"sqlite+aiosqlite:///{db_path}",
+        poolclass=AsyncAdaptedQueuePool,
+        pool_size=WRITERS + READERS,
+        connect_args={"timeout": 30},
+    )
+    if profile_name != "none":
+        register_pragma_profile(engine, profile_name)
+
+    async with engine.begin() as conn:
+        await conn.run_sync(SQLModel.metadata.create_all)
+
+    guids = []
+    async with AsyncSession(engine) as session:
+        for index in range(200):
+            customer = Customer(**customer_data(index))
+            guids.append(customer.guid)
+            session.add(customer)
+        await session.commit()
+
+    writing = True
+    reads = 0
+
+    async def writer(offset: int):
+        for index in range(WRITES_PER_WRITER):
+            async with AsyncSession(engine) as session:
+                session.add(Customer(**customer_data(offset + index)))
+                await session.commit()
+
+    async def reader():
+        nonlocal reads
+        while writing:
+            async with AsyncSession(engine) as session:
+                await session.get(Customer, random.choice(guids))
+            reads += 1
+
+    reader_tasks = [asyncio.create_task(reader()) for _ in range(READERS)]
+    with timed() as timer:
+        await asyncio.gather(*(writer(1000 * (i + 1)) for i in range(WRITERS)))
+    writing = False
+    await asyncio.gather(*reader_tasks)
+    await engine.dispose()
+
+    return WRITERS * WRITES_PER_WRITER / timer.elapsed, reads / timer.elapsed
+
+
+async def main():
+    rows = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for profile_name in ["none", *PRAGMA_PROFILES]:
+            writes, reads = await run_profile(
+                Path(tmp) / f"{profile_name}.db", profile_name
+            )
+            rows.append((profile_name, writes, reads))
+
+    print(
+        f"{WRITERS} writers x {WRITES_PER_WRITER} single-row commits, "
+        f"{READERS} concurrent primary-key readers"
+    )
+    print_table(["profile", "writes/s", "reads/s"], rows)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
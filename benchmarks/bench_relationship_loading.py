@@ -0,0 +1,130 @@
+"""
+Compare the ways the GET endpoints can load related records.
+
+include=none reads only the customers, include=selectin reads the page and
+then every linked account with one IN query, include=joined reads both in a
+single outer join that repeats the customer columns on each account row, and
+include=json has SQLite build each customer's nested JSON document. Customers
+with growing numbers of accounts are read through CustomerService, as a full
+page and as a single detail lookup, so that the time to serialise the response
+data is included; the statements issued and the best wall time per call are
+reported for each mode.
+"""
+
+import asyncio
+import tempfile
+import time
+from pathlib import Path
+
+from sqlalchemy import event, insert
+
+from benchmarks.common import (
+    account_data,
+    create_database_client,
+    customer_data,
+    dispose_database_client,
+    print_table,
+)
+from src.enums.relationship_loading import RelationshipLoading
+from src.models.banking_models import Account, Customer, CustomerAccountLink
+from src.repositories.customer_repository import CustomerRepository
+from src.services.customer_service import CustomerService
+from src.utils.constants import MAX_PAGE_SIZE
+
+CUSTOMERS = 1_000
+ACCOUNTS_PER_CUSTOMER = [1, 5, 20]
+ROUNDS = 20
+
+
+async def seed(db_client, accounts_per_customer: int) -> None:
+    customers = [customer_data(index) for index in range(CUSTOMERS)]
+    accounts = [
+        account_data(index) for index in range(CUSTOMERS * accounts_per_customer)
+    ]
+
+    async with db_client._engine.begin() as conn:
+        await conn.execute(insert(Customer), customers)
+        await conn.execute(insert(Account), accounts)
+        await conn.execute(
+            insert(CustomerAccountLink),
+            [
+                {
+                    "customer_guid": customers[index % CUSTOMERS]["guid"],
+                    "account_guid": account["guid"],
+                }
+                for index, account in enumerate(accounts)
+            ],
+        )
+
+
+async def measure(db_client, call) -> tuple:
+    """Return the statements issued by one call and its best wall milliseconds."""
+    statements = []
+
+    def count(*args):
+        statements.append(args[2])
+
+    engine = db_client._read_engine.sync_engine
+    event.listen(engine, "before_cursor_execute", count)
+    await call()
+    event.remove(engine, "before_cursor_execute", count)
+
+    timings = []
+    for _ in range(ROUNDS):
+        start = time.perf_counter()
+        await call()
+        timings.append((time.perf_counter() - start) * 1_000)
+
+    return len(statements), min(timings)
+
+
+async def main():
+    rows = []
+
+    for accounts_per_customer in ACCOUNTS_PER_CUSTOMER:
+        with tempfile.TemporaryDirectory() as directory:
+            db_client = await create_database_client(
+                DATABASE_URL=f"sqlite+aiosqlite:///{Path(directory) / 'bank.db'}"
+            )
+            await seed(db_client, accounts_per_customer)
+            repository = CustomerRepository(db_client)
+            service = CustomerService(repository)
+            guid = (await repository.get_page(None, 1))[0].guid
+
+            for include in RelationshipLoading:
+                page_statements, page_ms = await measure(
+                    db_client,
+                    lambda: service.get_all(limit=MAX_PAGE_SIZE, include=include),
+                )
+                detail_statements, detail_ms = await measure(
+                    db_client, lambda: service.get_customer(guid, include)
+                )
+                rows.append(
+                    [
+                        accounts_per_customer,
+                        include.value,
+                        page_statements,
+                        page_ms,
+                        detail_statements,
+                        detail_ms,
+                    ]
+                )
+
+            await dispose_database_client(db_client)
+
+    print(f"{CUSTOMERS:,} customers, pages of {MAX_PAGE_SIZE}, best of {ROUNDS}\n")
+    print_table(
+        [
+            "accounts/customer",
+            "include",
+            "page statements",
+            "page ms",
+            "detail statements",
+            "detail ms",
+        ],
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,150 @@
+"""
+Measure the latency of fetching and updating a customer in one round trip.
+
+The service used to check that a customer existed before reading or
+updating it, and the update itself loaded the row, flushed it and refreshed
+it afterwards. Each flow is replayed through the repositories against a
+seeded file database, counting the statements sent to SQLite per request,
+once as it was and once with find_by_guid() and UPDATE ... RETURNING.
+"""
+
+import asyncio
+import random
+import tempfile
+import time
+from pathlib import Path
+
+from sqlalchemy import event, insert
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from benchmarks.common import (
+    account_data,
+    create_database_client,
+    customer_data,
+    dispose_database_client,
+    load_customer_entities,
+    print_table,
+)
+from src.models.banking_models import Account, Customer, CustomerAccountLink
+from src.repositories.customer_repository import CustomerRepository
+from src.schemas.customer.customer_update import CustomerUpdate
+
+CUSTOMERS = 10_000
+CALLS = 2_000
+
+
+async def seed(db_client) -> list:
+    customers = [customer_data(index) for index in range(CUSTOMERS)]
+    accounts = [account_data(index) for index in range(CUSTOMERS)]
+
+    async with db_client._engine.begin() as conn:
+        await conn.execute(insert(Customer), customers)
+        await conn.execute(insert(Account), accounts)
+        await conn.execute(
+            insert(CustomerAccountLink),
+            [
+                {"customer_guid": customer["guid"], "account_guid": account["guid"]}
+                for customer, account in zip(customers, accounts)
+            ],
+        )
+
+    return [customer["guid"] for customer in customers]
+
+
+def flows(db_client, repository: CustomerRepository) -> dict:
+    """Map each request to its previous and current repository calls."""
+
+    async def get_then_refresh(guid: str, data: CustomerUpdate) -> None:
+        async def update_customer(session: AsyncSession) -> None:
+            customer = await session.get(Customer, guid)
+            customer.sqlmodel_update(data.model_dump(exclude_unset=True))
+            session.add(customer)
+            await session.flush()
+            await session.refresh(customer)
+
+        await db_client.execute_write(update_customer)
+
+    async def exists_then_get(guid: str) -> None:
+        if await repository.customer_exists_by_guid(guid):
+            await load_customer_entities(db_client, guid)
+
+    async def exists_then_update(guid: str) -> None:
+        data = CustomerUpdate(address=f"{random.randrange(1_000)} Benchmark Road")
+        if await repository.customer_exists_by_guid(guid):
+            await get_then_refresh(guid, data)
+
+    async def update_returning(guid: str) -> None:
+        data = CustomerUpdate(address=f"{random.randrange(1_000)} Benchmark Road")
+        await repository.update(guid, data)
+
+    return {
+        "GET /customers/{guid}": (exists_then_get, repository.find_by_guid),
+        "PUT /customers/{guid}": (exists_then_update, update_returning),
+    }
+
+
+async def measure(db_client, request, guids) -> tuple:
+    """Return the mean microseconds and statements per request."""
+    statements = 0
+
+    def count(*args) -> None:
+        nonlocal statements
+        statements += 1
+
+    engines = {db_client._engine.sync_engine, db_client._read_engine.sync_engine}
+    for engine in engines:
+        event.listen(engine, "before_cursor_execute", count)
+
+    start = time.perf_counter()
+    for guid in random.choices(guids, k=CALLS):
+        await request(guid)
+    elapsed = time.perf_counter() - start
+
+    for engine in engines:
+        event.remove(engine, "before_cursor_execute", count)
+
+    return elapsed / CALLS * 1_000_000, statements / CALLS
+
+
+async def main():
+    rows = []
+
+    with tempfile.TemporaryDirectory() as directory:
+        db_client = await create_database_client(
+            DATABASE_URL=f"sqlite+aiosqlite:///{Path(directory) / 'bank.db'}"
+        )
+        guids = await seed(db_client)
+        repository = CustomerRepository(db_client)
+
+        for name, (before, after) in flows(db_client, repository).items():
+            before_us, before_statements = await measure(db_client, before, guids)
+            after_us, after_statements = await measure(db_client, after, guids)
+            rows.append(
+                [
+                    name,
+                    before_statements,
+                    after_statements,
+                    before_us,
+                    after_us,
+                    (1 - after_us / before_us) * 100,
+                ]
+            )
+
+        await dispose_database_client(db_client)
+
+    print(f"{CUSTOMERS:,} customers, {CALLS:,} requests each\n")
+    print_table(
+        [
+            "request",
+            "statements (before)",
+            "statements (after)",
+            "us/request (before)",
+            "us/request (after)",
+            "saved (%)",
+        ],
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
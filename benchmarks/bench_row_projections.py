@@ -0,0 +1,111 @@
+"""
+Compare reading listings as ORM entities with reading them as column rows.
+
+load_customer_entities() loads Customer entities, with their accounts, into
+the session's identity map and copies their fields into DTOs, as the
+repositories used to. get_page() selects only the columns of the output
+schemas and builds the DTOs straight from the rows.
+Both read the same customers from a seeded file database; the CPU time and
+the peak memory allocated per call are reported for growing listings.
+"""
+
+import asyncio
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+from sqlalchemy import insert
+
+from benchmarks.common import (
+    account_data,
+    create_database_client,
+    customer_data,
+    dispose_database_client,
+    load_customer_entities,
+    print_table,
+)
+from src.models.banking_models import Account, Customer, CustomerAccountLink
+from src.repositories.customer_repository import CustomerRepository
+
+SIZES = [100, 1_000, 10_000]
+ROUNDS = 5
+
+
+async def seed(db_client, size: int) -> None:
+    customers = [customer_data(index) for index in range(size)]
+    accounts = [account_data(index) for index in range(size)]
+
+    async with db_client._engine.begin() as conn:
+        await conn.execute(insert(Customer), customers)
+        await conn.execute(insert(Account), accounts)
+        await conn.execute(
+            insert(CustomerAccountLink),
+            [
+                {"customer_guid": customer["guid"], "account_guid": account["guid"]}
+                for customer, account in zip(customers, accounts)
+            ],
+        )
+
+
+async def measure(call) -> tuple:
+    """Return the best CPU milliseconds and the peak MiB allocated by a call."""
+    await call()
+    timings = []
+    for _ in range(ROUNDS):
+        start = time.process_time()
+        await call()
+        timings.append((time.process_time() - start) * 1_000)
+
+    tracemalloc.start()
+    await call()
+    peak = tracemalloc.get_traced_memory()[1] / 2**20
+    tracemalloc.stop()
+
+    return min(timings), peak
+
+
+async def main():
+    rows = []
+
+    for size in SIZES:
+        with tempfile.TemporaryDirectory() as directory:
+            db_client = await create_database_client(
+                DATABASE_URL=f"sqlite+aiosqlite:///{Path(directory) / 'bank.db'}"
+            )
+            await seed(db_client, size)
+            repository = CustomerRepository(db_client)
+
+            entity_ms, entity_mib = await measure(
+                lambda: load_customer_entities(db_client)
+            )
+            row_ms, row_mib = await measure(lambda: repository.get_page(None, size))
+            rows.append(
+                [
+                    f"{size:,}",
+                    entity_ms,
+                    row_ms,
+                    (1 - row_ms / entity_ms) * 100,
+                    entity_mib,
+                    row_mib,
+                ]
+            )
+
+            await dispose_database_client(db_client)
+
+    print(f"Customers with one account each, best of {ROUNDS}\n")
+    print_table(
+        [
+            "customers",
+            "entities (CPU ms)",
+            "rows (CPU ms)",
+            "saved (%)",
+            "entities (peak MiB)",
+            "rows (peak MiB)",
+        ],
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,133 @@
+"""
+Compare write throughput of one database file against hash-sharded files.
+
+Worker processes, standing in for uvicorn workers, each run concurrent
+writers which open customers (customer, account and link rows in one
+transaction) as POST /customers does, through the sharded session used by
+DatabaseClient when DB_SHARD_COUNT > 1. A single shard is the unsharded
+baseline. Listing all customers measures the scatter-gather cost.
+"""
+
+import asyncio
+import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict
+
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from benchmarks.common import account_data, customer_data, print_table, timed
+from src.db.sharding import ShardedSQLModelSession, shard_urls
+from src.db.sqlite_pragmas import register_pragma_profile
+from src.models.banking_models import Account, Customer, SQLModel
+
+PROCESSES = min(os.cpu_count() or 1, 4)
+WRITERS_PER_PROCESS = 4
+WRITES_PER_WRITER = 100
+PROFILE = "durable"
+
+
+def create_engines(db_path: Path, shard_count: int) -> Dict[str, AsyncEngine]:
+    engines = {}
+    for shard_id, url in shard_urls(
+        f"sqlite+aiosqlite:///{db_path}", shard_count
+    ).items():
+        engine = create_async_engine(
+            url,
+            poolclass=AsyncAdaptedQueuePool,
+            pool_size=WRITERS_PER_PROCESS,
+        )
+        register_pragma_profile(engine, PROFILE)
+        engines[shard_id] = engine
+    return engines
+
+
+def create_session_factory(engines: Dict[str, AsyncEngine]) -> sessionmaker:
+    return sessionmaker(
+        class_=AsyncSession,
+        sync_session_class=ShardedSQLModelSession,
+        shards={shard_id: engine.sync_engine for shard_id, engine in engines.items()},
+        expire_on_commit=False,
+    )
+
+
+async def write_customers(db_path: Path, shard_count: int, process: int) -> float:
+    engines = create_engines(db_path, shard_count)
+    session_factory = create_session_factory(engines)
+
+    async def writer(offset: int):
+        for index in range(offset, offset + WRITES_PER_WRITER):
+            async with session_factory() as session:
+                customer = Customer(**customer_data(index))
+                customer.accounts = [Account(**account_data(index))]
+                session.add(customer)
+                await session.commit()
+
+    first_index = process * WRITERS_PER_PROCESS * WRITES_PER_WRITER
+    with timed() as timer:
+        await asyncio.gather(
+            *(
+                writer(first_index + i * WRITES_PER_WRITER)
+                for i in range(WRITERS_PER_PROCESS)
+            )
+        )
+
+    for engine in engines.values():
+        await engine.dispose()
+
+    return timer.elapsed
+
+
+def run_worker(db_path: Path, shard_count: int, process: int) -> float:
+    return asyncio.run(write_customers(db_path, shard_count, process))
+
+
+async def run_shards(db_path: Path, shard_count: int):
+    engines = create_engines(db_path, shard_count)
+    for engine in engines.values():
+        async with engine.begin() as conn:
+            await conn.run_sync(SQLModel.metadata.create_all)
+
+    with ProcessPoolExecutor(PROCESSES) as executor:
+        elapsed = max(
+            executor.map(
+                run_worker,
+                [db_path] * PROCESSES,
+                [shard_count] * PROCESSES,
+                range(PROCESSES),
+            )
+        )
+
+    with timed() as list_timer:
+        async with create_session_factory(engines)() as session:
+            customers = (await session.exec(select(Customer))).all()
+
+    total = PROCESSES * WRITERS_PER_PROCESS * WRITES_PER_WRITER
+    assert len(customers) == total
+
+    for engine in engines.values():
+        await engine.dispose()
+
+    return total / elapsed, list_timer.elapsed * 1000
+
+
+async def main():
+    rows = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for shard_count in (1, 2, 4, 8):
+            writes, list_ms = await run_shards(
+                Path(tmp) / f"bank{shard_count}.db", shard_count
+            )
+            rows.append([shard_count, writes, list_ms])
+
+    print(f"{PROCESSES} processes x {WRITERS_PER_PROCESS} writers")
+    print_table(["shards", "customers created/s", "list all (ms)"], rows)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,126 @@
+"""
+Measure the per-call CPU saved by the prebuilt repository statements.
+
+Each hot lookup is run in its original form, which builds a new select()
+on every call, and in its prebuilt form, which reuses the statement's cache
+key and compiled form. Both run against a seeded in-memory database through
+the same session, so the difference is statement construction and caching.
+"""
+
+import asyncio
+import random
+import time
+
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from benchmarks.common import account_data, customer_data, print_table
+from src.models.banking_models import Account, Customer, SQLModel
+from src.repositories.account_repository import (
+    _ACCOUNT_COLUMNS,
+    _ACCOUNT_EXISTS,
+    _ACCOUNT_ROW_BY_GUID,
+)
+from src.repositories.customer_repository import (
+    _CUSTOMER_COLUMNS,
+    _CUSTOMER_EXISTS,
+    _CUSTOMER_ROW_BY_GUID,
+)
+
+CALLS = 5000
+ROWS = 500
+
+
+def hot_queries():
+    """Pair each hot query's per-call construction with its prebuilt form."""
+    return [
+        (
+            "customer_exists",
+            lambda guid: select(Customer).where(Customer.guid == guid),
+            _CUSTOMER_EXISTS,
+        ),
+        (
+            "customer_row_by_guid",
+            lambda guid: select(*_CUSTOMER_COLUMNS).where(Customer.guid == guid),
+            _CUSTOMER_ROW_BY_GUID,
+        ),
+        (
+            "account_exists",
+            lambda guid: select(Account).where(Account.guid == guid),
+            _ACCOUNT_EXISTS,
+        ),
+        (
+            "account_row_by_guid",
+            lambda guid: select(*_ACCOUNT_COLUMNS).where(Account.guid == guid),
+            _ACCOUNT_ROW_BY_GUID,
+        ),
+    ]
+
+
+async def cpu_per_call(session, guids, execute) -> float:
+    start = time.process_time()
+    for _ in range(CALLS):
+        await execute(random.choice(guids))
+    return (time.process_time() - start) / CALLS * 1_000_000
+
+
+async def main():
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(SQLModel.metadata.create_all)
+
+    guids = {"customer": [], "account": []}
+    async with AsyncSession(engine) as session:
+        for index in range(ROWS):
+            customer = Customer(**customer_data(index))
+            customer.accounts = [Account(**account_data(index))]
+            guids["customer"].append(customer.guid)
+            guids["account"].append(customer.accounts[0].guid)
+            session.add(customer)
+        await session.commit()
+
+    rows = []
+    async with AsyncSession(engine, expire_on_commit=False) as session:
+        for name, build, prebuilt in hot_queries():
+            entity_guids = guids[name.split("_")[0]]
+
+            async def rebuilt(guid):
+                (await session.exec(build(guid))).first()
+                session.expunge_all()
+
+            async def cached(guid):
+                (await session.exec(prebuilt, params={"guid": guid})).first()
+                session.expunge_all()
+
+            # Warm SQLAlchemy's compiled cache for both forms.
+            await rebuilt(entity_guids[0])
+            await cached(entity_guids[0])
+
+            before = await cpu_per_call(session, entity_guids, rebuilt)
+            after = await cpu_per_call(session, entity_guids, cached)
+            build_only = _time_build(build, entity_guids[0]) * 1_000_000
+            rows.append([name, before, after, before - after, build_only])
+
+    await engine.dispose()
+    print_table(
+        [
+            "query",
+            "rebuilt (us/call)",
+            "prebuilt (us/call)",
+            "saved (us/call)",
+            "build + cache key (us)",
+        ],
+        rows,
+    )
+
+
+def _time_build(build, guid) -> float:
+    start = time.process_time()
+    for _ in range(CALLS):
+        build(guid)._generate_cache_key()
+    return (time.process_time() - start) / CALLS
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
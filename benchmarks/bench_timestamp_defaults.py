@@ -0,0 +1,102 @@
+"""
+Measure bulk inserts with timestamps defaulted in SQL rather than in Python.
+
+The same transactions are inserted through one executemany() per batch,
+once into the model's table, whose timestamps default in SQL, and once
+into a copy whose timestamps default to the get_current_time callable, as
+they did before. The callable runs for every row and column, and its value
+is bound and sent as a parameter.
+"""
+
+import random
+import time
+import uuid
+
+from sqlalchemy import ColumnDefault, MetaData, Table, create_engine, insert
+
+from benchmarks.common import print_table
+from src.db.sqlite_pragmas import register_pragma_profile
+from src.enums.currency_code import CurrencyCode
+from src.enums.transaction_status import TransactionStatus
+from src.enums.transaction_type import TransactionType
+from src.models.banking_models import Account, Transaction
+from src.utils.time_functions import get_current_time
+
+ROWS = 200_000
+BATCH_SIZE = 10_000
+ROUNDS = 3
+ACCOUNTS = [str(uuid.uuid4()) for _ in range(1_000)]
+
+
+def python_default_table() -> Table:
+    """Copy the transaction table with the Python timestamp defaults."""
+    metadata = MetaData()
+    # Referenced by the transaction table's foreign keys
+    Account.__table__.to_metadata(metadata)
+    table = Transaction.__table__.to_metadata(metadata)
+
+    for column in table.columns:
+        if column.server_default is not None:
+            column.server_default = None
+            ColumnDefault(get_current_time)._set_parent_with_dispatch(column)
+
+    return table
+
+
+def batches():
+    for _ in range(ROWS // BATCH_SIZE):
+        yield [
+            {
+                "guid": str(uuid.uuid4()),
+                "transaction_type": TransactionType.CREDIT,
+                "creditor_account": random.choice(ACCOUNTS),
+                "debtor_account": random.choice(ACCOUNTS),
+                "amount": random.randint(1, 100_000),
+                "currency": CurrencyCode.GBP,
+                "transaction_status": TransactionStatus.COMPLETED,
+                "is_deleted": False,
+            }
+            for _ in range(BATCH_SIZE)
+        ]
+
+
+def rows_per_second(table: Table) -> float:
+    engine = create_engine("sqlite://")
+    register_pragma_profile(engine, "throughput")
+    table.metadata.create_all(engine, tables=[table])
+    elapsed = 0.0
+
+    with engine.connect() as conn:
+        for rows in batches():
+            start = time.perf_counter()
+            conn.execute(insert(table), rows)
+            conn.commit()
+            elapsed += time.perf_counter() - start
+
+    engine.dispose()
+    return ROWS / elapsed
+
+
+def main():
+    tables = {
+        "python (get_current_time)": python_default_table(),
+        "sql (server_default)": Transaction.__table__,
+    }
+    results = {name: [] for name in tables}
+
+    for _ in range(ROUNDS):
+        for name, table in tables.items():
+            results[name].append(rows_per_second(table))
+
+    print(
+        f"{ROWS:,} transactions in executemany() batches of {BATCH_SIZE:,}, "
+        f"best of {ROUNDS}\n"
+    )
+    print_table(
+        ["timestamp defaults", "rows/s"],
+        [[name, max(rates)] for name, rates in results.items()],
+    )
+
+
+if __name__ == "__main__":
+    main()
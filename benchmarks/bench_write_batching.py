@@ -0,0 +1,82 @@
+"""
+Compare sustained write throughput with and without group commit.
+
+Concurrent writers create customers through CustomerRepository, as
+POST /customers does, against a file database using the durable pragma
+profile (fsync on every commit). With DB_WRITE_BATCHING the writes of
+concurrent callers share one transaction per batch window.
+"""
+
+import asyncio
+import tempfile
+from pathlib import Path
+
+from benchmarks.common import (
+    account_data,
+    create_database_client,
+    customer_data,
+    dispose_database_client,
+    print_table,
+    timed,
+)
+from src.repositories.customer_repository import CustomerRepository
+from src.schemas.account.account_input import AccountInput
+from src.schemas.customer.customer_input import CustomerInput
+
+WRITERS = 16
+WRITES_PER_WRITER = 25
+
+
+def customer_inputs(index: int):
+    customer = customer_data(index)
+    customer.update(
+        last_name="Customer",
+        date_of_birth=customer["date_of_birth"].isoformat(),
+        phone_number="07123 456789",
+    )
+    return CustomerInput(**customer), AccountInput(**account_data(index))
+
+
+async def run(db_path: Path, batching: bool, window_ms: float):
+    db_client = await create_database_client(
+        DATABASE_URL=f"sqlite+aiosqlite:///{db_path}",
+        SQLITE_PRAGMA_PROFILE="durable",
+        DB_POOL_SIZE=WRITERS,
+        DB_WRITE_BATCHING=batching,
+        DB_WRITE_BATCH_WINDOW_MS=window_ms,
+    )
+    customer_repo = CustomerRepository(db_client)
+
+    async def writer(offset: int):
+        for index in range(offset, offset + WRITES_PER_WRITER):
+            await customer_repo.create(*customer_inputs(index))
+
+    with timed() as timer:
+        await asyncio.gather(*(writer(i * WRITES_PER_WRITER) for i in range(WRITERS)))
+
+    transactions = db_client.get_pool_stats()[0].checkouts
+    await dispose_database_client(db_client)
+
+    return WRITERS * WRITES_PER_WRITER / timer.elapsed, transactions
+
+
+async def main():
+    rows = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for label, batching, window_ms in [
+            ("off", False, 0),
+            ("window 1 ms", True, 1),
+            ("window 2 ms", True, 2),
+            ("window 5 ms", True, 5),
+        ]:
+            writes, transactions = await run(
+                Path(tmp) / f"{label.replace(' ', '_')}.db", batching, window_ms
+            )
+            rows.append([label, writes, transactions])
+
+    print(f"{WRITERS} concurrent writers")
+    print_table(["batching", "customers created/s", "transactions"], rows)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,89 @@
+"""
+Measure how many concurrent updates fail on SQLite's write lock.
+
+Each simulated PUT /customers/{guid} request runs in its own UnitOfWork:
+the existence check reads a snapshot, then the update takes the write
+lock. SQLite refuses the upgrade straight away, without waiting for
+busy_timeout, if another request committed since the snapshot was read.
+The run is repeated with retries disabled and with the default policy.
+"""
+
+import asyncio
+import tempfile
+from pathlib import Path
+
+from benchmarks.bench_write_batching import customer_inputs
+from benchmarks.common import (
+    create_database_client,
+    dispose_database_client,
+    print_table,
+    timed,
+)
+from src.db.unit_of_work import UnitOfWork
+from src.errors.exceptions import DatabaseContentionError
+from src.repositories.customer_repository import CustomerRepository
+from src.schemas.customer.customer_update import CustomerUpdate
+
+WRITERS = 64
+REQUESTS_PER_WRITER = 20
+CUSTOMERS = 8
+
+
+async def run(db_path: Path, attempts: int):
+    db_client = await create_database_client(
+        DATABASE_URL=f"sqlite+aiosqlite:///{db_path}",
+        SQLITE_PRAGMA_PROFILE="durable",
+        DB_POOL_SIZE=WRITERS,
+        DB_WRITE_RETRY_ATTEMPTS=attempts,
+    )
+    seed_repo = CustomerRepository(db_client)
+    guids = [
+        (await seed_repo.create(*customer_inputs(index)))[0].guid
+        for index in range(CUSTOMERS)
+    ]
+    failures = 0
+
+    async def update(guid: str, request: int):
+        async with UnitOfWork(db_client) as unit_of_work:
+            customer_repo = CustomerRepository(unit_of_work)
+            await customer_repo.customer_exists_by_guid(guid)
+            await customer_repo.update(guid, CustomerUpdate(address=f"{request} Road"))
+
+    async def writer(offset: int):
+        nonlocal failures
+        for request in range(REQUESTS_PER_WRITER):
+            try:
+                await update(guids[(offset + request) % CUSTOMERS], request)
+            except DatabaseContentionError:
+                failures += 1
+
+    with timed() as timer:
+        await asyncio.gather(*(writer(i) for i in range(WRITERS)))
+
+    stats = db_client.get_contention_stats()
+    await dispose_database_client(db_client)
+
+    requests = WRITERS * REQUESTS_PER_WRITER
+    return [
+        (requests - failures) / timer.elapsed,
+        failures,
+        stats.retries,
+        stats.max_wait_ms,
+    ]
+
+
+async def main():
+    rows = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for label, attempts in [("off", 1), ("default (5)", 5)]:
+            results = await run(Path(tmp) / f"{attempts}.db", attempts)
+            rows.append([label, *results])
+
+    print(f"{WRITERS} concurrent writers, {WRITERS * REQUESTS_PER_WRITER} updates")
+    print_table(
+        ["retries", "updates/s", "failed (503)", "retried", "max backoff ms"], rows
+    )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,128 @@
+"""
+Shared helpers for the benchmark scripts.
+
+Benchmarks are run manually from the repository root, e.g.
+``poetry run python -m benchmarks.bench_pragma_profiles``.
+"""
+
+import time
+import uuid
+from contextlib import contextmanager
+from datetime import date
+from typing import Any, Dict, Iterator, List, Optional, Sequence
+from unittest.mock import patch
+
+from sqlmodel import select
+
+from src.core.settings import AppSettings
+from src.db.database import DatabaseClient
+from src.enums.account_status import AccountStatus
+from src.models.banking_models import Customer
+from src.schemas.account.account_output import AccountOutput
+from src.schemas.customer.customer_base import CustomerBase
+from src.schemas.customer.customer_output import CustomerOutput
+
+
+def customer_data(index: int) -> Dict[str, object]:
+    """Build a valid customer row for seeding."""
+    return {
+        "guid": str(uuid.uuid4()),
+        "first_name": "Bench",
+        "middle_names": None,
+        # Digits would fail NAME_PATTERN, so the index is spelled in letters
+        "last_name": "Customer-" + "".join(chr(ord("a") + int(d)) for d in str(index)),
+        "date_of_birth": date(1990, 1, 1),
+        "phone_number": "07123456789",
+        "email_address": f"bench.{index}@example.com",
+        "address": f"{index} Benchmark Road, London",
+    }
+
+
+def account_data(index: int) -> Dict[str, object]:
+    """Build a valid account row for seeding."""
+    return {
+        "guid": str(uuid.uuid4()),
+        "account_name": f"Benchmark Account {index}",
+        "status": AccountStatus.ACTIVE,
+    }
+
+
+async def create_database_client(**settings: Any) -> DatabaseClient:
+    """Initialise a DatabaseClient with the given settings overridden."""
+    app_settings = AppSettings()
+    for name, value in settings.items():
+        setattr(app_settings, name, value)
+
+    with patch("src.db.database.get_app_settings", return_value=app_settings):
+        db_client = DatabaseClient()
+        await db_client.initialise()
+
+    return db_client
+
+
+async def dispose_database_client(db_client: DatabaseClient) -> None:
+    """Close every engine of a DatabaseClient."""
+    await db_client.close()
+
+
+async def load_customer_entities(
+    db_client: DatabaseClient, guid: Optional[str] = None
+) -> List[CustomerOutput]:
+    """
+    Load customers as ORM entities and copy them into DTOs.
+
+    This is how the repositories used to read customers, before listings and
+    details were read as rows; benchmarks keep it as their baseline.
+    """
+    statement = select(Customer)
+    if guid is not None:
+        statement = statement.where(Customer.guid == guid)
+
+    async with db_client.get_read_session() as session:
+        customers = (await session.exec(statement)).all()
+
+        return [
+            CustomerOutput(
+                **customer.model_dump(include=set(CustomerBase.model_fields)),
+                accounts=[
+                    AccountOutput(
+                        guid=account.guid,
+                        account_name=account.account_name,
+                        status=account.status,
+                    )
+                    for account in customer.accounts
+                ],
+            )
+            for customer in customers
+        ]
+
+
+class Timer:
+    """Wall-clock timer populated by the ``timed`` context manager."""
+
+    elapsed: float = 0.0
+
+
+@contextmanager
+def timed() -> Iterator[Timer]:
+    """Measure the wall-clock time of the enclosed block."""
+    timer = Timer()
+    start = time.perf_counter()
+    try:
+        yield timer
+    finally:
+        timer.elapsed = time.perf_counter() - start
+
+
+def print_table(headers: Sequence[str], rows: List[Sequence[object]]) -> None:
+    """Print benchmark results as an aligned plain-text table."""
+    cells = [list(map(str, headers))] + [
+        [f"{value:,.1f}" if isinstance(value, float) else str(value) for value in row]
+        for row in rows
+    ]
+    widths = [max(len(row[i]) for row in cells) for i in range(len(headers))]
+
+    for index, row in enumerate(cells):
+        print("  ".join(cell.rjust(width) for cell, width in zip(row, widths)))
+        if index == 0:
+            print("  ".join("-" * width for width in widths))
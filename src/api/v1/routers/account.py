@@ -1,11 +1,12 @@
-from typing import Annotated
+from typing import Annotated, Optional
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query
 
+from src.enums.relationship_loading import RelationshipLoading
 from src.schemas.account.account_update import AccountUpdate
 from src.schemas.base_response import GenericResponseModel
 from src.services.account_service import AccountService, get_account_service
-from src.utils.constants import OK
+from src.utils.constants import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, OK
 
 router = APIRouter(prefix="/accounts", tags=["accounts"])
 
@@ -13,24 +14,36 @@ router = APIRouter(prefix="/accounts", tags=["accounts"])
 @router.get(
     path="",
     summary="Retrieves a list of accounts.",
-    description="This endpoint handles GET requests to retrieve a list of accounts.",
+    description="This endpoint handles GET requests to retrieve a page of accounts.",
     operation_id="get-accounts-list",
     response_model=GenericResponseModel,
     status_code=OK,
 )
 async def get_accounts(
-    account_service: Annotated[AccountService, Depends(get_account_service)]
+    account_service: Annotated[AccountService, Depends(get_account_service)],
+    cursor: Annotated[
+        Optional[str], Query(description="The next_cursor of the previous page.")
+    ] = None,
+    limit: Annotated[
+        int, Query(ge=1, le=MAX_PAGE_SIZE, description="The maximum page size.")
+    ] = DEFAULT_PAGE_SIZE,
+    include: Annotated[
+        RelationshipLoading, Query(description="How related customers are loaded.")
+    ] = RelationshipLoading.SELECTIN,
 ) -> GenericResponseModel:
     """
-    This endpoint handles GET requests to retrieve all existing accounts.
+    This endpoint handles GET requests to retrieve a page of existing accounts.
 
     Args:
         account_service (AccountService): Service instance for retrieving accounts.
+        cursor (Optional[str]): The cursor of the page to retrieve.
+        limit (int): The maximum number of accounts in the page.
+        include (RelationshipLoading): How the accounts' customers are loaded.
 
     Returns:
         GenericResponseModel: The respoonse containing the retrieved accounts.
     """
-    return await account_service.get_all()
+    return await account_service.get_all(cursor, limit, include)
 
 
 @router.get(
@@ -44,6 +57,9 @@ async def get_accounts(
 async def get_single_account(
     guid: str,
     account_service: Annotated[AccountService, Depends(get_account_service)],
+    include: Annotated[
+        RelationshipLoading, Query(description="How related customers are loaded.")
+    ] = RelationshipLoading.SELECTIN,
 ) -> GenericResponseModel:
     """
     This endpoint handles GET requests to retrieve an existing account.
@@ -51,11 +67,12 @@ async def get_single_account(
     Args:
         guid (str): The unique identifier for the account.
         account_service (AccountService): Service instance for retrieving accounts.
+        include (RelationshipLoading): How the account's customers are loaded.
 
     Returns:
         GenericResponseModel: The response containing the retrieved account record.
     """
-    return await account_service.get_account(guid)
+    return await account_service.get_account(guid, include)
 
 
 @router.put(
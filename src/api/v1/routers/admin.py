@@ -0,0 +1,151 @@
+from typing import Annotated
+
+from fastapi import APIRouter, Depends
+
+from src.schemas.base_response import GenericResponseModel
+from src.services.admin_service import AdminService, get_admin_service
+from src.utils.constants import ACCEPTED, OK
+
+router = APIRouter(prefix="/admin", tags=["admin"])
+
+
+@router.get(
+    path="/database/pool",
+    summary="Retrieves connection pool statistics.",
+    description="This endpoint returns the database connection pool statistics.",
+    operation_id="get-database-pool-stats",
+    response_model=GenericResponseModel,
+    status_code=OK,
+)
+async def get_pool_stats(
+    admin_service: Annotated[AdminService, Depends(get_admin_service)]
+) -> GenericResponseModel:
+    """
+    This endpoint handles GET requests to retrieve connection pool statistics.
+
+    Args:
+        admin_service (AdminService): Service instance for operational data.
+
+    Returns:
+        GenericResponseModel: The response containing the pool statistics.
+    """
+    return await admin_service.get_pool_stats()
+
+
+@router.get(
+    path="/database/statements",
+    summary="Retrieves statement cache statistics.",
+    description="This endpoint returns compiled cache hits for hot repository queries.",
+    operation_id="get-database-statement-stats",
+    response_model=GenericResponseModel,
+    status_code=OK,
+)
+async def get_statement_stats(
+    admin_service: Annotated[AdminService, Depends(get_admin_service)]
+) -> GenericResponseModel:
+    """
+    This endpoint handles GET requests to retrieve statement cache statistics.
+
+    Args:
+        admin_service (AdminService): Service instance for operational data.
+
+    Returns:
+        GenericResponseModel: The response containing the statement statistics.
+    """
+    return await admin_service.get_statement_stats()
+
+
+@router.get(
+    path="/database/contention",
+    summary="Retrieves write contention statistics.",
+    description="This endpoint returns write lock retries and give-ups.",
+    operation_id="get-database-contention-stats",
+    response_model=GenericResponseModel,
+    status_code=OK,
+)
+async def get_contention_stats(
+    admin_service: Annotated[AdminService, Depends(get_admin_service)]
+) -> GenericResponseModel:
+    """
+    This endpoint handles GET requests to retrieve write contention statistics.
+
+    Args:
+        admin_service (AdminService): Service instance for operational data.
+
+    Returns:
+        GenericResponseModel: The response containing the contention statistics.
+    """
+    return await admin_service.get_contention_stats()
+
+
+@router.post(
+    path="/database/backup",
+    summary="Starts an online database backup.",
+    description=(
+        "This endpoint starts a backup which copies the database in small steps."
+    ),
+    operation_id="start-database-backup",
+    response_model=GenericResponseModel,
+    status_code=ACCEPTED,
+)
+async def start_backup(
+    admin_service: Annotated[AdminService, Depends(get_admin_service)]
+) -> GenericResponseModel:
+    """
+    This endpoint handles POST requests to start an online database backup.
+
+    Args:
+        admin_service (AdminService): Service instance for operational data.
+
+    Returns:
+        GenericResponseModel: The response containing the pending backups.
+    """
+    return await admin_service.start_backup()
+
+
+@router.get(
+    path="/database/backup",
+    summary="Retrieves the progress of the latest backup.",
+    description=(
+        "This endpoint returns the pages copied and throughput of the latest backup."
+    ),
+    operation_id="get-database-backup-status",
+    response_model=GenericResponseModel,
+    status_code=OK,
+)
+async def get_backup_status(
+    admin_service: Annotated[AdminService, Depends(get_admin_service)]
+) -> GenericResponseModel:
+    """
+    This endpoint handles GET requests to retrieve the progress of the latest backup.
+
+    Args:
+        admin_service (AdminService): Service instance for operational data.
+
+    Returns:
+        GenericResponseModel: The response containing the backup progress.
+    """
+    return await admin_service.get_backup_status()
+
+
+@router.get(
+    path="/database/maintenance",
+    summary="Retrieves database maintenance status.",
+    description="This endpoint returns when ANALYZE and incremental vacuum last ran.",
+    operation_id="get-database-maintenance-status",
+    response_model=GenericResponseModel,
+    status_code=OK,
+)
+async def get_maintenance_status(
+    admin_service: Annotated[AdminService, Depends(get_admin_service)]
+) -> GenericResponseModel:
+    """
+    This endpoint handles GET requests to retrieve database maintenance status.
+
+    Args:
+        admin_service (AdminService): Service instance for operational data.
+
+    Returns:
+        GenericResponseModel: The response containing the maintenance status.
+    """
+    return await admin_service.get_maintenance_status()
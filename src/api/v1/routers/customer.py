@@ -1,12 +1,13 @@
-from typing import Annotated
+from typing import Annotated, Optional
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query
 
+from src.enums.relationship_loading import RelationshipLoading
 from src.schemas.base_response import GenericResponseModel
 from src.schemas.create_customer_request import CreateCustomerRequest
 from src.schemas.customer.customer_update import CustomerUpdate
 from src.services.customer_service import CustomerService, get_customer_service
-from src.utils.constants import CREATED, OK
+from src.utils.constants import CREATED, DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, OK
 
 router = APIRouter(prefix="/customers", tags=["customers"])
 
@@ -66,24 +67,36 @@ async def update_customer(
 @router.get(
     path="",
     summary="Retrieves a list of customers.",
-    description="This endpoint handles GET requests to retrieve a list of customers.",
+    description="This endpoint handles GET requests to retrieve a page of customers.",
     operation_id="get-customers-list",
     response_model=GenericResponseModel,
     status_code=OK,
 )
 async def get_customers(
-    customer_service: Annotated[CustomerService, Depends(get_customer_service)]
+    customer_service: Annotated[CustomerService, Depends(get_customer_service)],
+    cursor: Annotated[
+        Optional[str], Query(description="The next_cursor of the previous page.")
+    ] = None,
+    limit: Annotated[
+        int, Query(ge=1, le=MAX_PAGE_SIZE, description="The maximum page size.")
+    ] = DEFAULT_PAGE_SIZE,
+    include: Annotated[
+        RelationshipLoading, Query(description="How related accounts are loaded.")
+    ] = RelationshipLoading.SELECTIN,
 ) -> GenericResponseModel:
     """
-    This endpoint handles GET requests to retrieve all existing customers.
+    This endpoint handles GET requests to retrieve a page of existing customers.
 
     Args:
         customer_service (CustomerService): Service instance for retrieving customers.
+        cursor (Optional[str]): The cursor of the page to retrieve.
+        limit (int): The maximum number of customers in the page.
+        include (RelationshipLoading): How the customers' accounts are loaded.
 
     Returns:
         GenericResponseModel: The respoonse containing the retrieved customers.
     """
-    return await customer_service.get_all()
+    return await customer_service.get_all(cursor, limit, include)
 
 
 @router.get(
@@ -97,6 +110,9 @@ async def get_customers(
 async def get_single_customer(
     guid: str,
     customer_service: Annotated[CustomerService, Depends(get_customer_service)],
+    include: Annotated[
+        RelationshipLoading, Query(description="How related accounts are loaded.")
+    ] = RelationshipLoading.SELECTIN,
 ) -> GenericResponseModel:
     """
     This endpoint handles GET requests to retrieve an existing customer.
@@ -104,11 +120,12 @@ async def get_single_customer(
     Args:
         guid (str): The unique identifier for the customer.
         customer_service (CustomerService): Service instance for retrieving customers.
+        include (RelationshipLoading): How the customer's accounts are loaded.
 
     Returns:
         GenericResponseModel: The response containing the retrieved customer record.
     """
-    return await customer_service.get_customer(guid)
+    return await customer_service.get_customer(guid, include)
 
 
 @router.delete(
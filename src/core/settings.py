@@ -20,17 +20,120 @@ class AppSettings:
         self.ENV_TYPE = os.getenv("ENV_TYPE", "production")
         self.DEBUG = os.getenv("DEBUG")
         self.DATABASE_URL = os.getenv("DATABASE_URL")
+        self.DATABASE_READ_URL = os.getenv("DATABASE_READ_URL")
         self.API_VERSION = os.getenv("API_VERSION")
         self.API_V1_STR = f"/api/{self.API_VERSION}"
+        self.DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "5"))
+        self.DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+        self.DB_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", "30"))
+        self.DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "-1"))
+        self.DB_POOL_PRE_PING = _get_bool_env("DB_POOL_PRE_PING", "False")
+        self.DB_ECHO = _get_bool_env("DB_ECHO", "False")
+        self.DB_SLOW_QUERY_MS = float(os.getenv("DB_SLOW_QUERY_MS", "200"))
+        self.DB_QUERY_LOG_SAMPLE_RATE = float(
+            os.getenv("DB_QUERY_LOG_SAMPLE_RATE", "0")
+        )
+        self.DB_QUERY_PLAN_GUARD = os.getenv("DB_QUERY_PLAN_GUARD", "off").lower()
+        self.DB_QUERY_PLAN_MIN_ROWS = int(os.getenv("DB_QUERY_PLAN_MIN_ROWS", "1000"))
+        self.DB_AUTO_MIGRATE = _get_bool_env("DB_AUTO_MIGRATE", "True")
+        self.SQLITE_PRAGMA_PROFILE = os.getenv("SQLITE_PRAGMA_PROFILE", "durable")
+        self.DB_SHARD_COUNT = int(os.getenv("DB_SHARD_COUNT", "1"))
+        self.DB_WRITE_BATCHING = _get_bool_env("DB_WRITE_BATCHING", "False")
+        self.DB_WRITE_BATCH_SIZE = int(os.getenv("DB_WRITE_BATCH_SIZE", "32"))
+        self.DB_WRITE_BATCH_WINDOW_MS = float(
+            os.getenv("DB_WRITE_BATCH_WINDOW_MS", "2")
+        )
+        self.DB_BACKEND = os.getenv("DB_BACKEND", "aiosqlite")
+        self.DB_THREADPOOL_SIZE = int(os.getenv("DB_THREADPOOL_SIZE", "8"))
+        self.DB_IN_MEMORY = _get_bool_env("DB_IN_MEMORY", "False")
+        self.DB_SNAPSHOT_INTERVAL_S = float(os.getenv("DB_SNAPSHOT_INTERVAL_S", "30"))
+        self.DB_BACKUP_DIR = os.getenv("DB_BACKUP_DIR", "backups")
+        self.DB_BACKUP_PAGES_PER_STEP = int(os.getenv("DB_BACKUP_PAGES_PER_STEP", "64"))
+        self.DB_BACKUP_STEP_PAUSE_MS = float(os.getenv("DB_BACKUP_STEP_PAUSE_MS", "10"))
+        self.DB_MAINTENANCE_INTERVAL_S = float(
+            os.getenv("DB_MAINTENANCE_INTERVAL_S", "3600")
+        )
+        self.DB_MAINTENANCE_IDLE_S = float(os.getenv("DB_MAINTENANCE_IDLE_S", "5"))
+        self.DB_VACUUM_PAGES_PER_SLICE = int(
+            os.getenv("DB_VACUUM_PAGES_PER_SLICE", "256")
+        )
+        self.DB_VACUUM_MAX_SLICES = int(os.getenv("DB_VACUUM_MAX_SLICES", "64"))
+        self.DB_WRITE_RETRY_ATTEMPTS = int(os.getenv("DB_WRITE_RETRY_ATTEMPTS", "5"))
+        self.DB_WRITE_RETRY_BACKOFF_MS = float(
+            os.getenv("DB_WRITE_RETRY_BACKOFF_MS", "10")
+        )
+        self.DB_WRITE_RETRY_MAX_BACKOFF_MS = float(
+            os.getenv("DB_WRITE_RETRY_MAX_BACKOFF_MS", "200")
+        )
+        self.DB_WRITE_RETRY_BUDGET_MS = float(
+            os.getenv("DB_WRITE_RETRY_BUDGET_MS", "15000")
+        )
 
     DEBUG: bool = os.getenv("DEBUG", "True").lower()
     TITLE: str = "BankingApp"
     ENV_TYPE: str = "dev"
 
     DATABASE_URL: str = None
+    # Optional - defaults to a read-only connection to a SQLite DATABASE_URL
+    DATABASE_READ_URL: Optional[str] = None
     API_VERSION: str = None
     API_V1_STR: str = None
 
+    # Connection pool - ignored for in-memory SQLite, which uses a static pool
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: float = 30
+    DB_POOL_RECYCLE: int = -1
+    DB_POOL_PRE_PING: bool = False
+
+    # Query logging - DB_ECHO logs every statement and is meant for debugging only
+    DB_ECHO: bool = False
+    DB_SLOW_QUERY_MS: float = 200
+    DB_QUERY_LOG_SAMPLE_RATE: float = 0.0
+
+    # EXPLAIN every repository query and report full scans ("off", "warn", "raise")
+    DB_QUERY_PLAN_GUARD: str = "off"
+    DB_QUERY_PLAN_MIN_ROWS: int = 1000
+
+    # Apply pending migrations at start-up, otherwise refuse to start
+    DB_AUTO_MIGRATE: bool = True
+
+    # SQLite only - see src/db/sqlite_pragmas.py for the available profiles
+    SQLITE_PRAGMA_PROFILE: str = "durable"
+
+    # Spread customers over this many databases derived from DATABASE_URL
+    DB_SHARD_COUNT: int = 1
+
+    # Group commit - concurrent writes share one transaction per batch
+    DB_WRITE_BATCHING: bool = False
+    DB_WRITE_BATCH_SIZE: int = 32
+    DB_WRITE_BATCH_WINDOW_MS: float = 2.0
+
+    # Session backend - "aiosqlite" or "threadpool" (sync engine on a thread pool)
+    DB_BACKEND: str = "aiosqlite"
+    DB_THREADPOOL_SIZE: int = 8
+
+    # Serve from memory, snapshotting to the DATABASE_URL file (0: on shutdown only)
+    DB_IN_MEMORY: bool = False
+    DB_SNAPSHOT_INTERVAL_S: float = 30.0
+
+    # Online backups - pages copied per step, and the pause between steps
+    DB_BACKUP_DIR: str = "backups"
+    DB_BACKUP_PAGES_PER_STEP: int = 64
+    DB_BACKUP_STEP_PAUSE_MS: float = 10.0
+
+    # Background ANALYZE and incremental vacuum, run at quiet moments
+    DB_MAINTENANCE_INTERVAL_S: float = 3600.0
+    DB_MAINTENANCE_IDLE_S: float = 5.0
+    DB_VACUUM_PAGES_PER_SLICE: int = 256
+    DB_VACUUM_MAX_SLICES: int = 64
+
+    # Writes which find the database locked are retried with jittered backoff
+    DB_WRITE_RETRY_ATTEMPTS: int = 5
+    DB_WRITE_RETRY_BACKOFF_MS: float = 10.0
+    DB_WRITE_RETRY_MAX_BACKOFF_MS: float = 200.0
+    DB_WRITE_RETRY_BUDGET_MS: float = 15000.0
+
 
 def _load_configs() -> None:
     current_dir = Path(__file__).resolve().parent
@@ -39,6 +142,10 @@ def _load_configs() -> None:
     logger.info("Environment variables loaded.")
 
 
+def _get_bool_env(name: str, default: str) -> bool:
+    return os.getenv(name, default).lower() == "true"
+
+
 def get_app_settings() -> AppSettings:
     """
     Retrieves the singleton AppSettings instance.
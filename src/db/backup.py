@@ -0,0 +1,261 @@
+"""
+Online backups of the live SQLite databases.
+
+Backups use the SQLite online backup API, copying a few pages per step
+from a dedicated read-only connection and pausing between steps. A step
+only holds a read lock on the source, so writers going through the
+DatabaseClient wait at most one step for it, and not at all in WAL mode.
+The copy runs on a worker thread, leaving the event loop free.
+
+A write by another connection makes SQLite restart the copy. If writes keep
+restarting it, the remaining copy is done in a single step, which in WAL
+mode still does not block writers.
+
+Run a backup of the configured database outside the application with:
+
+    poetry run python -m src.db.backup
+"""
+
+import asyncio
+import sqlite3
+import time
+from contextlib import closing
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, List, Optional
+from urllib.parse import quote
+
+from sqlalchemy import make_url
+
+from src.core.settings import AppSettings, get_app_settings
+from src.db.sharding import shard_urls
+from src.errors.exceptions import DBConfigError
+from src.logger import logger
+from src.schemas.database.backup_status_output import BackupStatusOutput
+
+# Seconds between progress log lines of a running backup
+_PROGRESS_LOG_INTERVAL = 1.0
+
+
+class _TooManyRestarts(Exception):
+    """Aborts a stepped copy which concurrent writes keep restarting."""
+
+
+class BackupJob:
+    """
+    Copies one SQLite database to a backup file, in small steps.
+
+    The job's progress (pages copied, restarts and throughput) can be read
+    from another task while it runs.
+    """
+
+    def __init__(
+        self,
+        source: str,
+        target: Path,
+        pages_per_step: int,
+        step_pause_ms: float,
+        max_restarts: int = 3,
+    ) -> None:
+        """
+        Initialise a pending backup.
+
+        Args:
+            source (str): SQLite URI of the database to back up.
+            target (Path): File to create with the copy.
+            pages_per_step (int): Pages copied while holding the source's lock.
+            step_pause_ms (float): Pause between steps, for writers to proceed.
+            max_restarts (int): Restarts tolerated before copying the rest
+                in one step.
+        """
+        self.source = source
+        self.target = target
+        self.pages_per_step = pages_per_step
+        self.step_pause = step_pause_ms / 1000
+        self.max_restarts = max_restarts
+        self.state = "pending"
+        self.pages_copied = 0
+        self.total_pages = 0
+        self.restarts = 0
+        self.error: Optional[str] = None
+        self._started: Optional[float] = None
+        self._finished: Optional[float] = None
+        self._last_logged = 0.0
+
+    async def run(self) -> None:
+        """Copy the database, recording the outcome instead of raising."""
+        self.state = "running"
+        self._started = time.perf_counter()
+        logger.info(f"Backing up {self.source} to {self.target}.")
+
+        try:
+            await asyncio.to_thread(self._copy)
+        except Exception as e:
+            self.state = "failed"
+            self.error = str(e)
+            logger.exception(f"Backup to {self.target} failed: {str(e)}")
+        else:
+            self.state = "completed"
+            logger.info(
+                f"Backup to {self.target} completed: {self.pages_copied} pages "
+                f"at {self._pages_per_second():.0f} pages/s, "
+                f"{self.restarts} restarts."
+            )
+        finally:
+            self._finished = time.perf_counter()
+
+    def snapshot(self) -> BackupStatusOutput:
+        """
+        Report the progress of the backup.
+
+        Returns:
+            BackupStatusOutput: Point-in-time backup progress.
+        """
+        return BackupStatusOutput(
+            target=str(self.target),
+            state=self.state,
+            pages_copied=self.pages_copied,
+            total_pages=self.total_pages,
+            restarts=self.restarts,
+            elapsed_ms=self._elapsed() * 1000,
+            pages_per_second=self._pages_per_second(),
+            error=self.error,
+        )
+
+    def _copy(self) -> None:
+        self.target.parent.mkdir(parents=True, exist_ok=True)
+
+        with closing(sqlite3.connect(self.source, uri=True)) as source, closing(
+            sqlite3.connect(self.target)
+        ) as target:
+            try:
+                source.backup(
+                    target,
+                    pages=self.pages_per_step,
+                    progress=self._record_progress,
+                    sleep=self.step_pause,
+                )
+            except _TooManyRestarts:
+                logger.warning(
+                    f"Backup to {self.target} restarted {self.restarts} times by "
+                    "concurrent writes; copying the remaining pages in one step."
+                )
+                source.backup(target, pages=-1, progress=self._record_progress)
+
+    def _record_progress(self, status: int, remaining: int, total: int) -> None:
+        pages_copied = total - remaining
+
+        # Each step copies more pages, unless the copy restarted from the start
+        if 0 < pages_copied <= self.pages_copied:
+            self.restarts += 1
+
+            if self.restarts > self.max_restarts:
+                raise _TooManyRestarts()
+
+        self.pages_copied = pages_copied
+        self.total_pages = total
+
+        now = time.perf_counter()
+
+        if now - self._last_logged >= _PROGRESS_LOG_INTERVAL:
+            self._last_logged = now
+            logger.info(
+                f"Backup to {self.target}: {pages_copied}/{total} pages, "
+                f"{self._pages_per_second():.0f} pages/s."
+            )
+
+    def _elapsed(self) -> float:
+        if self._started is None:
+            return 0.0
+
+        return (self._finished or time.perf_counter()) - self._started
+
+    def _pages_per_second(self) -> float:
+        elapsed = self._elapsed()
+        return self.pages_copied / elapsed if elapsed else 0.0
+
+
+def database_files(app_settings: AppSettings) -> Dict[str, str]:
+    """
+    Find the database files of the configured DATABASE_URL, one per shard.
+
+    Args:
+        app_settings (AppSettings): The application settings.
+
+    Returns:
+        Dict[str, str]: File name stems mapped to read-only SQLite URIs.
+    """
+    if app_settings.DB_SHARD_COUNT > 1:
+        urls = shard_urls(app_settings.DATABASE_URL, app_settings.DB_SHARD_COUNT)
+    else:
+        urls = {"0": app_settings.DATABASE_URL}
+
+    files = {}
+
+    for url in urls.values():
+        url = make_url(url)
+        database = url.database or ""
+
+        if url.query.get("uri") == "true":
+            database = database.removeprefix("file:")
+
+        if (
+            url.get_backend_name() != "sqlite"
+            or database in ("", ":memory:")
+            or url.query.get("mode") == "memory"
+        ):
+            raise DBConfigError("Backups require a SQLite file DATABASE_URL.")
+
+        files[Path(database).stem] = f"file:{quote(database)}?mode=ro"
+
+    return files
+
+
+def create_backup_jobs(
+    sources: Dict[str, str], app_settings: AppSettings
+) -> List[BackupJob]:
+    """
+    Create a backup job per database, writing to timestamped files.
+
+    Args:
+        sources (Dict[str, str]): Database names mapped to SQLite URIs.
+        app_settings (AppSettings): The application settings.
+
+    Returns:
+        List[BackupJob]: Pending jobs, to be run in order.
+    """
+    timestamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+    backup_dir = Path(app_settings.DB_BACKUP_DIR)
+
+    return [
+        BackupJob(
+            source,
+            backup_dir / f"{name}-{timestamp}.db",
+            pages_per_step=app_settings.DB_BACKUP_PAGES_PER_STEP,
+            step_pause_ms=app_settings.DB_BACKUP_STEP_PAUSE_MS,
+        )
+        for name, source in sources.items()
+    ]
+
+
+async def run_backup() -> List[BackupStatusOutput]:
+    """
+    Back up the configured database, or every shard, one after another.
+
+    Returns:
+        List[BackupStatusOutput]: The outcome of each backup.
+    """
+    app_settings = get_app_settings()
+    backup_jobs = create_backup_jobs(database_files(app_settings), app_settings)
+
+    for backup_job in backup_jobs:
+        await backup_job.run()
+
+    return [backup_job.snapshot() for backup_job in backup_jobs]
+
+
+if __name__ == "__main__":
+    results = asyncio.run(run_backup())
+
+    if any(result.state == "failed" for result in results):
+        raise SystemExit(1)
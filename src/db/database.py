@@ -1,16 +1,49 @@
+import asyncio
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import AbstractAsyncContextManager, asynccontextmanager
-from typing import ClassVar, Optional
+from typing import Any, Callable, ClassVar, Dict, List, Optional, Type, TypeVar
+from urllib.parse import quote
 
+from sqlalchemy import create_engine, make_url
+from sqlalchemy.engine import URL, Engine
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
 from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool, Pool, QueuePool
+from sqlmodel import Session
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 from src.core.settings import AppSettings, get_app_settings
+from src.db.backup import BackupJob, create_backup_jobs, database_files
+from src.db.maintenance import DatabaseMaintenance
+from src.db.memory_snapshot import InMemoryDatabase
+from src.db.migrations import SchemaMigrator
+from src.db.pool_metrics import PoolMetrics
+from src.db.query_logging import SlowQueryLogger, track_query_origin
+from src.db.query_plan import QueryPlanGuard
+from src.db.sharding import ShardedSQLModelSession, shard_urls
+from src.db.sqlite_pragmas import register_pragma_profile
+from src.db.statement_cache import statement_cache
+from src.db.threadpool_session import ThreadPoolSession
+from src.db.write_batcher import WriteBatcher, WriteOperation
+from src.db.write_retry import WriteRetry
+from src.errors.exceptions import BackupInProgressError, DBConfigError
 from src.logger import logger
-from src.models.banking_models import Account, Customer, CustomerAccountLink, SQLModel
+from src.schemas.database.backup_status_output import BackupStatusOutput
+from src.schemas.database.contention_stats_output import ContentionStatsOutput
+from src.schemas.database.maintenance_status_output import MaintenanceStatusOutput
+from src.schemas.database.pool_stats_output import PoolStatsOutput
+from src.schemas.database.statement_stats_output import StatementStatsOutput
 
 _DATABASE_CLIENT: Optional["DatabaseClient"] = None
 
+# Session backends selectable with DB_BACKEND
+DB_BACKENDS = ("aiosqlite", "threadpool")
+
+T = TypeVar("T")
+
 
 class DatabaseClient:
     """
@@ -26,51 +59,677 @@ class DatabaseClient:
 
     _engine: ClassVar[Optional[AsyncEngine]] = None
     _session_factory: Optional[sessionmaker[AsyncSession]] = None
+    _read_engine: Optional[AsyncEngine] = None
+    _read_session_factory: Optional[sessionmaker[AsyncSession]] = None
 
     def __init__(self) -> None:
         """Initialise database client with no configuration."""
         self._initialised = False
         self._app_settings: Optional[AppSettings] = None
+        self._pool_metrics = PoolMetrics("primary")
+        self._read_pool_metrics = PoolMetrics("read")
+        self._shard_engines: Dict[str, AsyncEngine] = {}
+        self._write_batcher: Optional[WriteBatcher] = None
+        self._in_memory_database: Optional[InMemoryDatabase] = None
+        self.write_retry: Optional[WriteRetry] = None
+        self._sync_engine: Optional[Engine] = None
+        self._sync_read_engine: Optional[Engine] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._backup_jobs: List[BackupJob] = []
+        self._backup_task: Optional[asyncio.Task] = None
+        self._maintenance: Optional[DatabaseMaintenance] = None
 
     async def initialise(self):
         """Initialise the database client, setting its engine and session factory."""
         if not self._initialised:
             self._app_settings = get_app_settings()
             self._create_pool()
+            self._create_write_retry()
+            self._create_write_batcher()
             await self._create_tables()
+
+            if self._in_memory_database is not None:
+                self._in_memory_database.start(self._engine)
+
             self._initialised = True
 
+    async def close(self):
+        """Save the in-memory database, if used, and close every connection pool."""
+        if self._maintenance is not None:
+            await self._maintenance.close()
+            self._maintenance = None
+
+        if self._backup_task is not None:
+            # The copy runs on a thread and cannot be interrupted
+            await self._backup_task
+
+        if self._in_memory_database is not None:
+            await self._in_memory_database.close(self._engine)
+            self._in_memory_database = None
+
+        engines = {self._engine, self._read_engine, *self._shard_engines.values()}
+
+        for engine in engines - {None}:
+            await engine.dispose()
+
+        for sync_engine in {self._sync_engine, self._sync_read_engine} - {None}:
+            sync_engine.dispose()
+
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+        self._initialised = False
+
     def _create_pool(self):
-        """Create session factory and connection pool for db connections."""
-        self._engine = create_async_engine(
-            url=self._app_settings.DATABASE_URL, echo=True
+        """
+        Create session factories and connection pools for db connections.
+
+        Reads are routed to a separate read-only engine when one is available,
+        otherwise they share the primary engine.
+        """
+        self._query_logger = SlowQueryLogger(
+            slow_query_ms=self._app_settings.DB_SLOW_QUERY_MS,
+            sample_rate=self._app_settings.DB_QUERY_LOG_SAMPLE_RATE,
+        )
+        self._query_plan_guard = QueryPlanGuard(
+            mode=self._app_settings.DB_QUERY_PLAN_GUARD,
+            min_rows=self._app_settings.DB_QUERY_PLAN_MIN_ROWS,
+        )
+
+        if self._app_settings.DB_BACKEND not in DB_BACKENDS:
+            raise DBConfigError(
+                f"Unknown DB_BACKEND '{self._app_settings.DB_BACKEND}'. "
+                f"Expected one of: {', '.join(DB_BACKENDS)}"
+            )
+
+        if self._app_settings.DB_BACKEND == "threadpool":
+            self._create_threadpool_backend()
+            return
+
+        if self._app_settings.DB_IN_MEMORY:
+            self._create_in_memory_database()
+            return
+
+        if self._app_settings.DB_SHARD_COUNT > 1:
+            self._create_shards()
+            return
+
+        self._engine = self._create_engine(self._app_settings.DATABASE_URL)
+        self._session_factory = self._create_session_factory(self._engine)
+
+        read_url = self._read_url()
+
+        if read_url is None:
+            self._read_engine = self._engine
+            self._read_session_factory = self._session_factory
+        else:
+            self._read_engine = self._create_engine(read_url, read_only=True)
+            self._read_session_factory = self._create_session_factory(self._read_engine)
+            logger.info("Repository reads routed to read-only engine.")
+
+    def _create_threadpool_backend(self):
+        """
+        Create sessions running a synchronous engine on a bounded thread pool.
+
+        The asynchronous engine is still created, but only migrates the
+        schema at start-up. Only plain SQLite file databases are supported.
+        """
+        url = make_url(self._app_settings.DATABASE_URL)
+
+        if (
+            url.get_backend_name() != "sqlite"
+            or _is_in_memory_sqlite(url)
+            or self._app_settings.DB_IN_MEMORY
+            or self._app_settings.DB_SHARD_COUNT > 1
+        ):
+            raise DBConfigError(
+                "DB_BACKEND 'threadpool' requires a SQLite file DATABASE_URL, "
+                "without DB_IN_MEMORY or DB_SHARD_COUNT."
+            )
+
+        self._engine = self._create_engine(url)
+        self._read_engine = self._engine
+        self._executor = ThreadPoolExecutor(
+            max_workers=self._app_settings.DB_THREADPOOL_SIZE,
+            thread_name_prefix="db",
         )
+        self._sync_engine = self._create_sync_engine(url)
+        self._session_factory = self._create_threadpool_session_factory(
+            self._sync_engine
+        )
+
+        read_url = self._read_url()
+
+        if read_url is None:
+            self._sync_read_engine = self._sync_engine
+            self._read_session_factory = self._session_factory
+        else:
+            self._sync_read_engine = self._create_sync_engine(read_url, read_only=True)
+            self._read_session_factory = self._create_threadpool_session_factory(
+                self._sync_read_engine
+            )
+
+        logger.info(
+            "Sessions run a synchronous engine on "
+            f"{self._app_settings.DB_THREADPOOL_SIZE} threads."
+        )
+
+    def _create_in_memory_database(self):
+        """
+        Create an engine on an in-memory database loaded from DATABASE_URL.
+
+        Write batching saves fsyncs, which an in-memory database does not pay,
+        and would deadlock on its single connection, so it is not supported.
+        Neither is sharding, which spreads writes over several files.
+        """
+        if (
+            self._app_settings.DB_WRITE_BATCHING
+            or self._app_settings.DB_SHARD_COUNT > 1
+        ):
+            raise DBConfigError(
+                "DB_IN_MEMORY cannot be used with DB_WRITE_BATCHING or DB_SHARD_COUNT."
+            )
+
+        self._in_memory_database = InMemoryDatabase(
+            self._app_settings.DATABASE_URL,
+            self._app_settings.DB_SNAPSHOT_INTERVAL_S,
+        )
+        self._in_memory_database.open()
+        self._engine = self._create_engine(self._in_memory_database.url)
+        self._session_factory = self._create_session_factory(self._engine)
+        self._read_engine = self._engine
+        self._read_session_factory = self._session_factory
+        logger.info(
+            "Database held in memory, saved to "
+            f"{self._in_memory_database.snapshot_path} every "
+            f"{self._app_settings.DB_SNAPSHOT_INTERVAL_S} s and on shutdown."
+        )
+
+    def _create_write_retry(self):
+        """Create the retry policy for writes which find the database locked."""
+        self.write_retry = WriteRetry(
+            max_attempts=self._app_settings.DB_WRITE_RETRY_ATTEMPTS,
+            base_backoff_ms=self._app_settings.DB_WRITE_RETRY_BACKOFF_MS,
+            max_backoff_ms=self._app_settings.DB_WRITE_RETRY_MAX_BACKOFF_MS,
+            budget_ms=self._app_settings.DB_WRITE_RETRY_BUDGET_MS,
+        )
+
+    def _create_write_batcher(self):
+        """Create the group-commit pipeline for writes, if enabled."""
+        if self._app_settings.DB_WRITE_BATCHING:
+            self._write_batcher = WriteBatcher(
+                self.get_session,
+                max_batch_size=self._app_settings.DB_WRITE_BATCH_SIZE,
+                max_delay_ms=self._app_settings.DB_WRITE_BATCH_WINDOW_MS,
+                write_retry=self.write_retry,
+            )
+            logger.info("Writes are batched into group commits.")
+
+    def _create_shards(self):
+        """
+        Create an engine per shard and a session factory routing between them.
+
+        Reads use the same sessions: a shard's read-only engine would not see
+        the writes of a session routed to the shard's primary engine.
+        """
+        self._shard_engines = {
+            shard_id: self._create_engine(url)
+            for shard_id, url in shard_urls(
+                self._app_settings.DATABASE_URL, self._app_settings.DB_SHARD_COUNT
+            ).items()
+        }
+        self._engine = next(iter(self._shard_engines.values()))
         self._session_factory = sessionmaker(
             autocommit=False,
             autoflush=False,
-            bind=self._engine,
             class_=AsyncSession,
+            sync_session_class=ShardedSQLModelSession,
+            shards={
+                shard_id: engine.sync_engine
+                for shard_id, engine in self._shard_engines.items()
+            },
             expire_on_commit=False,
         )
+        self._read_engine = self._engine
+        self._read_session_factory = self._session_factory
+        logger.info(f"Database sharded over {len(self._shard_engines)} databases.")
+
+    def _create_engine(self, url: str | URL, read_only: bool = False) -> AsyncEngine:
+        """
+        Create an engine and connection pool for the given database URL.
+
+        Args:
+            url (str | URL): The database URL.
+            read_only (bool): Whether the engine only serves reads.
+
+        Returns:
+            AsyncEngine: The configured engine.
+        """
+        engine = create_async_engine(
+            url=url, echo=self._app_settings.DB_ECHO, **self._pool_options(url)
+        )
+        self._query_logger.register(engine)
+        statement_cache.register(engine)
+
+        if engine.dialect.name == "sqlite":
+            register_pragma_profile(
+                engine, self._app_settings.SQLITE_PRAGMA_PROFILE, read_only=read_only
+            )
+            self._query_plan_guard.register(engine)
+
+        return engine
+
+    def _create_sync_engine(self, url: str | URL, read_only: bool = False) -> Engine:
+        """
+        Create a synchronous pysqlite engine for the threadpool backend.
+
+        Args:
+            url (str | URL): The aiosqlite database URL.
+            read_only (bool): Whether the engine only serves reads.
+
+        Returns:
+            Engine: The configured engine.
+        """
+        url = make_url(url).set(drivername="sqlite")
+        engine = create_engine(
+            url=url,
+            echo=self._app_settings.DB_ECHO,
+            **self._pool_options(url, poolclass=QueuePool),
+        )
+        self._query_logger.register(engine)
+        statement_cache.register(engine)
+        register_pragma_profile(
+            engine, self._app_settings.SQLITE_PRAGMA_PROFILE, read_only=read_only
+        )
+        self._query_plan_guard.register(engine)
+
+        return engine
+
+    def _create_threadpool_session_factory(
+        self, engine: Engine
+    ) -> Callable[[], ThreadPoolSession]:
+        """Create a factory of thread pool sessions bound to the given engine."""
+        sync_session_factory = sessionmaker(
+            autocommit=False,
+            autoflush=False,
+            bind=engine,
+            class_=Session,
+            expire_on_commit=False,
+        )
+        pool_size = self._app_settings.DB_POOL_SIZE
+        max_overflow = self._app_settings.DB_MAX_OVERFLOW
+        # A negative max overflow lets the pool open connections without limit
+        connection_slots = asyncio.Semaphore(
+            pool_size + max_overflow if max_overflow >= 0 else sys.maxsize
+        )
+
+        write_lock = asyncio.Lock()
+
+        return lambda: ThreadPoolSession(
+            sync_session_factory(),
+            self._executor,
+            connection_slots,
+            slot_timeout=self._app_settings.DB_POOL_TIMEOUT,
+            write_lock=write_lock,
+        )
+
+    @staticmethod
+    def _create_session_factory(engine: AsyncEngine) -> sessionmaker[AsyncSession]:
+        """Create an async session factory bound to the given engine."""
+        return sessionmaker(
+            autocommit=False,
+            autoflush=False,
+            bind=engine,
+            class_=AsyncSession,
+            expire_on_commit=False,
+        )
+
+    def _pool_options(
+        self, url: str | URL, poolclass: Type[Pool] = AsyncAdaptedQueuePool
+    ) -> Dict[str, Any]:
+        """
+        Build connection pool arguments from the application settings.
+
+        In-memory SQLite databases exist only for the lifetime of a single
+        connection, so they keep the dialect's default static pool. Shared-cache
+        in-memory databases use a pool of one connection instead: in-memory
+        transactions are short, and serialising them avoids the table-level
+        locking between shared-cache connections.
+
+        Args:
+            url (str | URL): The database URL the pool connects to.
+            poolclass (Type[Pool]): Pool used for databases which get one.
+
+        Returns:
+            Dict[str, Any]: Keyword arguments for create_async_engine.
+        """
+        url = make_url(url)
+
+        if _is_in_memory_sqlite(url):
+            if url.query.get("cache") != "shared":
+                return {}
+
+            return {
+                "poolclass": poolclass,
+                "pool_size": 1,
+                "max_overflow": 0,
+                "pool_timeout": self._app_settings.DB_POOL_TIMEOUT,
+            }
+
+        return {
+            "poolclass": poolclass,
+            "pool_size": self._app_settings.DB_POOL_SIZE,
+            "max_overflow": self._app_settings.DB_MAX_OVERFLOW,
+            "pool_timeout": self._app_settings.DB_POOL_TIMEOUT,
+            "pool_recycle": self._app_settings.DB_POOL_RECYCLE,
+            "pool_pre_ping": self._app_settings.DB_POOL_PRE_PING,
+        }
+
+    def _read_url(self) -> Optional[str | URL]:
+        """
+        Resolve the URL of the read-only engine.
+
+        An explicit DATABASE_READ_URL is used as-is. File-backed SQLite
+        databases otherwise get a read-only URI connection to the same file,
+        which in WAL mode reads without contending with the writer.
+
+        Returns:
+            Optional[str | URL]: The read URL, or None to share the primary engine.
+        """
+        if self._app_settings.DATABASE_READ_URL:
+            return self._app_settings.DATABASE_READ_URL
+
+        url = make_url(self._app_settings.DATABASE_URL)
+
+        if url.get_backend_name() != "sqlite" or _is_in_memory_sqlite(url):
+            return None
+
+        if url.query.get("uri") == "true":
+            database = url.database
+        else:
+            database = f"file:{quote(url.database)}"
+
+        return url.set(
+            database=database, query={**url.query, "mode": "ro", "uri": "true"}
+        )
 
     async def _create_tables(self):
-        """Create tables defined in the application."""
-        async with self._engine.begin() as conn:
-            await conn.run_sync(SQLModel.metadata.create_all)
+        """
+        Bring the database schema up to date with the models.
+
+        Warm starts only compare the recorded schema fingerprint; DDL runs
+        when the database is new or behind, and only if DB_AUTO_MIGRATE is set.
+        """
+        schema_migrator = SchemaMigrator()
+
+        for engine in self._shard_engines.values() or [self._engine]:
+            async with engine.connect() as conn:
+                if await conn.run_sync(schema_migrator.is_current):
+                    logger.info("Database schema is current; skipping migrations.")
+                    continue
+
+            if not self._app_settings.DB_AUTO_MIGRATE:
+                raise DBConfigError(
+                    "Database schema is out of date. "
+                    "Run 'python -m src.db.migrations' before starting the application."
+                )
+
+            async with engine.begin() as conn:
+                applied_versions = await conn.run_sync(schema_migrator.upgrade)
+
+            logger.info(f"Applied migrations: {applied_versions}")
 
     @asynccontextmanager
     async def get_session(self) -> AbstractAsyncContextManager[AsyncSession]:
-        """Create database session for use."""
-        session: AsyncSession = self._session_factory()
+        """Create database session on the primary engine for reads and writes."""
+        async with self._session_scope(
+            self._session_factory, self._pool_metrics
+        ) as session:
+            yield session
 
-        try:
+    @asynccontextmanager
+    async def get_read_session(self) -> AbstractAsyncContextManager[AsyncSession]:
+        """Create database session on the read engine for read-only queries."""
+        async with self._session_scope(
+            self._read_session_factory, self._read_pool_metrics
+        ) as session:
             yield session
-        except Exception as e:
-            logger.exception(f"Session rollback because of exception: {str(e)}")
-            await session.rollback()
-            raise
-        finally:
+
+    @asynccontextmanager
+    async def _session_scope(
+        self, session_factory: sessionmaker[AsyncSession], pool_metrics: PoolMetrics
+    ) -> AbstractAsyncContextManager[AsyncSession]:
+        """Create a session from the factory, closing it once finished."""
+        with track_query_origin():
+            session = await self._open_session(session_factory, pool_metrics)
+
+            try:
+                yield session
+            except Exception as e:
+                logger.exception(f"Session rollback because of exception: {str(e)}")
+                await session.rollback()
+                raise
+            finally:
+                await session.close()
+
+    async def open_session(self, read_only: bool = False) -> AsyncSession:
+        """
+        Open a session with its connection already checked out.
+
+        Unlike get_session, the caller owns the session and must close it.
+
+        Args:
+            read_only (bool): Bind the session to the read engine.
+
+        Returns:
+            AsyncSession: The open session.
+        """
+        if read_only:
+            return await self._open_session(
+                self._read_session_factory, self._read_pool_metrics
+            )
+
+        return await self._open_session(self._session_factory, self._pool_metrics)
+
+    @staticmethod
+    async def _open_session(
+        session_factory: sessionmaker[AsyncSession], pool_metrics: PoolMetrics
+    ) -> AsyncSession:
+        """Create a session and acquire its connection, recording the wait."""
+        session: AsyncSession = session_factory()
+
+        if isinstance(session.sync_session, ShardedSQLModelSession):
+            # Sharded sessions connect to each shard when it is first queried
+            return session
+
+        start = time.perf_counter()
+
+        try:
+            await session.connection()
+        except PoolTimeoutError:
+            pool_metrics.record_timeout()
             await session.close()
+            raise
+
+        pool_metrics.record_checkout(time.perf_counter() - start)
+        return session
+
+    @property
+    def batches_writes(self) -> bool:
+        """Whether writes are applied through the group-commit pipeline."""
+        return self._write_batcher is not None
+
+    async def execute_write(self, operation: WriteOperation[T]) -> T:
+        """
+        Apply a write in its own transaction, or in the next group commit.
+
+        The transaction is retried while the database is locked.
+
+        Args:
+            operation (WriteOperation[T]): Applies the write to the given session,
+                flushing it, and returns the caller's result. It is retried on
+                its own if the group commit it was part of fails.
+
+        Returns:
+            T: The operation's result, once the write has been committed.
+
+        Raises:
+            DatabaseContentionError: If the database stayed locked.
+        """
+        if self._write_batcher is not None:
+            return await self._write_batcher.submit(operation)
+
+        async def commit_write() -> T:
+            async with self.get_session() as session:
+                result = await operation(session)
+                await session.commit()
+                return result
+
+        return await self.write_retry.run(commit_write)
+
+    def get_pool_stats(self) -> List[PoolStatsOutput]:
+        """
+        Retrieve current connection pool statistics.
+
+        Returns:
+            List[PoolStatsOutput]: Pool occupancy and checkout wait metrics
+            for the primary engine, followed by the read engine if separate.
+            Sharded databases report the occupancy of each shard's pool.
+        """
+        if self._shard_engines:
+            return [
+                PoolMetrics(f"shard{shard_id}").snapshot(engine.pool)
+                for shard_id, engine in self._shard_engines.items()
+            ]
+
+        # The threadpool backend's sessions use its synchronous engines
+        engine = self._sync_engine or self._engine
+        read_engine = self._sync_read_engine or self._read_engine
+        stats = [self._pool_metrics.snapshot(engine.pool)]
+
+        if read_engine is not engine:
+            stats.append(self._read_pool_metrics.snapshot(read_engine.pool))
+
+        return stats
+
+    @staticmethod
+    def get_statement_stats() -> List[StatementStatsOutput]:
+        """
+        Retrieve compiled cache statistics for the prebuilt repository statements.
+
+        Returns:
+            List[StatementStatsOutput]: Hit and miss counts per statement.
+        """
+        return statement_cache.snapshot()
+
+    async def start_backup(self) -> List[BackupStatusOutput]:
+        """
+        Start an online backup of every database in the background.
+
+        Returns:
+            List[BackupStatusOutput]: The pending backup of each database.
+
+        Raises:
+            BackupInProgressError: If the previous backup is still running.
+        """
+        if self._backup_task is not None and not self._backup_task.done():
+            raise BackupInProgressError("A backup is already running.")
+
+        if self._in_memory_database is not None:
+            sources = {
+                self._in_memory_database.snapshot_path.stem: (
+                    self._in_memory_database.sqlite_uri
+                )
+            }
+        else:
+            sources = database_files(self._app_settings)
+
+        self._backup_jobs = create_backup_jobs(sources, self._app_settings)
+        self._backup_task = asyncio.create_task(self._run_backups(self._backup_jobs))
+        return self.get_backup_status()
+
+    @staticmethod
+    async def _run_backups(backup_jobs: List[BackupJob]) -> None:
+        for backup_job in backup_jobs:
+            await backup_job.run()
+
+    def get_backup_status(self) -> List[BackupStatusOutput]:
+        """
+        Retrieve the progress of the latest backup.
+
+        Returns:
+            List[BackupStatusOutput]: Pages copied, throughput and state for
+            each database, or an empty list if no backup was started.
+        """
+        return [backup_job.snapshot() for backup_job in self._backup_jobs]
+
+    def start_maintenance(self) -> None:
+        """
+        Start refreshing planner statistics and vacuuming free pages.
+
+        Maintenance runs in the background every DB_MAINTENANCE_INTERVAL_S,
+        at quiet moments. It is disabled by a zero interval, and for other
+        databases than SQLite.
+        """
+        if (
+            self._maintenance is not None
+            or self._app_settings.DB_MAINTENANCE_INTERVAL_S <= 0
+            or self._engine.dialect.name != "sqlite"
+        ):
+            return
+
+        engines = list(self._shard_engines.values()) or [self._engine]
+        monitored_engines = {
+            *engines,
+            self._read_engine,
+            self._sync_engine,
+            self._sync_read_engine,
+        } - {None}
+
+        self._maintenance = DatabaseMaintenance(
+            engines,
+            list(monitored_engines),
+            interval_s=self._app_settings.DB_MAINTENANCE_INTERVAL_S,
+            idle_s=self._app_settings.DB_MAINTENANCE_IDLE_S,
+            vacuum_pages_per_slice=self._app_settings.DB_VACUUM_PAGES_PER_SLICE,
+            vacuum_max_slices=self._app_settings.DB_VACUUM_MAX_SLICES,
+        )
+        self._maintenance.start()
+        logger.info(
+            "Database maintenance runs every "
+            f"{self._app_settings.DB_MAINTENANCE_INTERVAL_S} s."
+        )
+
+    def get_maintenance_status(self) -> List[MaintenanceStatusOutput]:
+        """
+        Retrieve when each maintenance task last ran and how long it took.
+
+        Returns:
+            List[MaintenanceStatusOutput]: Status of each task, or an empty
+            list if maintenance is not running.
+        """
+        if self._maintenance is None:
+            return []
+
+        return self._maintenance.snapshot()
+
+    def get_contention_stats(self) -> ContentionStatsOutput:
+        """
+        Retrieve write lock contention statistics.
+
+        Returns:
+            ContentionStatsOutput: Lock errors, retries, backoff time and
+            writes which gave up since start-up.
+        """
+        return self.write_retry.snapshot()
+
+
+def _is_in_memory_sqlite(url: URL) -> bool:
+    """Check whether a database URL points at an in-memory SQLite database."""
+    return url.get_backend_name() == "sqlite" and (
+        url.database in (None, "", ":memory:") or url.query.get("mode") == "memory"
+    )
 
 
 async def get_database_client() -> DatabaseClient:
@@ -85,3 +744,15 @@ async def get_database_client() -> DatabaseClient:
         logger.debug("Created and initialised new DatabaseClient.")
 
     return _DATABASE_CLIENT
+
+
+async def close_database_client() -> None:
+    """
+    Closes the shared database client, e.g. on application shutdown.
+    """
+    global _DATABASE_CLIENT
+
+    if _DATABASE_CLIENT is not None:
+        await _DATABASE_CLIENT.close()
+        _DATABASE_CLIENT = None
+        logger.debug("Closed DatabaseClient.")
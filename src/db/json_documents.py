@@ -0,0 +1,59 @@
+"""
+SQL expressions building JSON documents with SQLite's JSON functions.
+
+A record and its related records can be serialised by a single statement,
+so that its document is read as one text value, ready to be returned to the
+client, rather than as rows assembled into DTOs and dumped in Python.
+"""
+
+from typing import Iterable
+
+from sqlalchemy import ColumnElement, func
+
+from src.models.types import BinaryGuid
+
+# Offsets and lengths of the groups of a guid's 32 hex digits
+_GUID_GROUPS = ((1, 8), (9, 4), (13, 4), (17, 4), (21, 12))
+
+
+def guid_text(column: ColumnElement) -> ColumnElement:
+    """
+    Read a BinaryGuid column as its lowercase canonical string.
+
+    Args:
+        column (ColumnElement): The column storing 16 guid bytes.
+
+    Returns:
+        ColumnElement: An expression of the guid's canonical string.
+    """
+    digits = func.hex(column)
+    groups = [func.substr(digits, start, length) for start, length in _GUID_GROUPS]
+
+    return func.lower(func.printf("%s-%s-%s-%s-%s", *groups))
+
+
+def json_object(columns: Iterable[ColumnElement], **nested: ColumnElement):
+    """
+    Build a JSON object from columns, keyed by the columns' names.
+
+    The keys follow the order of the columns, then of the nested documents,
+    so that the object serialises like the DTO whose fields they mirror.
+
+    Args:
+        columns (Iterable[ColumnElement]): The columns of the object.
+        nested (ColumnElement): JSON documents to embed under the given keys,
+            e.g. an array of related records.
+
+    Returns:
+        ColumnElement: An expression of the JSON object.
+    """
+    arguments = []
+    for column in columns:
+        value = guid_text(column) if isinstance(column.type, BinaryGuid) else column
+        arguments.extend([column.key, value])
+
+    for key, document in nested.items():
+        # json() keeps a subquery's document from being embedded as a string
+        arguments.extend([key, func.json(document)])
+
+    return func.json_object(*arguments)
@@ -0,0 +1,274 @@
+"""
+Background maintenance of the SQLite databases.
+
+SQLite's query planner only uses statistics gathered by ANALYZE, and pages
+freed by deletes stay in the file until they are vacuumed. The scheduler
+periodically refreshes the statistics and releases free pages in bounded
+slices of PRAGMA incremental_vacuum, which requires the database to have
+been created with auto_vacuum=INCREMENTAL (see sqlite_pragmas).
+
+Runs wait for a quiet moment: no connection checked out from any of the
+client's pools for DB_MAINTENANCE_IDLE_S. Under sustained traffic a run is
+deferred by at most one interval, and the vacuum then stops after one slice.
+"""
+
+import asyncio
+import sqlite3
+import threading
+import time
+from contextlib import suppress
+from datetime import datetime, timezone
+from typing import Awaitable, Callable, Dict, List, Optional
+
+from sqlalchemy import event, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from src.logger import logger
+from src.schemas.database.maintenance_status_output import MaintenanceStatusOutput
+
+# Rows sampled per index by ANALYZE, keeping each run short on large tables
+_ANALYSIS_LIMIT = 1000
+
+# PRAGMA auto_vacuum reports 2 for INCREMENTAL
+_INCREMENTAL = 2
+
+# Seconds between checks for traffic while waiting for a quiet moment
+_POLL_INTERVAL = 0.5
+
+# Seconds between vacuum slices, for queued requests to get a connection
+_SLICE_PAUSE = 0.05
+
+
+class _PoolActivity:
+    """Counts connection checkouts across engines, to find quiet moments."""
+
+    def __init__(self, engines: List[AsyncEngine | Engine]) -> None:
+        self.checkouts = 0
+        self.in_use = 0
+        self._lock = threading.Lock()
+
+        for engine in engines:
+            if isinstance(engine, AsyncEngine):
+                engine = engine.sync_engine
+
+            event.listen(engine, "checkout", self._on_checkout)
+            event.listen(engine, "checkin", self._on_checkin)
+
+    def _on_checkout(self, *_args) -> None:
+        with self._lock:
+            self.checkouts += 1
+            self.in_use += 1
+
+    def _on_checkin(self, *_args) -> None:
+        with self._lock:
+            # Connections checked out before the listener was added
+            self.in_use = max(self.in_use - 1, 0)
+
+
+class _TaskStatus:
+    """When a maintenance task last ran, and its outcome."""
+
+    def __init__(self, task: str) -> None:
+        self.task = task
+        self.runs = 0
+        self.last_run_at: Optional[datetime] = None
+        self.last_duration: Optional[float] = None
+        self.last_result: Optional[str] = None
+        self.last_error: Optional[str] = None
+
+    def snapshot(self) -> MaintenanceStatusOutput:
+        return MaintenanceStatusOutput(
+            task=self.task,
+            runs=self.runs,
+            last_run_at=self.last_run_at,
+            last_duration_ms=(
+                self.last_duration * 1000 if self.last_duration is not None else None
+            ),
+            last_result=self.last_result,
+            last_error=self.last_error,
+        )
+
+
+class DatabaseMaintenance:
+    """
+    Refreshes planner statistics and vacuums free pages in the background.
+
+    Tasks run one database at a time, each statement on a connection of the
+    database's own pool, so they queue with requests rather than racing them.
+    """
+
+    def __init__(
+        self,
+        engines: List[AsyncEngine],
+        monitored_engines: List[AsyncEngine | Engine],
+        interval_s: float,
+        idle_s: float,
+        vacuum_pages_per_slice: int,
+        vacuum_max_slices: int,
+    ) -> None:
+        """
+        Initialise the scheduler without starting it.
+
+        Args:
+            engines (List[AsyncEngine]): Writable engines of the databases.
+            monitored_engines (List[AsyncEngine | Engine]): Every engine
+                serving requests, watched for traffic.
+            interval_s (float): Seconds between runs.
+            idle_s (float): Quiet time required before a run.
+            vacuum_pages_per_slice (int): Pages freed per write transaction.
+            vacuum_max_slices (int): Slices per database and run.
+        """
+        self.engines = engines
+        self.interval = interval_s
+        self.idle = idle_s
+        self.vacuum_pages_per_slice = vacuum_pages_per_slice
+        self.vacuum_max_slices = vacuum_max_slices
+        self._activity = _PoolActivity(monitored_engines)
+        self._status: Dict[str, _TaskStatus] = {
+            task: _TaskStatus(task) for task in ("optimize", "incremental_vacuum")
+        }
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        """Start running maintenance in the background."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run_periodically())
+
+    async def close(self) -> None:
+        """Stop the background maintenance, interrupting a running task."""
+        if self._task is not None:
+            self._task.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+
+    async def run(self) -> None:
+        """Run every maintenance task once, recording the outcome of each."""
+        await self._run_task("optimize", self._optimize)
+        await self._run_task("incremental_vacuum", self._incremental_vacuum)
+
+    def snapshot(self) -> List[MaintenanceStatusOutput]:
+        """
+        Report when each maintenance task last ran.
+
+        Returns:
+            List[MaintenanceStatusOutput]: Point-in-time status of each task.
+        """
+        return [status.snapshot() for status in self._status.values()]
+
+    async def _run_periodically(self) -> None:
+        while True:
+            await self._wait_for_quiet()
+            await self.run()
+            await asyncio.sleep(self.interval)
+
+    async def _wait_for_quiet(self) -> None:
+        deadline = time.monotonic() + self.interval
+        checkouts = self._activity.checkouts
+        quiet_since = time.monotonic()
+
+        while time.monotonic() - quiet_since < self.idle:
+            if time.monotonic() >= deadline:
+                logger.info("No quiet moment for database maintenance; running now.")
+                return
+
+            await asyncio.sleep(min(self.idle, _POLL_INTERVAL))
+
+            if self._activity.in_use or self._activity.checkouts != checkouts:
+                checkouts = self._activity.checkouts
+                quiet_since = time.monotonic()
+
+    async def _run_task(self, task: str, step: Callable[[], Awaitable[str]]) -> None:
+        status = self._status[task]
+        status.last_run_at = datetime.now(timezone.utc)
+        start = time.perf_counter()
+
+        try:
+            status.last_result = await step()
+            status.last_error = None
+        except Exception as e:
+            status.last_result = None
+            status.last_error = str(e)
+            logger.exception(f"Database maintenance task {task} failed: {str(e)}")
+        finally:
+            status.runs += 1
+            status.last_duration = time.perf_counter() - start
+
+        logger.info(
+            f"Database maintenance task {task} took "
+            f"{status.last_duration * 1000:.1f} ms: {status.last_result}"
+        )
+
+    async def _optimize(self) -> str:
+        """Refresh planner statistics, analysing every table on the first run."""
+        statements = set()
+
+        for engine in self.engines:
+            async with engine.connect() as conn:
+                conn = await conn.execution_options(isolation_level="AUTOCOMMIT")
+                await conn.exec_driver_sql(f"PRAGMA analysis_limit={_ANALYSIS_LIMIT}")
+                has_statistics = await conn.scalar(
+                    text(
+                        "SELECT COUNT(*) FROM sqlite_master "
+                        "WHERE type = 'table' AND name = 'sqlite_stat1'"
+                    )
+                )
+
+                # Before 3.46, PRAGMA optimize only considers the tables
+                # queried through its own connection.
+                if has_statistics and sqlite3.sqlite_version_info >= (3, 46):
+                    statement = "PRAGMA optimize=0x10002"
+                else:
+                    statement = "ANALYZE"
+
+                await conn.exec_driver_sql(statement)
+                statements.add(statement)
+
+        return f"{', '.join(sorted(statements))} on {len(self.engines)} database(s)"
+
+    async def _incremental_vacuum(self) -> str:
+        """Release free pages in slices, stopping early when traffic arrives."""
+        freed = 0
+        free_pages = 0
+        disabled = 0
+
+        for engine in self.engines:
+            async with engine.connect() as conn:
+                auto_vacuum = await conn.scalar(text("PRAGMA auto_vacuum"))
+                free_pages_before = await conn.scalar(text("PRAGMA freelist_count"))
+
+            if auto_vacuum != _INCREMENTAL:
+                disabled += 1
+                free_pages += free_pages_before
+                continue
+
+            left = free_pages_before
+
+            for slice_number in range(self.vacuum_max_slices):
+                if not left or (slice_number and self._activity.in_use):
+                    break
+
+                async with engine.connect() as conn:
+                    raw_connection = await conn.get_raw_connection()
+                    # The pragma frees one page per step, and execute() only
+                    # steps once: executescript() runs it to completion.
+                    await raw_connection.driver_connection.executescript(
+                        f"PRAGMA incremental_vacuum({self.vacuum_pages_per_slice})"
+                    )
+                    left = await conn.scalar(text("PRAGMA freelist_count"))
+
+                await asyncio.sleep(_SLICE_PAUSE)
+
+            freed += free_pages_before - left
+            free_pages += left
+
+        result = f"freed {freed} pages, {free_pages} free pages left"
+
+        if disabled:
+            result += (
+                f"; {disabled} database(s) without auto_vacuum=INCREMENTAL "
+                "need a one-off VACUUM"
+            )
+
+        return result
@@ -0,0 +1,169 @@
+"""
+In-memory SQLite database persisted to disk through snapshots.
+
+The database lives in a named, shared-cache in-memory SQLite database, so
+queries never touch the disk. It is loaded from the DATABASE_URL file at
+start-up and copied back to that file with the SQLite backup API at a fixed
+interval and on shutdown. The snapshot is an ordinary SQLite database, so a
+deployment can switch between in-memory and file-backed mode at any time.
+
+Commits since the last snapshot are lost if the process dies: the snapshot
+interval is the durability window.
+"""
+
+import asyncio
+import sqlite3
+import time
+import uuid
+from contextlib import closing, suppress
+from pathlib import Path
+from typing import Optional
+
+from sqlalchemy import make_url
+from sqlalchemy.engine import URL
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from src.errors.exceptions import DBConfigError
+from src.logger import logger
+
+
+class InMemoryDatabase:
+    """
+    Shared-cache in-memory SQLite database backed by a snapshot file.
+
+    An anchor connection is held open for the lifetime of the database, as
+    SQLite discards an in-memory database when its last connection closes.
+    Snapshots are taken through a connection of the engine's pool, so they
+    wait for in-flight transactions and always capture committed data.
+    """
+
+    def __init__(self, database_url: str | URL, snapshot_interval_s: float) -> None:
+        """
+        Initialise the database without loading the snapshot.
+
+        Args:
+            database_url (str | URL): URL of the SQLite file used as snapshot.
+            snapshot_interval_s (float): Seconds between snapshots. Zero only
+                takes a snapshot on shutdown.
+        """
+        self.snapshot_path = _snapshot_path(make_url(database_url))
+        self.snapshot_interval = snapshot_interval_s
+        self.snapshots = 0
+        self._name = f"bank_{uuid.uuid4().hex}"
+        self._anchor: Optional[sqlite3.Connection] = None
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def url(self) -> URL:
+        """URL of the in-memory database, for create_async_engine."""
+        return make_url(f"sqlite+aiosqlite:///{self.sqlite_uri}&uri=true")
+
+    @property
+    def sqlite_uri(self) -> str:
+        """URI of the in-memory database, for sqlite3.connect(uri=True)."""
+        return f"file:{self._name}?mode=memory&cache=shared"
+
+    def open(self) -> None:
+        """Create the in-memory database, restoring the snapshot if one exists."""
+        self._anchor = sqlite3.connect(
+            self.sqlite_uri, uri=True, check_same_thread=False
+        )
+
+        if not self.snapshot_path.exists():
+            logger.info(f"No snapshot at {self.snapshot_path}: starting empty.")
+            return
+
+        start = time.perf_counter()
+
+        with closing(sqlite3.connect(self.snapshot_path)) as snapshot:
+            snapshot.backup(self._anchor)
+
+        logger.info(
+            f"Loaded snapshot {self.snapshot_path} into memory in "
+            f"{(time.perf_counter() - start) * 1000:.1f} ms."
+        )
+
+    def start(self, engine: AsyncEngine) -> None:
+        """
+        Start taking periodic snapshots in the background.
+
+        Args:
+            engine (AsyncEngine): Engine connected to the in-memory database.
+        """
+        if self.snapshot_interval > 0 and self._task is None:
+            self._task = asyncio.create_task(self._run(engine))
+
+    async def save(self, engine: AsyncEngine) -> None:
+        """
+        Copy the in-memory database to the snapshot file.
+
+        The backup API writes the file in a single transaction, so a crash
+        while saving leaves the previous snapshot intact.
+
+        Args:
+            engine (AsyncEngine): Engine connected to the in-memory database.
+        """
+        start = time.perf_counter()
+
+        async with engine.connect() as conn:
+            raw_connection = await conn.get_raw_connection()
+
+            with closing(
+                sqlite3.connect(self.snapshot_path, check_same_thread=False)
+            ) as snapshot:
+                await raw_connection.driver_connection.backup(snapshot)
+
+        self.snapshots += 1
+        logger.info(
+            f"Saved snapshot {self.snapshot_path} in "
+            f"{(time.perf_counter() - start) * 1000:.1f} ms."
+        )
+
+    async def close(self, engine: AsyncEngine) -> None:
+        """
+        Stop the periodic snapshots, save a final one and release the database.
+
+        Args:
+            engine (AsyncEngine): Engine connected to the in-memory database.
+        """
+        if self._task is not None:
+            self._task.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+
+        try:
+            await self.save(engine)
+        finally:
+            if self._anchor is not None:
+                self._anchor.close()
+                self._anchor = None
+
+    async def _run(self, engine: AsyncEngine) -> None:
+        while True:
+            await asyncio.sleep(self.snapshot_interval)
+
+            try:
+                await self.save(engine)
+            except Exception as e:
+                logger.exception(f"Snapshot of in-memory database failed: {str(e)}")
+
+
+def _snapshot_path(url: URL) -> Path:
+    """Resolve the file a SQLite DATABASE_URL points at."""
+    database = url.database or ""
+
+    if url.query.get("uri") == "true":
+        database = database.removeprefix("file:")
+
+    if (
+        url.get_backend_name() != "sqlite"
+        or database in ("", ":memory:")
+        or url.query.get("mode") == "memory"
+    ):
+        raise DBConfigError(
+            "DB_IN_MEMORY requires DATABASE_URL to be a SQLite file, "
+            "which is used as the snapshot."
+        )
+
+    return Path(database)
@@ -0,0 +1,331 @@
+"""
+Versioned schema migrations.
+
+A fresh database is built directly from the models with create_all and
+stamped with the latest migration. Existing databases run every migration
+after their recorded version. Each migration must therefore be idempotent
+against a schema that create_all has already brought up to date.
+
+The recorded schema fingerprint lets application start-up skip all DDL
+when the database already matches the models. Run the migrations explicitly
+during deployment with:
+
+    poetry run python -m src.db.migrations
+"""
+
+import asyncio
+import hashlib
+import uuid
+from typing import Callable, List, Optional, Tuple
+
+from sqlalchemy import MetaData, Table, inspect, select
+from sqlalchemy.engine import Connection, Dialect
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.schema import CreateIndex, CreateTable
+
+from src.core.settings import get_app_settings
+from src.db.sharding import shard_urls
+from src.db.sqlite_pragmas import register_pragma_profile
+from src.logger import logger
+from src.models.banking_models import CustomerAccountLink, SQLModel
+from src.models.schema_version import SchemaVersion
+from src.models.types import BinaryGuid
+
+
+class Migration:
+    """A single, ordered schema change."""
+
+    def __init__(
+        self, version: str, description: str, upgrade: Callable[[Connection], None]
+    ) -> None:
+        """
+        Initialise the migration.
+
+        Args:
+            version (str): Sortable identifier, e.g. "0001".
+            description (str): Human readable summary of the change.
+            upgrade (Callable[[Connection], None]): Applies the change.
+        """
+        self.version = version
+        self.description = description
+        self.upgrade = upgrade
+
+
+def _create_initial_schema(conn: Connection) -> None:
+    SQLModel.metadata.create_all(conn)
+
+
+def _create_secondary_indexes(conn: Connection) -> None:
+    # Indexes already built by create_all (or by a previous attempt) are
+    # skipped, keeping the migration idempotent.
+    for table in SQLModel.metadata.sorted_tables:
+        for index in sorted(table.indexes, key=lambda index: index.name):
+            index.create(conn, checkfirst=True)
+
+
+def _guid_bytes(guid: Optional[str]) -> Optional[bytes]:
+    return uuid.UUID(guid).bytes if guid is not None else None
+
+
+def _store_guids_as_bytes(conn: Connection) -> None:
+    # SQLite keeps the declared VARCHAR type of existing columns, but a
+    # column's type only sets its affinity, and blobs are stored unchanged.
+    # Rewriting the keys in place avoids rebuilding every table.
+    conn.exec_driver_sql("PRAGMA defer_foreign_keys = ON")
+    conn.connection.dbapi_connection.create_function(
+        "guid_bytes", 1, _guid_bytes, deterministic=True
+    )
+
+    for table in SQLModel.metadata.sorted_tables:
+        for column in table.columns:
+            if isinstance(column.type, BinaryGuid):
+                conn.exec_driver_sql(
+                    f'UPDATE "{table.name}" SET {column.name} = '
+                    f"guid_bytes({column.name}) WHERE typeof({column.name}) = 'text'"
+                )
+
+
+def _rebuild_table(conn: Connection, table: Table) -> None:
+    # SQLite cannot change a column's definition or a table's storage in
+    # place: tables whose DDL differs from the models are rebuilt.
+    ddl = str(CreateTable(table).compile(dialect=conn.dialect))
+    stored_ddl = conn.exec_driver_sql(
+        "SELECT sql FROM sqlite_master WHERE type = 'table' AND name = ?",
+        (table.name,),
+    ).scalar()
+
+    if stored_ddl.split() == ddl.split():
+        return
+
+    # Indexes and triggers keep their names when their table is renamed
+    for kind, name in conn.exec_driver_sql(
+        "SELECT type, name FROM sqlite_master WHERE tbl_name = ? "
+        "AND type IN ('index', 'trigger') AND sql IS NOT NULL",
+        (table.name,),
+    ).all():
+        conn.exec_driver_sql(f"DROP {kind.upper()} {name}")
+
+    # Keeps other tables' foreign keys naming the table rather than the
+    # renamed copy. This relies on foreign keys not being enforced, as on
+    # the application's connections.
+    conn.exec_driver_sql("PRAGMA legacy_alter_table = ON")
+    try:
+        conn.exec_driver_sql(
+            f'ALTER TABLE "{table.name}" RENAME TO "_{table.name}_old"'
+        )
+    finally:
+        conn.exec_driver_sql("PRAGMA legacy_alter_table = OFF")
+
+    columns = ", ".join(column.name for column in table.columns)
+    table.create(conn)
+    conn.exec_driver_sql(
+        f'INSERT INTO "{table.name}" ({columns}) '
+        f'SELECT {columns} FROM "_{table.name}_old"'
+    )
+    conn.exec_driver_sql(f'DROP TABLE "_{table.name}_old"')
+
+
+def _cluster_link_table(conn: Connection) -> None:
+    _rebuild_table(conn, CustomerAccountLink.__table__)
+
+
+def _add_timestamp_defaults(conn: Connection) -> None:
+    for table in SQLModel.metadata.sorted_tables:
+        if table.name != SchemaVersion.__tablename__:
+            _rebuild_table(conn, table)
+
+
+def _drop_active_transaction_index(conn: Connection) -> None:
+    # Records are hard deleted and no query filters on is_deleted, so the
+    # partial index added by 0002 was never used.
+    conn.exec_driver_sql("DROP INDEX IF EXISTS ix_transaction_active_transaction_date")
+
+
+MIGRATIONS: List[Migration] = [
+    Migration("0001", "Create initial schema", _create_initial_schema),
+    Migration("0002", "Add secondary indexes", _create_secondary_indexes),
+    Migration("0003", "Store GUIDs as 16-byte blobs", _store_guids_as_bytes),
+    Migration("0004", "Store customeraccountlink WITHOUT ROWID", _cluster_link_table),
+    Migration(
+        "0005",
+        "Default timestamps in SQL and stamp last_updated_at with triggers",
+        _add_timestamp_defaults,
+    ),
+    Migration(
+        "0006",
+        "Drop the unused partial index on live transactions",
+        _drop_active_transaction_index,
+    ),
+]
+
+
+def schema_fingerprint(metadata: MetaData, dialect: Dialect) -> str:
+    """
+    Hash the DDL which the models produce for the given dialect.
+
+    Args:
+        metadata (MetaData): The table definitions.
+        dialect (Dialect): The dialect the DDL is compiled for.
+
+    Returns:
+        str: Hex digest which changes whenever a table, index or trigger
+            changes.
+    """
+    digest = hashlib.sha256()
+
+    for table in metadata.sorted_tables:
+        digest.update(str(CreateTable(table).compile(dialect=dialect)).encode())
+        for index in sorted(table.indexes, key=lambda index: index.name):
+            digest.update(str(CreateIndex(index).compile(dialect=dialect)).encode())
+        for trigger in table.info.get("triggers", ()):
+            digest.update(trigger.encode())
+
+    return digest.hexdigest()
+
+
+class SchemaMigrator:
+    """
+    Compares the database with the models and applies pending migrations.
+
+    All methods take a synchronous connection so they can be run through
+    AsyncConnection.run_sync.
+    """
+
+    def __init__(
+        self,
+        metadata: MetaData = SQLModel.metadata,
+        migrations: Optional[List[Migration]] = None,
+    ) -> None:
+        """
+        Initialise the migrator.
+
+        Args:
+            metadata (MetaData): The table definitions of the application.
+            migrations (Optional[List[Migration]]): Ordered migrations.
+        """
+        self.metadata = metadata
+        self.migrations = MIGRATIONS if migrations is None else migrations
+        self.head = self.migrations[-1].version
+
+    def is_current(self, conn: Connection) -> bool:
+        """
+        Check the recorded version and fingerprint without reflecting tables.
+
+        Args:
+            conn (Connection): Connection to the database.
+
+        Returns:
+            bool: True if the database is at the latest version.
+        """
+        return self._recorded_state(conn) == (
+            self.head,
+            schema_fingerprint(self.metadata, conn.dialect),
+        )
+
+    def upgrade(self, conn: Connection) -> List[str]:
+        """
+        Apply pending migrations and record the new version and fingerprint.
+
+        Args:
+            conn (Connection): Connection to the database, within a transaction.
+
+        Returns:
+            List[str]: Versions of the migrations which were applied.
+        """
+        if conn.dialect.name == "sqlite":
+            # Take the write lock up front so concurrently starting workers
+            # apply the migrations one at a time.
+            conn.exec_driver_sql("BEGIN IMMEDIATE")
+
+        fingerprint = schema_fingerprint(self.metadata, conn.dialect)
+        recorded = self._recorded_state(conn)
+
+        if recorded == (self.head, fingerprint):
+            return []
+
+        recorded_version = recorded[0] if recorded else None
+
+        if recorded_version is None and not self._has_tables(conn):
+            logger.info("Empty database: creating schema from the models.")
+            self.metadata.create_all(conn)
+            applied = [migration.version for migration in self.migrations]
+        else:
+            applied = []
+            for migration in self.migrations:
+                if recorded_version is None or migration.version > recorded_version:
+                    logger.info(
+                        f"Applying migration {migration.version}: "
+                        f"{migration.description}"
+                    )
+                    migration.upgrade(conn)
+                    applied.append(migration.version)
+
+        self._record_state(conn, fingerprint, recorded is None)
+        return applied
+
+    def _recorded_state(self, conn: Connection) -> Optional[Tuple[str, str]]:
+        if not inspect(conn).has_table(SchemaVersion.__tablename__):
+            return None
+
+        row = conn.execute(
+            select(SchemaVersion.version, SchemaVersion.fingerprint)
+        ).first()
+        return tuple(row) if row else None
+
+    def _has_tables(self, conn: Connection) -> bool:
+        inspector = inspect(conn)
+        return any(
+            inspector.has_table(table.name)
+            for table in self.metadata.sorted_tables
+            if table.name != SchemaVersion.__tablename__
+        )
+
+    def _record_state(self, conn: Connection, fingerprint: str, insert: bool) -> None:
+        table = SchemaVersion.__table__
+        SchemaVersion.metadata.create_all(conn, tables=[table])
+        values = {"version": self.head, "fingerprint": fingerprint}
+
+        if insert:
+            conn.execute(table.insert().values(id=1, **values))
+        else:
+            conn.execute(table.update().where(table.c.id == 1).values(**values))
+
+
+async def run_migrations() -> List[str]:
+    """
+    Apply pending migrations to the configured database, or to every shard.
+
+    Returns:
+        List[str]: Versions of the migrations which were applied.
+    """
+    app_settings = get_app_settings()
+
+    if app_settings.DB_SHARD_COUNT > 1:
+        urls = shard_urls(app_settings.DATABASE_URL, app_settings.DB_SHARD_COUNT)
+    else:
+        urls = {"0": app_settings.DATABASE_URL}
+
+    applied_versions = []
+
+    for url in urls.values():
+        engine = create_async_engine(url)
+
+        if engine.dialect.name == "sqlite":
+            register_pragma_profile(engine, app_settings.SQLITE_PRAGMA_PROFILE)
+
+        try:
+            async with engine.begin() as conn:
+                applied_versions.extend(await conn.run_sync(SchemaMigrator().upgrade))
+        finally:
+            await engine.dispose()
+
+    return sorted(set(applied_versions))
+
+
+if __name__ == "__main__":
+    applied_versions = asyncio.run(run_migrations())
+    logger.info(
+        f"Applied migrations: {', '.join(applied_versions)}"
+        if applied_versions
+        else "Database schema already up to date."
+    )
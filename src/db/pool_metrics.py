@@ -0,0 +1,74 @@
+from sqlalchemy.pool import Pool
+
+from src.schemas.database.pool_stats_output import PoolStatsOutput
+
+
+class PoolMetrics:
+    """
+    Collects connection checkout metrics for a connection pool.
+
+    SQLAlchemy pools report their current occupancy but not how long callers
+    waited for a connection, so checkout waits are recorded here by the
+    DatabaseClient whenever a session acquires its connection.
+    """
+
+    def __init__(self, engine_name: str) -> None:
+        """
+        Initialise metrics with no recorded checkouts.
+
+        Args:
+            engine_name (str): Label of the engine owning the pool.
+        """
+        self.engine_name = engine_name
+        self.checkouts = 0
+        self.timeouts = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    def record_checkout(self, wait: float) -> None:
+        """
+        Record a successful connection checkout.
+
+        Args:
+            wait (float): Seconds spent waiting for the connection.
+        """
+        self.checkouts += 1
+        self.total_wait += wait
+        self.max_wait = max(self.max_wait, wait)
+
+    def record_timeout(self) -> None:
+        """Record a checkout which gave up after the pool timeout."""
+        self.timeouts += 1
+
+    def snapshot(self, pool: Pool) -> PoolStatsOutput:
+        """
+        Combine the recorded metrics with the pool's current occupancy.
+
+        Pools without a fixed size (e.g. StaticPool, NullPool) report zero
+        for size, idle and overflow.
+
+        Args:
+            pool (Pool): The connection pool being measured.
+
+        Returns:
+            PoolStatsOutput: Point-in-time pool statistics.
+        """
+        average_wait = self.total_wait / self.checkouts if self.checkouts else 0.0
+
+        return PoolStatsOutput(
+            engine=self.engine_name,
+            pool_class=type(pool).__name__,
+            size=_call_or_zero(pool, "size"),
+            checked_out=_call_or_zero(pool, "checkedout"),
+            idle=_call_or_zero(pool, "checkedin"),
+            overflow=max(_call_or_zero(pool, "overflow"), 0),
+            checkouts=self.checkouts,
+            timeouts=self.timeouts,
+            average_wait_ms=average_wait * 1000,
+            max_wait_ms=self.max_wait * 1000,
+        )
+
+
+def _call_or_zero(pool: Pool, method_name: str) -> int:
+    method = getattr(pool, method_name, None)
+    return method() if method is not None else 0
@@ -0,0 +1,115 @@
+import random
+import sys
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from src.logger import logger
+
+_REPOSITORY_MODULE_PREFIX = "src.repositories."
+_MAX_CALLER_DEPTH = 12
+_MAX_STATEMENT_LENGTH = 2000
+
+_QUERY_ORIGIN: ContextVar[Optional[str]] = ContextVar("query_origin", default=None)
+
+
+class SlowQueryLogger:
+    """
+    Times every statement executed by an engine and logs the expensive ones.
+
+    Statements slower than the threshold are logged as warnings. A random
+    sample of the remaining statements can also be logged for profiling.
+    Bound parameters are never logged, as they contain customer data.
+    """
+
+    def __init__(self, slow_query_ms: float, sample_rate: float = 0.0) -> None:
+        """
+        Initialise the logger.
+
+        Args:
+            slow_query_ms (float): Duration above which a statement is logged.
+            sample_rate (float): Fraction (0-1) of other statements to log.
+        """
+        self.slow_query_seconds = slow_query_ms / 1000
+        self.sample_rate = sample_rate
+
+    def register(self, engine: AsyncEngine | Engine) -> None:
+        """
+        Attach the timing hooks to an engine.
+
+        Args:
+            engine (AsyncEngine | Engine): The engine whose statements are timed.
+        """
+        if isinstance(engine, AsyncEngine):
+            engine = engine.sync_engine
+
+        event.listen(engine, "before_cursor_execute", self._before)
+        event.listen(engine, "after_cursor_execute", self._after)
+
+    @staticmethod
+    def _before(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("query_start_time", []).append(time.perf_counter())
+
+    def _after(self, conn, cursor, statement, parameters, context, executemany):
+        duration = time.perf_counter() - conn.info["query_start_time"].pop()
+
+        if duration >= self.slow_query_seconds:
+            log = logger.warning
+            label = "Slow query"
+        elif self.sample_rate and random.random() < self.sample_rate:
+            log = logger.info
+            label = "Sampled query"
+        else:
+            return
+
+        log(
+            f"{label} ({duration * 1000:.1f} ms) "
+            f"from {_QUERY_ORIGIN.get() or 'unknown'}: "
+            f"{' '.join(statement.split())[:_MAX_STATEMENT_LENGTH]}"
+        )
+
+
+def current_query_origin() -> Optional[str]:
+    """
+    Return the repository method executing statements in this context.
+
+    Returns:
+        Optional[str]: Qualified name of the method, e.g.
+        "CustomerRepository.find_by_guid", or None outside repositories.
+    """
+    return _QUERY_ORIGIN.get()
+
+
+@contextmanager
+def track_query_origin() -> Iterator[None]:
+    """
+    Attribute statements executed in this block to the calling repository method.
+
+    SQLAlchemy executes statements in a greenlet, which cannot see the
+    coroutine that issued them, so the caller is resolved when the session is
+    opened and carried to the timing hooks in a context variable.
+    """
+    token = _QUERY_ORIGIN.set(_find_repository_caller())
+
+    try:
+        yield
+    finally:
+        _QUERY_ORIGIN.reset(token)
+
+
+def _find_repository_caller() -> Optional[str]:
+    frame = sys._getframe(2)
+
+    for _ in range(_MAX_CALLER_DEPTH):
+        if frame is None:
+            break
+        if frame.f_globals.get("__name__", "").startswith(_REPOSITORY_MODULE_PREFIX):
+            return frame.f_code.co_qualname
+        frame = frame.f_back
+
+    return _QUERY_ORIGIN.get()
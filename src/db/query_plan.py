@@ -0,0 +1,164 @@
+"""
+Guard against repository queries which scan whole tables.
+
+Every statement issued from a repository method is run through EXPLAIN
+QUERY PLAN before it executes. A plan which scans one of the guarded tables
+(rather than searching it through an index) is reported once that table
+holds more than a threshold of rows, below which SQLite may rightly prefer
+a scan. Methods which read whole tables by design opt out with
+allow_full_scan.
+
+The guard costs an extra statement per query, so it is meant for tests and
+debugging: set DB_QUERY_PLAN_GUARD to "warn" to log offending plans, or to
+"raise" to fail the query.
+"""
+
+import re
+from typing import Callable, Iterable, Optional, Set, TypeVar
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from src.db.query_logging import current_query_origin
+from src.errors.exceptions import DBConfigError, FullTableScanError
+from src.logger import logger
+
+F = TypeVar("F", bound=Callable)
+
+QUERY_PLAN_GUARD_MODES = ("off", "warn", "raise")
+
+# Tables on the hot path, which grow with the number of customers
+GUARDED_TABLES = ("customer", "account", "customeraccountlink", "transaction")
+
+# Statements whose plan can contain a table scan
+_PLANNED_STATEMENT = re.compile(r"^\s*(SELECT|UPDATE|DELETE|WITH)\b", re.IGNORECASE)
+
+# e.g. "SCAN customer", "SCAN TABLE customer AS customer_1" (before 3.36) or
+# "SCAN customeraccountlink_1 USING COVERING INDEX ..." (a full index scan)
+_SCAN_DETAIL = re.compile(r"^SCAN (?:TABLE )?(\w+)")
+
+# Suffix SQLAlchemy gives to table aliases, e.g. in relationship loads
+_ALIAS_SUFFIX = re.compile(r"_\d+$")
+
+# Repository methods which read whole tables by design, by qualified name
+_FULL_SCAN_ALLOWED: Set[str] = set()
+
+
+def allow_full_scan(method: F) -> F:
+    """
+    Exempt a repository method from the query plan guard.
+
+    Args:
+        method (F): Method whose queries are expected to scan whole tables.
+
+    Returns:
+        F: The method, unchanged.
+    """
+    _FULL_SCAN_ALLOWED.add(method.__qualname__)
+    return method
+
+
+class QueryPlanGuard:
+    """
+    Checks the plan of every repository statement for full table scans.
+
+    Plans are explained on the statement's own connection, inside its
+    transaction, so they reflect the rows the statement will see.
+    """
+
+    def __init__(
+        self,
+        mode: str,
+        min_rows: int,
+        tables: Iterable[str] = GUARDED_TABLES,
+    ) -> None:
+        """
+        Initialise the guard.
+
+        Args:
+            mode (str): One of QUERY_PLAN_GUARD_MODES.
+            min_rows (int): Rows a table must exceed for its scans to count.
+            tables (Iterable[str]): Tables which must not be scanned.
+        """
+        if mode not in QUERY_PLAN_GUARD_MODES:
+            raise DBConfigError(
+                f"Unknown DB_QUERY_PLAN_GUARD '{mode}'. "
+                f"Expected one of: {', '.join(QUERY_PLAN_GUARD_MODES)}"
+            )
+
+        self.mode = mode
+        self.min_rows = min_rows
+        self.tables = set(tables)
+
+    def register(self, engine: AsyncEngine | Engine) -> None:
+        """
+        Explain the repository statements executed by an engine.
+
+        Args:
+            engine (AsyncEngine | Engine): A SQLite engine.
+        """
+        if self.mode == "off":
+            return
+
+        if isinstance(engine, AsyncEngine):
+            engine = engine.sync_engine
+
+        event.listen(engine, "before_cursor_execute", self._check)
+
+    def _check(self, conn, cursor, statement, parameters, context, executemany):
+        origin = current_query_origin()
+
+        if (
+            origin is None
+            or origin in _FULL_SCAN_ALLOWED
+            or executemany
+            or not _PLANNED_STATEMENT.match(statement)
+        ):
+            return
+
+        explain_cursor = conn.connection.dbapi_connection.cursor()
+
+        try:
+            explain_cursor.execute(f"EXPLAIN QUERY PLAN {statement}", parameters)
+            details = [row[3] for row in explain_cursor.fetchall()]
+            scans = {
+                table: self._count_rows(explain_cursor, table)
+                for table in filter(None, map(self._scanned_table, details))
+            }
+        finally:
+            explain_cursor.close()
+
+        scans = {table: rows for table, rows in scans.items() if rows > self.min_rows}
+
+        if not scans:
+            return
+
+        message = (
+            f"Full table scan from {origin} on "
+            + ", ".join(f"{table} ({rows} rows)" for table, rows in scans.items())
+            + f": {' '.join(statement.split())} | plan: {'; '.join(details)}"
+        )
+
+        if self.mode == "raise":
+            raise FullTableScanError(message)
+
+        logger.warning(message)
+
+    def _scanned_table(self, detail: str) -> Optional[str]:
+        match = _SCAN_DETAIL.match(detail)
+
+        if match is None:
+            return None
+
+        name = match.group(1)
+
+        if name not in self.tables:
+            name = _ALIAS_SUFFIX.sub("", name)
+
+        return name if name in self.tables else None
+
+    @staticmethod
+    def _count_rows(cursor, table: str) -> int:
+        cursor.execute(f'SELECT COUNT(*) FROM "{table}"')
+        return cursor.fetchone()[0]
@@ -0,0 +1,226 @@
+"""
+Hash sharding of the banking data over several SQLite databases.
+
+Each customer is stored on the shard chosen by a hash of its guid, together
+with its link rows and the accounts opened with it, so every write made by
+a repository touches a single database file and holds only that file's
+write lock. Writes for different customers can therefore commit in parallel.
+
+Routing happens inside the session, so repositories run unchanged: lookups
+by customer guid go to one shard, while account lookups and listings are
+issued to every shard and their results concatenated (scatter-gather).
+"""
+
+import hashlib
+import uuid
+from pathlib import PurePath
+from typing import Any, Dict, Iterable, List, Optional
+
+from sqlalchemy import event, make_url
+from sqlalchemy.engine import URL, Engine
+from sqlalchemy.ext.horizontal_shard import ShardedSession
+from sqlalchemy.orm import Mapper, ORMExecuteState, Session
+from sqlalchemy.sql import operators, visitors
+from sqlalchemy.sql.elements import BinaryExpression, BindParameter
+from sqlmodel import Session as SQLModelSession
+
+from src.errors.exceptions import ShardRoutingError
+from src.models.banking_models import Account, Customer, CustomerAccountLink
+
+# Columns holding the guid of the customer which owns a row
+_CUSTOMER_KEY_COLUMNS = (
+    Customer.__table__.c.guid,
+    CustomerAccountLink.__table__.c.customer_guid,
+)
+
+
+def shard_id_for(customer_guid: Any, shard_ids: List[str]) -> str:
+    """
+    Choose the shard storing a customer.
+
+    A stable hash is used, rather than hash(), so that every process and
+    restart agrees on the placement. The guid's bytes are hashed, as they are
+    stored, so that every spelling of a guid (e.g. uppercase) is routed to
+    the same shard; malformed input falls back to its raw string.
+
+    Args:
+        customer_guid (Any): Guid of the customer.
+        shard_ids (List[str]): Identifiers of all shards, in order.
+
+    Returns:
+        str: Identifier of the customer's shard.
+    """
+    try:
+        key = uuid.UUID(str(customer_guid)).bytes
+    except ValueError:
+        key = str(customer_guid).encode()
+
+    digest = hashlib.blake2b(key, digest_size=8).digest()
+    return shard_ids[int.from_bytes(digest, "big") % len(shard_ids)]
+
+
+def shard_urls(database_url: str | URL, shard_count: int) -> Dict[str, URL]:
+    """
+    Derive one database URL per shard from the configured DATABASE_URL.
+
+    File databases get a numbered suffix, e.g. bank.db becomes bank_shard0.db.
+    In-memory databases are already separate for each engine.
+
+    Args:
+        database_url (str | URL): The configured database URL.
+        shard_count (int): Number of shards.
+
+    Returns:
+        Dict[str, URL]: Shard identifiers mapped to their URLs.
+    """
+    url = make_url(database_url)
+    urls = {}
+
+    for index in range(shard_count):
+        database = url.database
+
+        if database and database != ":memory:" and url.query.get("mode") != "memory":
+            path = PurePath(database)
+            database = str(path.with_name(f"{path.stem}_shard{index}{path.suffix}"))
+
+        urls[str(index)] = url.set(database=database)
+
+    return urls
+
+
+class ShardedSQLModelSession(ShardedSession, SQLModelSession):
+    """
+    SQLModel session which routes every statement and flush to its shards.
+
+    Used as the sync_session_class of an AsyncSession, with the shards
+    passed as Engines keyed by shard identifier.
+    """
+
+    def __init__(self, shards: Dict[str, Engine], **kwargs: Any) -> None:
+        """
+        Initialise the session over the given shards.
+
+        Args:
+            shards (Dict[str, Engine]): Shard identifiers mapped to engines.
+        """
+        super().__init__(
+            shard_chooser=self._choose_shard,
+            identity_chooser=self._choose_identity_shards,
+            execute_chooser=self._choose_execute_shards,
+            shards=shards,
+            **kwargs,
+        )
+        self.shard_ids = list(shards)
+        self._flush_shard_id: Optional[str] = None
+        event.listen(self, "before_flush", self._pin_flush_shard)
+        event.listen(self, "after_flush_postexec", self._unpin_flush_shard)
+
+    def _choose_shard(
+        self, mapper: Mapper, instance: Any, clause: Any = None, **kw: Any
+    ) -> str:
+        # Persistent objects keep the shard they were loaded from; this places
+        # new objects and the link rows written alongside them.
+        if isinstance(instance, Customer):
+            return shard_id_for(instance.guid, self.shard_ids)
+
+        if isinstance(instance, Account) and instance.customers:
+            return shard_id_for(instance.customers[0].guid, self.shard_ids)
+
+        if isinstance(instance, CustomerAccountLink):
+            return shard_id_for(instance.customer_guid, self.shard_ids)
+
+        if self._flush_shard_id is not None:
+            return self._flush_shard_id
+
+        raise ShardRoutingError(
+            f"Cannot choose a shard for {mapper.class_.__name__} "
+            "without the customer which owns it."
+        )
+
+    def _choose_identity_shards(
+        self,
+        mapper: Mapper,
+        primary_key: Any,
+        *,
+        lazy_loaded_from: Any = None,
+        **kw: Any,
+    ) -> List[str]:
+        if lazy_loaded_from is not None:
+            return [lazy_loaded_from.identity_token]
+
+        if mapper.class_ is Customer:
+            return [shard_id_for(primary_key[0], self.shard_ids)]
+
+        return self.shard_ids
+
+    def _choose_execute_shards(self, orm_context: ORMExecuteState) -> Iterable[str]:
+        # UPDATE ... RETURNING has no load options, so is never a lazy load
+        if orm_context.is_select and orm_context.lazy_loaded_from is not None:
+            return [orm_context.lazy_loaded_from.identity_token]
+
+        # Eager loads of relationships (e.g. selectin) run once per shard the
+        # parent rows came from, and related rows are always co-located.
+        parent_context = orm_context.execution_options.get("sa_top_level_orm_context")
+
+        if parent_context is not None and parent_context.identity_token is not None:
+            return [parent_context.identity_token]
+
+        customer_guids = _customer_guid_criteria(orm_context)
+
+        if customer_guids:
+            return sorted(
+                {shard_id_for(guid, self.shard_ids) for guid in customer_guids}
+            )
+
+        return self.shard_ids
+
+    def _pin_flush_shard(self, session: Session, flush_context, instances) -> None:
+        # Link rows of a many-to-many relationship are written without an
+        # instance to route by, so they go to the shard of the flushed objects.
+        shard_ids = {
+            self._choose_shard_and_assign(type(instance).__mapper__, instance)
+            for instance in (*session.new, *session.dirty, *session.deleted)
+        }
+
+        if len(shard_ids) > 1:
+            raise ShardRoutingError(
+                f"A single flush cannot write to several shards: {sorted(shard_ids)}"
+            )
+
+        self._flush_shard_id = shard_ids.pop() if shard_ids else None
+
+    def _unpin_flush_shard(self, session: Session, flush_context) -> None:
+        self._flush_shard_id = None
+
+
+def _customer_guid_criteria(orm_context: ORMExecuteState) -> List[Any]:
+    """Find the customer guids a statement's WHERE clause is restricted to."""
+    whereclause = getattr(orm_context.statement, "whereclause", None)
+
+    if whereclause is None:
+        return []
+
+    parameters = orm_context.parameters
+
+    if isinstance(parameters, list):
+        parameters = parameters[0] if len(parameters) == 1 else {}
+
+    guids = []
+
+    for element in visitors.iterate(whereclause):
+        if not (
+            isinstance(element, BinaryExpression)
+            and element.operator in (operators.eq, operators.in_op)
+            and any(element.left.compare(column) for column in _CUSTOMER_KEY_COLUMNS)
+            and isinstance(element.right, BindParameter)
+        ):
+            continue
+
+        value = (parameters or {}).get(element.right.key, element.right.value)
+
+        if element.operator is operators.in_op:
+            guids.extend(value or [])
+        elif value is not None:
+            guids.append(value)
+
+    return guids
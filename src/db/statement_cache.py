@@ -0,0 +1,95 @@
+from typing import Dict, List
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.engine.interfaces import CacheStats
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.sql import Executable
+
+from src.schemas.database.statement_stats_output import StatementStatsOutput
+
+# Execution option which tags the statements tracked by the cache
+_STATEMENT_NAME_OPTION = "cached_statement_name"
+
+
+class StatementCache:
+    """
+    Registry of the prebuilt statements used by hot repository queries.
+
+    Building a select() and generating its cache key costs more CPU than
+    executing it against SQLite. Hot queries are therefore built once at
+    import time, with bound parameters in place of literal values, so each
+    call reuses the statement's memoised cache key and SQLAlchemy's compiled
+    form of it. Executions of each statement (including the eager loads it
+    triggers) are counted as hits or misses of the compiled cache.
+    """
+
+    def __init__(self) -> None:
+        """Initialise an empty registry."""
+        self._hits: Dict[str, int] = {}
+        self._misses: Dict[str, int] = {}
+
+    def add(self, name: str, statement: Executable) -> Executable:
+        """
+        Track a prebuilt statement under a unique name.
+
+        Args:
+            name (str): Label reported in the statement statistics.
+            statement (Executable): Statement using bindparam() for its values.
+
+        Returns:
+            Executable: The statement to execute in place of the original.
+        """
+        if name in self._hits:
+            raise ValueError(f"Statement '{name}' is already registered.")
+
+        self._hits[name] = 0
+        self._misses[name] = 0
+        return statement.execution_options(**{_STATEMENT_NAME_OPTION: name})
+
+    def register(self, engine: AsyncEngine | Engine) -> None:
+        """
+        Attach the hit counters to an engine.
+
+        Args:
+            engine (AsyncEngine | Engine): The engine executing the statements.
+        """
+        if isinstance(engine, AsyncEngine):
+            engine = engine.sync_engine
+
+        event.listen(engine, "before_cursor_execute", self._record)
+
+    def snapshot(self) -> List[StatementStatsOutput]:
+        """
+        Report the compiled cache usage of every registered statement.
+
+        Returns:
+            List[StatementStatsOutput]: Hit and miss counts per statement.
+        """
+        return [
+            StatementStatsOutput(
+                name=name,
+                hits=self._hits[name],
+                misses=self._misses[name],
+                hit_ratio=(
+                    self._hits[name] / (self._hits[name] + self._misses[name])
+                    if self._hits[name] or self._misses[name]
+                    else 0.0
+                ),
+            )
+            for name in self._hits
+        ]
+
+    def _record(self, conn, cursor, statement, parameters, context, executemany):
+        name = context.execution_options.get(_STATEMENT_NAME_OPTION)
+
+        if name not in self._hits:
+            return
+
+        if context.cache_hit is CacheStats.CACHE_HIT:
+            self._hits[name] += 1
+        else:
+            self._misses[name] += 1
+
+
+statement_cache = StatementCache()
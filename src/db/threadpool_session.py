@@ -0,0 +1,184 @@
+"""
+Session backend running a synchronous SQLAlchemy engine on a thread pool.
+
+The default backend drives aiosqlite through SQLAlchemy's asyncio layer:
+every statement hops through a greenlet and then to the connection's own
+aiosqlite thread. This backend instead hands each session call, which may
+issue several statements (e.g. a query and its selectin loads), to a
+bounded thread pool running the blocking pysqlite driver.
+"""
+
+import asyncio
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, Callable, Optional, TypeVar
+
+from sqlalchemy import util
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlmodel import Session
+
+T = TypeVar("T")
+
+# As AsyncSession: results are fetched in the worker thread, not on the loop
+_EXECUTE_OPTIONS = util.immutabledict({"prebuffer_rows": True})
+
+
+class ThreadPoolSession:
+    """
+    Asynchronous facade over a SQLModel Session, for use by the repositories.
+
+    Implements the subset of the AsyncSession interface the repositories
+    use. A session is only ever used by one task at a time, so its calls
+    can run on any worker thread. The caller's context variables (e.g. the
+    query origin logged with slow queries) are carried into the thread.
+
+    Waits which could block a worker thread are moved to the event loop,
+    as the threads blocked in them could otherwise all be taken while the
+    sessions they wait for need a thread to commit:
+
+    - sessions wait for one of the engine's connection slots before their
+      first call, so pool checkouts never block;
+    - sessions wait for the engine's write lock before they first flush or
+      execute an INSERT, UPDATE or DELETE statement, and hold it until
+      their transaction ends, so only one thread at a time waits for
+      SQLite's own write lock (on other processes' writes).
+    """
+
+    def __init__(
+        self,
+        sync_session: Session,
+        executor: ThreadPoolExecutor,
+        connection_slots: asyncio.Semaphore,
+        slot_timeout: float,
+        write_lock: asyncio.Lock,
+    ) -> None:
+        """
+        Initialise the facade.
+
+        Args:
+            sync_session (Session): The session doing the work.
+            executor (ThreadPoolExecutor): Threads the session's calls run on.
+            connection_slots (asyncio.Semaphore): Counts the connections the
+                engine's pool can hand out.
+            slot_timeout (float): Seconds to wait for a connection slot.
+            write_lock (asyncio.Lock): Held by the engine's writing session.
+        """
+        self.sync_session = sync_session
+        self._executor = executor
+        self._connection_slots = connection_slots
+        self._slot_timeout = slot_timeout
+        self._holds_slot = False
+        self._write_lock = write_lock
+        self._holds_write_lock = False
+
+    async def _run(self, function: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        if not self._holds_slot:
+            try:
+                await asyncio.wait_for(
+                    self._connection_slots.acquire(), self._slot_timeout
+                )
+            except asyncio.TimeoutError as e:
+                raise PoolTimeoutError(
+                    f"No connection available after {self._slot_timeout} s."
+                ) from e
+
+            self._holds_slot = True
+
+        context = contextvars.copy_context()
+        return await asyncio.get_running_loop().run_in_executor(
+            self._executor, partial(context.run, function, *args, **kwargs)
+        )
+
+    async def exec(
+        self,
+        statement: Any,
+        *,
+        params: Optional[Any] = None,
+        execution_options: Optional[Any] = None,
+        **kwargs: Any,
+    ) -> Any:
+        """Execute a statement, returning buffered results."""
+        # e.g. UPDATE ... RETURNING writes without a flush
+        if getattr(statement, "is_dml", False):
+            await self._acquire_write_lock()
+
+        if execution_options:
+            execution_options = util.immutabledict(execution_options).union(
+                _EXECUTE_OPTIONS
+            )
+        else:
+            execution_options = _EXECUTE_OPTIONS
+
+        return await self._run(
+            self.sync_session.exec,
+            statement,
+            params=params,
+            execution_options=execution_options,
+            **kwargs,
+        )
+
+    async def get(self, entity: Any, ident: Any, **kwargs: Any) -> Any:
+        """Return an instance by primary key, or None."""
+        return await self._run(self.sync_session.get, entity, ident, **kwargs)
+
+    def add(self, instance: Any) -> None:
+        """Place an instance in the session; no I/O happens until the flush."""
+        self.sync_session.add(instance)
+
+    async def delete(self, instance: Any) -> None:
+        """Mark an instance as deleted, loading cascaded relationships."""
+        await self._run(self.sync_session.delete, instance)
+
+    async def flush(self) -> None:
+        """Flush pending changes to the database."""
+        await self._acquire_write_lock()
+        await self._run(self.sync_session.flush)
+
+    async def refresh(self, instance: Any, **kwargs: Any) -> None:
+        """Reload an instance's attributes from the database."""
+        await self._run(self.sync_session.refresh, instance, **kwargs)
+
+    async def commit(self) -> None:
+        """Commit the current transaction."""
+        await self._acquire_write_lock()
+
+        try:
+            await self._run(self.sync_session.commit)
+        finally:
+            self._release_write_lock()
+
+    async def rollback(self) -> None:
+        """Roll back the current transaction."""
+        try:
+            await self._run(self.sync_session.rollback)
+        finally:
+            self._release_write_lock()
+
+    async def close(self) -> None:
+        """Close the session, returning its connection to the pool."""
+        if not self._holds_slot:
+            return
+
+        try:
+            await self._run(self.sync_session.close)
+        finally:
+            self._release_write_lock()
+            self._holds_slot = False
+            self._connection_slots.release()
+
+    async def connection(self, **kwargs: Any) -> Any:
+        """Return the session's connection, checking one out if needed."""
+        return await self._run(self.sync_session.connection, **kwargs)
+
+    async def _acquire_write_lock(self) -> None:
+        if self._holds_write_lock:
+            return
+
+        await self._write_lock.acquire()
+        self._holds_write_lock = True
+
+    def _release_write_lock(self) -> None:
+        if self._holds_write_lock:
+            self._holds_write_lock = False
+            self._write_lock.release()
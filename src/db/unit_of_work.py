@@ -0,0 +1,136 @@
+from contextlib import AbstractAsyncContextManager, asynccontextmanager
+from typing import Annotated, AsyncGenerator, Optional, TypeVar
+
+from fastapi import Depends, Request
+from sqlalchemy.exc import OperationalError
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from src.db.database import DatabaseClient, get_database_client
+from src.db.query_logging import track_query_origin
+from src.db.write_batcher import WriteOperation
+from src.db.write_retry import is_lock_contention
+
+# HTTP methods which never modify data, served from the read engine
+READ_ONLY_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+T = TypeVar("T")
+
+
+class UnitOfWork:
+    """
+    Request-scoped session shared by every repository used in a request.
+
+    Exposes the same session interface as DatabaseClient, so repositories
+    accept either. The session is opened on first use, repository writes
+    only flush, and the transaction is committed once when the unit of work
+    exits without an exception (and rolled back otherwise).
+
+    The first write of the unit is retried while the database is locked.
+    SQLite grants the write lock to the first write of a transaction and
+    holds it until the commit, so later writes never wait for it. A commit
+    which still finds the database locked is rolled back and fails with a
+    DatabaseContentionError, as its writes cannot be replayed.
+
+    When the client batches writes, they are handed to its group-commit
+    pipeline instead and are committed before execute_write returns.
+    """
+
+    def __init__(self, db_client: DatabaseClient, read_only: bool = False) -> None:
+        """
+        Initialise the unit of work without opening a session.
+
+        Args:
+            db_client (DatabaseClient): Client providing the sessions.
+            read_only (bool): Bind the session to the read engine.
+        """
+        self._db_client = db_client
+        self.read_only = read_only
+        self._session: Optional[AsyncSession] = None
+        self._has_writes = False
+
+    async def __aenter__(self) -> "UnitOfWork":
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        if self._session is None:
+            return
+
+        try:
+            if exc_type is None and not self.read_only:
+                await self._commit()
+            else:
+                await self._session.rollback()
+        finally:
+            await self._session.close()
+            self._session = None
+            self._has_writes = False
+
+    async def _commit(self) -> None:
+        try:
+            await self._session.commit()
+        except OperationalError as e:
+            if not is_lock_contention(e):
+                raise
+
+            await self._session.rollback()
+            raise self._db_client.write_retry.give_up(e) from e
+
+    @asynccontextmanager
+    async def get_session(self) -> AbstractAsyncContextManager[AsyncSession]:
+        """Provide the shared session for reads and writes."""
+        with track_query_origin():
+            if self._session is None:
+                self._session = await self._db_client.open_session(self.read_only)
+            yield self._session
+
+    # Reads share the request's session so they see its uncommitted writes
+    get_read_session = get_session
+
+    async def execute_write(self, operation: WriteOperation[T]) -> T:
+        """
+        Apply a write to the shared session, deferring the commit to the unit's exit.
+
+        Args:
+            operation (WriteOperation[T]): Applies the write to the given session
+                and returns the caller's result.
+
+        Returns:
+            T: The operation's result.
+
+        Raises:
+            DatabaseContentionError: If the database stayed locked.
+        """
+        if self._db_client.batches_writes:
+            return await self._db_client.execute_write(operation)
+
+        async with self.get_session() as session:
+
+            async def apply_write() -> T:
+                try:
+                    return await operation(session)
+                except Exception:
+                    await session.rollback()
+                    raise
+
+            if self._has_writes:
+                return await apply_write()
+
+            # Rolling back only discards the unit's reads, so the write can be retried
+            result = await self._db_client.write_retry.run(apply_write)
+            self._has_writes = True
+            return result
+
+
+async def get_unit_of_work(
+    request: Request,
+    db_client: Annotated[DatabaseClient, Depends(get_database_client)],
+) -> AsyncGenerator[UnitOfWork, None]:
+    """
+    Dependency provider for a UnitOfWork spanning the current request.
+
+    Safe HTTP methods get a read-only unit of work on the read engine.
+    """
+    read_only = request.method in READ_ONLY_METHODS
+
+    async with UnitOfWork(db_client, read_only=read_only) as unit_of_work:
+        yield unit_of_work
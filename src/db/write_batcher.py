@@ -0,0 +1,147 @@
+import asyncio
+from contextlib import AbstractAsyncContextManager
+from typing import Any, Awaitable, Callable, List, Optional, Tuple, TypeVar
+
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from src.db.write_retry import WriteRetry
+from src.errors.exceptions import DatabaseContentionError
+from src.logger import logger
+
+T = TypeVar("T")
+
+WriteOperation = Callable[[AsyncSession], Awaitable[T]]
+_QueuedWrite = Tuple[WriteOperation, asyncio.Future]
+
+
+class WriteBatcher:
+    """
+    Group commit for repository writes.
+
+    SQLite commits one transaction at a time, each paying for its own fsync.
+    Writes submitted by concurrent requests are instead queued and applied
+    together in a single transaction, which commits when the batch is full or
+    the batch window has passed. Writes arriving while a batch commits form
+    the next batch, which commits straight away.
+
+    Each caller awaits a future resolved with its own operation's result. If
+    any operation in a batch fails, the batch is rolled back and its
+    operations are applied again one per transaction, so a failure is only
+    reported to the caller which caused it. A batch which finds the database
+    locked is retried as a whole, and fails as a whole if it stays locked.
+    """
+
+    def __init__(
+        self,
+        session_scope: Callable[[], AbstractAsyncContextManager[AsyncSession]],
+        max_batch_size: int,
+        max_delay_ms: float,
+        write_retry: Optional[WriteRetry] = None,
+    ) -> None:
+        """
+        Initialise the batcher with an empty queue.
+
+        Args:
+            session_scope (Callable[[], AbstractAsyncContextManager[AsyncSession]]):
+                Opens the session a batch is applied in, e.g. get_session.
+            max_batch_size (int): Operations committed together at most.
+            max_delay_ms (float): Time the first write of a batch waits for more.
+            write_retry (Optional[WriteRetry]): Retries batches which find the
+                database locked. Batches are not retried if omitted.
+        """
+        self._session_scope = session_scope
+        self.max_batch_size = max_batch_size
+        self.max_delay = max_delay_ms / 1000
+        self._write_retry = write_retry
+        self._queue: List[_QueuedWrite] = []
+        self._batch_full = asyncio.Event()
+        self._worker: Optional[asyncio.Task] = None
+
+    async def submit(self, operation: WriteOperation[T]) -> T:
+        """
+        Queue a write and wait for the transaction which applies it to commit.
+
+        Args:
+            operation (WriteOperation[T]): Applies the write to the given session
+                and returns the caller's result. It may run more than once.
+
+        Returns:
+            T: The operation's result.
+        """
+        future = asyncio.get_running_loop().create_future()
+        self._queue.append((operation, future))
+
+        if len(self._queue) >= self.max_batch_size:
+            self._batch_full.set()
+
+        if self._worker is None:
+            self._worker = asyncio.create_task(self._run())
+
+        return await future
+
+    async def _run(self) -> None:
+        try:
+            await self._wait_for_batch()
+
+            while self._queue:
+                batch = self._queue[: self.max_batch_size]
+                del self._queue[: self.max_batch_size]
+                await self._apply(batch)
+        finally:
+            self._worker = None
+
+    async def _wait_for_batch(self) -> None:
+        if len(self._queue) >= self.max_batch_size:
+            return
+
+        self._batch_full.clear()
+
+        try:
+            await asyncio.wait_for(self._batch_full.wait(), self.max_delay)
+        except asyncio.TimeoutError:
+            pass
+
+    async def _apply(self, batch: List[_QueuedWrite]) -> None:
+        async def commit_batch() -> List[Any]:
+            async with self._session_scope() as session:
+                results = [await operation(session) for operation, _ in batch]
+                await session.commit()
+                return results
+
+        try:
+            if self._write_retry is None:
+                results = await commit_batch()
+            else:
+                results = await self._write_retry.run(commit_batch)
+        except DatabaseContentionError as e:
+            # Applying the writes one by one would only contend further
+            for _, future in batch:
+                _resolve(future, exception=e)
+            return
+        except Exception as e:
+            if len(batch) == 1:
+                _resolve(batch[0][1], exception=e)
+                return
+
+            logger.warning(
+                f"Write batch of {len(batch)} failed, applying individually: {str(e)}"
+            )
+            for queued_write in batch:
+                await self._apply([queued_write])
+            return
+
+        for (_, future), result in zip(batch, results):
+            _resolve(future, result=result)
+
+
+def _resolve(
+    future: asyncio.Future, result: Any = None, exception: Optional[Exception] = None
+) -> None:
+    # The caller may have been cancelled (e.g. the client disconnected)
+    if future.done():
+        return
+
+    if exception is not None:
+        future.set_exception(exception)
+    else:
+        future.set_result(result)
@@ -0,0 +1,159 @@
+import asyncio
+import random
+import time
+from typing import Awaitable, Callable, TypeVar
+
+from sqlalchemy.exc import OperationalError
+
+from src.errors.exceptions import DatabaseContentionError
+from src.logger import logger
+from src.schemas.database.contention_stats_output import ContentionStatsOutput
+
+T = TypeVar("T")
+
+# SQLite reports SQLITE_BUSY and SQLITE_LOCKED with these messages
+_LOCK_ERROR_MESSAGES = ("database is locked", "database table is locked")
+
+_BUSY_MESSAGE = "The database is busy. Please retry the request."
+
+
+def is_lock_contention(error: BaseException) -> bool:
+    """
+    Check whether an error was caused by another connection holding the write lock.
+
+    Args:
+        error (BaseException): The error raised by a database operation.
+
+    Returns:
+        bool: True if the operation can be retried once the lock is released.
+    """
+    return isinstance(error, OperationalError) and any(
+        message in str(error.orig) for message in _LOCK_ERROR_MESSAGES
+    )
+
+
+class WriteRetry:
+    """
+    Retries writes which failed because the SQLite database was locked.
+
+    SQLite allows one writer at a time. A busy writer is normally waited for
+    through the busy_timeout pragma, but some conflicts fail at once, e.g.
+    a transaction which read an older snapshot and then tries to write.
+    Such writes are rolled back and retried after an exponential backoff
+    with full jitter, so that bursts of concurrent writers spread out.
+
+    Writes are also retried when busy_timeout expires, as happens to writers
+    starved of the lock during a burst. Retries stop after max_attempts, or
+    when the next backoff would take the write beyond its time budget, which
+    includes the time its attempts spent waiting. The write then fails with
+    a DatabaseContentionError.
+    """
+
+    def __init__(
+        self,
+        max_attempts: int,
+        base_backoff_ms: float,
+        max_backoff_ms: float,
+        budget_ms: float,
+    ) -> None:
+        """
+        Initialise the retry policy with no recorded contention.
+
+        Args:
+            max_attempts (int): Attempts per write, including the first.
+            base_backoff_ms (float): Upper bound of the first backoff.
+            max_backoff_ms (float): Upper bound of any single backoff.
+            budget_ms (float): Time a write may take across all its attempts.
+        """
+        self.max_attempts = max_attempts
+        self.base_backoff = base_backoff_ms / 1000
+        self.max_backoff = max_backoff_ms / 1000
+        self.budget = budget_ms / 1000
+        self.lock_errors = 0
+        self.retries = 0
+        self.give_ups = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    async def run(self, attempt: Callable[[], Awaitable[T]]) -> T:
+        """
+        Run a write, retrying it while the database is locked.
+
+        Args:
+            attempt (Callable[[], Awaitable[T]]): Applies and commits the write.
+                It must leave no partial changes behind when it fails.
+
+        Returns:
+            T: The result of the first successful attempt.
+
+        Raises:
+            DatabaseContentionError: If the database stayed locked.
+        """
+        start = time.perf_counter()
+        attempt_number = 1
+
+        while True:
+            try:
+                return await attempt()
+            except OperationalError as e:
+                if not is_lock_contention(e):
+                    raise
+
+                self.lock_errors += 1
+                backoff = self._backoff(attempt_number)
+                elapsed = time.perf_counter() - start
+
+                if (
+                    attempt_number >= self.max_attempts
+                    or elapsed + backoff > self.budget
+                ):
+                    self.give_ups += 1
+                    logger.warning(
+                        f"Database still locked after {attempt_number} attempts "
+                        f"and {elapsed * 1000:.0f} ms, giving up: {str(e)}"
+                    )
+                    raise DatabaseContentionError(_BUSY_MESSAGE) from e
+
+            await asyncio.sleep(backoff)
+            self.retries += 1
+            self.total_wait += backoff
+            self.max_wait = max(self.max_wait, backoff)
+            attempt_number += 1
+
+    def give_up(self, error: OperationalError) -> DatabaseContentionError:
+        """
+        Record a lock error raised where the write cannot be retried.
+
+        A transaction whose commit failed has to be rolled back, so its writes
+        are lost and only the client can retry them.
+
+        Args:
+            error (OperationalError): The lock error.
+
+        Returns:
+            DatabaseContentionError: The error to raise in its place.
+        """
+        self.lock_errors += 1
+        self.give_ups += 1
+        logger.warning(f"Database locked where writes cannot be retried: {str(error)}")
+
+        return DatabaseContentionError(_BUSY_MESSAGE)
+
+    def _backoff(self, attempt_number: int) -> float:
+        ceiling = min(self.max_backoff, self.base_backoff * 2 ** (attempt_number - 1))
+        return random.uniform(0, ceiling)
+
+    def snapshot(self) -> ContentionStatsOutput:
+        """
+        Report the write lock contention recorded so far.
+
+        Returns:
+            ContentionStatsOutput: Point-in-time contention statistics.
+        """
+        return ContentionStatsOutput(
+            lock_errors=self.lock_errors,
+            retries=self.retries,
+            give_ups=self.give_ups,
+            total_wait_ms=self.total_wait * 1000,
+            max_wait_ms=self.max_wait * 1000,
+        )
@@ -0,0 +1,16 @@
+from enum import Enum
+
+
+class RelationshipLoading(str, Enum):
+    """
+    Enumeration for how the related records of a customer or account are loaded.
+
+    none skips them, selectin reads them with a second query for all the
+    records at once, and joined reads them in the same query. json has SQLite
+    build each record, with its related records nested, as a JSON document.
+    """
+
+    NONE = "none"
+    SELECTIN = "selectin"
+    JOINED = "joined"
+    JSON = "json"
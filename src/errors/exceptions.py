@@ -11,8 +11,12 @@ class BaseException(Exception):
 
     def __init__(self, message):
         self.message = message
-        print(sys.exc_info())
-        current_frame = traceback.extract_tb(sys.exc_info()[2])[-1]
+        exc_traceback = sys.exc_info()[2]
+        if exc_traceback is not None:
+            current_frame = traceback.extract_tb(exc_traceback)[-1]
+        else:
+            # Raised directly rather than while handling another exception
+            current_frame = traceback.extract_stack(limit=2)[0]
         self.line_number = current_frame.lineno
         self.method_name = current_frame.name
 
@@ -26,3 +30,33 @@ class DBConfigError(BaseException):
     """Raised when db configuration fails."""
 
     pass
+
+
+class ShardRoutingError(BaseException):
+    """Raised when a row cannot be routed to a single database shard."""
+
+    pass
+
+
+class DatabaseContentionError(BaseException):
+    """Raised when a write gives up waiting for the database write lock."""
+
+    pass
+
+
+class BackupInProgressError(BaseException):
+    """Raised when a backup is requested while another one is running."""
+
+    pass
+
+
+class FullTableScanError(BaseException):
+    """Raised when a repository query would scan a large table."""
+
+    pass
+
+
+class InvalidCursorError(BaseException):
+    """Raised when a page cursor cannot be decoded."""
+
+    pass
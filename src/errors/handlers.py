@@ -0,0 +1,27 @@
+from fastapi import Request
+from fastapi.responses import JSONResponse
+
+from src.errors.exceptions import DatabaseContentionError
+from src.logger import logger
+from src.utils.constants import SERVICE_UNAVAILABLE
+
+
+async def database_contention_handler(
+    request: Request, exc: DatabaseContentionError
+) -> JSONResponse:
+    """
+    Report a write which gave up on the database lock as a retryable error.
+
+    Args:
+        request (Request): The request which failed.
+        exc (DatabaseContentionError): The error raised by the write.
+
+    Returns:
+        JSONResponse: 503 response asking the client to retry shortly.
+    """
+    logger.error(f"{request.method} {request.url.path} failed: {exc.message}")
+    return JSONResponse(
+        status_code=SERVICE_UNAVAILABLE,
+        content={"detail": exc.message},
+        headers={"Retry-After": "1"},
+    )
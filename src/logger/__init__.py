@@ -16,9 +16,11 @@ def get_logger() -> logging.Logger:
     logger_instance = logging.getLogger(__name__)
 
     LEVEL = (
-        logging.DEBUG if os.getenv("DEBUG", "false").lower == "true" else logging.INFO
+        logging.DEBUG if os.getenv("DEBUG", "false").lower() == "true" else logging.INFO
     )
 
+    logger_instance.setLevel(LEVEL)
+
     handler = logging.StreamHandler(sys.stdout)
     handler.setLevel(LEVEL)
     logger_instance.addHandler(handler)
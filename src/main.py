@@ -5,7 +5,9 @@ from fastapi import FastAPI
 
 from src.api.v1.api import api_router as api_router_v1
 from src.core.settings import get_app_settings
-from src.db.database import get_database_client
+from src.db.database import close_database_client, get_database_client
+from src.errors.exceptions import DatabaseContentionError
+from src.errors.handlers import database_contention_handler
 
 settings = get_app_settings()
 
@@ -14,9 +16,13 @@ settings = get_app_settings()
 async def lifespan(_application: FastAPI) -> AsyncGenerator:
     # Startup
     # Initialise db and create tables
-    await get_database_client()
+    db_client = await get_database_client()
+    # Refresh planner statistics and vacuum free pages at quiet moments
+    db_client.start_maintenance()
     yield
     # Shutdown
+    # Save the in-memory database, if used, and close connections
+    await close_database_client()
 
 
 # Core App Instance
@@ -28,3 +34,4 @@ app = FastAPI(
 )
 
 app.include_router(api_router_v1)
+app.add_exception_handler(DatabaseContentionError, database_contention_handler)
@@ -1,35 +1,71 @@
-import uuid
 from datetime import date, datetime
 
-from sqlalchemy import Column
+from sqlalchemy import DDL, Column, DateTime, FetchedValue, Index, Table, event
+from sqlalchemy.ext.compiler import compiles
 from sqlalchemy.orm import RelationshipProperty
+from sqlalchemy.sql.expression import FunctionElement
 from sqlmodel import TIMESTAMP, Enum, Field, Relationship, SQLModel
 
 from src.enums.account_status import AccountStatus
 from src.enums.currency_code import CurrencyCode
 from src.enums.transaction_status import TransactionStatus
 from src.enums.transaction_type import TransactionType
+from src.models.types import BinaryGuid
+from src.utils.guid_functions import generate_guid
 from src.utils.retrieve_enum_values import get_enum_values
-from src.utils.time_functions import get_current_time
+
+# Current UTC time in the format SQLAlchemy stores datetimes in on SQLite
+# (microseconds; SQLite's clock has millisecond precision).
+_SQLITE_UTC_NOW = "strftime('%Y-%m-%d %H:%M:%f000', 'now')"
+
+
+class UtcNow(FunctionElement):
+    """The current UTC time, as the database's own clock reports it."""
+
+    type = DateTime(timezone=True)
+    inherit_cache = True
+
+
+@compiles(UtcNow)
+def _compile_utc_now(element: UtcNow, compiler, **kw) -> str:
+    return "CURRENT_TIMESTAMP"
+
+
+@compiles(UtcNow, "sqlite")
+def _compile_sqlite_utc_now(element: UtcNow, compiler, **kw) -> str:
+    # CURRENT_TIMESTAMP has no fractional seconds on SQLite
+    return _SQLITE_UTC_NOW
+
+
+UTC_NOW = UtcNow()
 
 
 class CustomerAccountLink(SQLModel, table=True):
     """Linking table for customers and accounts."""
 
+    __table_args__ = (
+        # The primary key leads with customer_guid; loading an account's
+        # customers searches by account_guid, covered by this index.
+        Index("ix_customeraccountlink_account_guid", "account_guid", "customer_guid"),
+        # Rows are stored in the primary key's b-tree, so loading a
+        # customer's accounts reads the link rows without a second lookup.
+        {"sqlite_with_rowid": False},
+    )
+
     created_at: datetime = Field(
-        sa_column=Column(TIMESTAMP(timezone=True), default=get_current_time)
+        sa_column=Column(TIMESTAMP(timezone=True), server_default=UTC_NOW)
     )
     customer_guid: str | None = Field(
-        default=None, foreign_key="customer.guid", primary_key=True
+        default=None, foreign_key="customer.guid", primary_key=True, sa_type=BinaryGuid
     )
     account_guid: str | None = Field(
-        default=None, foreign_key="account.guid", primary_key=True
+        default=None, foreign_key="account.guid", primary_key=True, sa_type=BinaryGuid
     )
     last_updated_at: datetime = Field(
         sa_column=Column(
             TIMESTAMP(timezone=True),
-            default=get_current_time,
-            onupdate=get_current_time,
+            server_default=UTC_NOW,
+            server_onupdate=FetchedValue(),
         )
     )
     is_deleted: bool = Field(default=False)
@@ -38,9 +74,14 @@ class CustomerAccountLink(SQLModel, table=True):
 class Customer(SQLModel, table=True):
     """Customer Entity - parties with at least one banking product."""
 
-    guid: str = Field(nullable=False, primary_key=True)
+    guid: str = Field(
+        nullable=False,
+        primary_key=True,
+        default_factory=generate_guid,
+        sa_type=BinaryGuid,
+    )
     created_at: datetime = Field(
-        sa_column=Column(TIMESTAMP(timezone=True), default=get_current_time)
+        sa_column=Column(TIMESTAMP(timezone=True), server_default=UTC_NOW)
     )
     first_name: str = Field(max_length=255)
     middle_names: str | None = Field(default=None, max_length=200)
@@ -52,8 +93,8 @@ class Customer(SQLModel, table=True):
     last_updated_at: datetime = Field(
         sa_column=Column(
             TIMESTAMP(timezone=True),
-            default=get_current_time,
-            onupdate=get_current_time,
+            server_default=UTC_NOW,
+            server_onupdate=FetchedValue(),
         )
     )
     is_deleted: bool = Field(default=False)
@@ -68,9 +109,14 @@ class Customer(SQLModel, table=True):
 class Account(SQLModel, table=True):
     """Account entity - bank accounts."""
 
-    guid: str = Field(nullable=False, primary_key=True)
+    guid: str = Field(
+        nullable=False,
+        primary_key=True,
+        default_factory=generate_guid,
+        sa_type=BinaryGuid,
+    )
     created_at: datetime = Field(
-        sa_column=Column(TIMESTAMP(timezone=True), default=get_current_time)
+        sa_column=Column(TIMESTAMP(timezone=True), server_default=UTC_NOW)
     )
     account_name: str = Field(max_length=100)
     status: AccountStatus = Field(
@@ -79,8 +125,8 @@ class Account(SQLModel, table=True):
     last_updated_at: datetime = Field(
         sa_column=Column(
             TIMESTAMP(timezone=True),
-            default=get_current_time,
-            onupdate=get_current_time,
+            server_default=UTC_NOW,
+            server_onupdate=FetchedValue(),
         )
     )
     is_deleted: bool = Field(default=False)
@@ -111,21 +157,45 @@ class Account(SQLModel, table=True):
 class Transaction(SQLModel, table=True):
     """Transaction Entity - captures financial activity between accounts."""
 
-    guid: str = Field(nullable=False, primary_key=True, default_factory=uuid.uuid4)
+    __table_args__ = (
+        # Each account's transactions (and foreign key checks on account
+        # deletes), in date order for statement history.
+        Index(
+            "ix_transaction_creditor_account_transaction_date",
+            "creditor_account",
+            "transaction_date",
+        ),
+        Index(
+            "ix_transaction_debtor_account_transaction_date",
+            "debtor_account",
+            "transaction_date",
+        ),
+    )
+
+    guid: str = Field(
+        nullable=False,
+        primary_key=True,
+        default_factory=generate_guid,
+        sa_type=BinaryGuid,
+    )
     created_at: datetime = Field(
-        sa_column=Column(TIMESTAMP(timezone=True), default=get_current_time)
+        sa_column=Column(TIMESTAMP(timezone=True), server_default=UTC_NOW)
     )
     transaction_type: TransactionType = Field(
         sa_column=Column(Enum(TransactionType, values_callable=get_enum_values))
     )
-    creditor_account: str = Field(default=None, foreign_key="account.guid")
-    debtor_account: str = Field(default=None, foreign_key="account.guid")
+    creditor_account: str = Field(
+        default=None, foreign_key="account.guid", sa_type=BinaryGuid
+    )
+    debtor_account: str = Field(
+        default=None, foreign_key="account.guid", sa_type=BinaryGuid
+    )
     amount: int
     currency: CurrencyCode = Field(
         sa_column=Column(Enum(CurrencyCode, values_callable=get_enum_values))
     )
     transaction_date: datetime = Field(
-        sa_column=Column(TIMESTAMP(timezone=True), default=get_current_time)
+        sa_column=Column(TIMESTAMP(timezone=True), server_default=UTC_NOW)
     )
     transaction_status: TransactionStatus = Field(
         sa_column=Column(Enum(TransactionStatus, values_callable=get_enum_values))
@@ -133,8 +203,8 @@ class Transaction(SQLModel, table=True):
     last_updated_at: datetime = Field(
         sa_column=Column(
             TIMESTAMP(timezone=True),
-            default=get_current_time,
-            onupdate=get_current_time,
+            server_default=UTC_NOW,
+            server_onupdate=FetchedValue(),
         )
     )
     is_deleted: bool = Field(default=False)
@@ -154,3 +224,44 @@ class Transaction(SQLModel, table=True):
             foreign_keys="[Transaction.debtor_account]",
         )
     )
+
+
+def last_updated_at_trigger(table: Table) -> str:
+    """
+    Build the trigger which stamps last_updated_at on every update of a table.
+
+    Updates which set last_updated_at themselves keep their value.
+
+    Args:
+        table (Table): A table with a last_updated_at column.
+
+    Returns:
+        str: The CREATE TRIGGER statement.
+    """
+    row = " AND ".join(
+        f"{column.name} = NEW.{column.name}" for column in table.primary_key.columns
+    )
+    return (
+        f"CREATE TRIGGER IF NOT EXISTS trg_{table.name}_last_updated_at "
+        f'AFTER UPDATE ON "{table.name}" FOR EACH ROW '
+        "WHEN NEW.last_updated_at IS OLD.last_updated_at BEGIN "
+        f'UPDATE "{table.name}" SET last_updated_at = ({_SQLITE_UTC_NOW}) WHERE {row}; '
+        "END"
+    )
+
+
+def _add_triggers(table: Table, *triggers: str) -> None:
+    # Listed in the table's info for the schema fingerprint, and created
+    # along with the table (DDL() formats its statement, so % is escaped).
+    table.info["triggers"] = list(triggers)
+
+    for trigger in triggers:
+        event.listen(
+            table,
+            "after_create",
+            DDL(trigger.replace("%", "%%")).execute_if(dialect="sqlite"),
+        )
+
+
+for model in (CustomerAccountLink, Customer, Account, Transaction):
+    _add_triggers(model.__table__, last_updated_at_trigger(model.__table__))
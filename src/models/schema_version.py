@@ -0,0 +1,21 @@
+from datetime import datetime
+
+from sqlalchemy import Column
+from sqlmodel import TIMESTAMP, Field, SQLModel
+
+from src.utils.time_functions import get_current_time
+
+
+class SchemaVersion(SQLModel, table=True):
+    """Single-row record of the last applied migration and the schema fingerprint."""
+
+    id: int = Field(default=1, primary_key=True)
+    version: str = Field(max_length=50)
+    fingerprint: str = Field(max_length=64)
+    applied_at: datetime = Field(
+        sa_column=Column(
+            TIMESTAMP(timezone=True),
+            default=get_current_time,
+            onupdate=get_current_time,
+        )
+    )
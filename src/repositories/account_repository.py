@@ -1,70 +1,245 @@
-from typing import Annotated, List, Optional, Type
+from collections import defaultdict
+from typing import Annotated, List, Optional, Sequence, Type
 
 from fastapi import Depends
+from sqlalchemy import Row, bindparam, func, update
 from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
 
-from src.db.database import DatabaseClient, get_database_client
+from src.db.json_documents import json_object
+from src.db.statement_cache import statement_cache
+from src.db.unit_of_work import UnitOfWork, get_unit_of_work
+from src.enums.relationship_loading import RelationshipLoading
 from src.logger import logger
-from src.models.banking_models import Account
+from src.models.banking_models import UTC_NOW, Account, Customer, CustomerAccountLink
 from src.repositories.base import AbstractRepository
+from src.schemas.account.account_base import AccountBase
 from src.schemas.account.account_output import AccountOutput
 from src.schemas.account.account_update import AccountUpdate
+from src.schemas.customer.customer_base import CustomerBase
 from src.schemas.customer.customer_output import CustomerOutput
 
+# Hot lookups, built once and reused on every call
+_ACCOUNT_EXISTS = statement_cache.add(
+    "account_exists",
+    select(Account.guid).where(Account.guid == bindparam("guid")).limit(1),
+)
+
+# Listings and details read only the columns of the output schemas, as rows,
+# so no ORM entities are built and tracked just to be copied into DTOs
+_ACCOUNT_COLUMNS = [getattr(Account, name) for name in AccountBase.model_fields]
+_CUSTOMER_COLUMNS = [getattr(Customer, name) for name in CustomerBase.model_fields]
+
+_ACCOUNT_ROW_BY_GUID = statement_cache.add(
+    "account_row_by_guid",
+    select(*_ACCOUNT_COLUMNS).where(Account.guid == bindparam("guid")),
+)
+_ACCOUNT_PAGE = statement_cache.add(
+    "account_page",
+    select(*_ACCOUNT_COLUMNS)
+    .where(Account.guid > bindparam("after"))
+    .order_by(Account.guid)
+    .limit(bindparam("limit")),
+)
+_ACCOUNT_CUSTOMER_ROWS = statement_cache.add(
+    "account_customer_rows",
+    select(CustomerAccountLink.account_guid, *_CUSTOMER_COLUMNS)
+    .join(Customer, Customer.guid == CustomerAccountLink.customer_guid)
+    .where(CustomerAccountLink.account_guid.in_(bindparam("guids", expanding=True))),
+)
+
+# Joined loads repeat an account's columns on a row per customer, followed by
+# the customer's columns (prefixed, to keep them apart), or NULLs if it has none
+_JOINED_CUSTOMER_COLUMNS = [
+    column.label(f"customer_{column.key}") for column in _CUSTOMER_COLUMNS
+]
+_ACCOUNT_ROW_BY_GUID_JOINED = statement_cache.add(
+    "account_row_by_guid_joined",
+    select(*_ACCOUNT_COLUMNS, *_JOINED_CUSTOMER_COLUMNS)
+    .outerjoin(CustomerAccountLink, CustomerAccountLink.account_guid == Account.guid)
+    .outerjoin(Customer, Customer.guid == CustomerAccountLink.customer_guid)
+    .where(Account.guid == bindparam("guid")),
+)
+# The page is limited in a subquery, so that the limit counts accounts
+_account_page = _ACCOUNT_PAGE.subquery()
+_ACCOUNT_PAGE_JOINED = statement_cache.add(
+    "account_page_joined",
+    select(_account_page, *_JOINED_CUSTOMER_COLUMNS)
+    .outerjoin(
+        CustomerAccountLink, CustomerAccountLink.account_guid == _account_page.c.guid
+    )
+    .outerjoin(Customer, Customer.guid == CustomerAccountLink.customer_guid),
+)
+
+# Documents are built by SQLite's JSON functions: each account is read as one
+# JSON text, with its customers nested, ready to be returned as it is
+_account_customers_json = (
+    select(func.json_group_array(json_object(_CUSTOMER_COLUMNS)))
+    .select_from(CustomerAccountLink)
+    .join(Customer, Customer.guid == CustomerAccountLink.customer_guid)
+    .where(CustomerAccountLink.account_guid == Account.guid)
+    .scalar_subquery()
+)
+_ACCOUNT_DOCUMENT = json_object(
+    _ACCOUNT_COLUMNS, customers=_account_customers_json
+).label("document")
+_ACCOUNT_DOCUMENT_BY_GUID = statement_cache.add(
+    "account_document_by_guid",
+    select(Account.guid, _ACCOUNT_DOCUMENT).where(Account.guid == bindparam("guid")),
+)
+_ACCOUNT_DOCUMENT_PAGE = statement_cache.add(
+    "account_document_page",
+    select(Account.guid, _ACCOUNT_DOCUMENT)
+    .where(Account.guid > bindparam("after"))
+    .order_by(Account.guid)
+    .limit(bindparam("limit")),
+)
+
+# Sorts before every 16-byte guid, so the first page is also a range search
+_FIRST_PAGE = b""
+
 
 class AccountRepository(AbstractRepository):
     """
     Repository class for handling accounts.
     """
 
-    async def get_all(self) -> List[Optional[AccountOutput]]:
+    async def get_page(
+        self,
+        after: Optional[str],
+        limit: int,
+        include: RelationshipLoading = RelationshipLoading.SELECTIN,
+    ) -> List[AccountOutput]:
         """
-        Retrieves all accounts.
+        Retrieves a page of accounts in guid order.
+
+        Each page is a range search of the primary key, starting after the
+        last guid of the previous page, so its cost does not grow with the
+        number of pages before it.
+
+        Args:
+            after (Optional[str]): The last guid of the previous page, or None
+                for the first page.
+            limit (int): The maximum number of accounts to return.
+            include (RelationshipLoading): How the accounts' customers are loaded.
 
         Returns:
-            List[Optional[AccountOutput]]: List of all accounts.
+            List[AccountOutput]: The accounts following the given guid.
         """
-        async with self._db.get_session() as session:
-            accounts = await session.exec(select(Account))
-            accounts_list = accounts.fetchall()
+        statement = (
+            _ACCOUNT_PAGE_JOINED
+            if include is RelationshipLoading.JOINED
+            else _ACCOUNT_PAGE
+        )
 
-            return self.__map_account_to_schema(accounts_list)
+        async with self._db.get_read_session() as session:
+            result = await session.exec(
+                statement, params={"after": after or _FIRST_PAGE, "limit": limit}
+            )
+            accounts = await self.__map_rows_to_schema(
+                session, result.fetchall(), include
+            )
+
+            # Sharded reads concatenate a page from every shard
+            return sorted(accounts, key=lambda account: account.guid)[:limit]
 
-    async def get_by_guid(self, guid: str) -> List[AccountOutput]:
+    async def find_by_guid(
+        self, guid: str, include: RelationshipLoading = RelationshipLoading.SELECTIN
+    ) -> Optional[AccountOutput]:
         """
-        Retrieves account by guid.
+        Retrieves account by guid, or None if there is no such account.
 
         Args:
             guid (UUID4): Unique identifier for the account record.
+            include (RelationshipLoading): How the account's customers are loaded.
 
         Returns:
-            List[AccountOutput]: List containing Account record with specified guid.
+            Optional[AccountOutput]: The account with specified guid, if it exists.
         """
-        async with self._db.get_session() as session:
-            filtered_account = await session.get(Account, guid)
+        statement = (
+            _ACCOUNT_ROW_BY_GUID_JOINED
+            if include is RelationshipLoading.JOINED
+            else _ACCOUNT_ROW_BY_GUID
+        )
+
+        async with self._db.get_read_session() as session:
+            result = await session.exec(statement, params={"guid": guid})
+            accounts = await self.__map_rows_to_schema(
+                session, result.fetchall(), include
+            )
 
-            return self.__map_account_to_schema([filtered_account])
+            return accounts[0] if accounts else None
 
-    async def update(self, guid: str, data: AccountUpdate) -> List[AccountOutput]:
+    async def get_page_documents(self, after: Optional[str], limit: int) -> List[Row]:
+        """
+        Retrieves a page of accounts in guid order, as JSON documents.
+
+        Each document nests the account's customers and is built by a single
+        statement, serialised like AccountOutput.
+
+        Args:
+            after (Optional[str]): The last guid of the previous page, or None
+                for the first page.
+            limit (int): The maximum number of accounts to return.
+
+        Returns:
+            List[Row]: Rows of each account's guid and its JSON document.
+        """
+        async with self._db.get_read_session() as session:
+            result = await session.exec(
+                _ACCOUNT_DOCUMENT_PAGE,
+                params={"after": after or _FIRST_PAGE, "limit": limit},
+            )
+
+            # Sharded reads concatenate a page from every shard
+            return sorted(result.fetchall(), key=lambda row: row.guid)[:limit]
+
+    async def find_document_by_guid(self, guid: str) -> Optional[str]:
+        """
+        Retrieves an account's JSON document by guid, or None if it does not exist.
+
+        Args:
+            guid (str): Unique identifer for the account record.
+
+        Returns:
+            Optional[str]: The account's JSON document, with its customers nested.
+        """
+        async with self._db.get_read_session() as session:
+            result = await session.exec(
+                _ACCOUNT_DOCUMENT_BY_GUID, params={"guid": guid}
+            )
+            row = result.first()
+
+            return row.document if row else None
+
+    async def update(self, guid: str, data: AccountUpdate) -> Optional[AccountOutput]:
         """
         Updates an account.
 
+        The row is updated and read back by a single UPDATE ... RETURNING
+        statement, so neither an existence check nor a refresh is needed.
+
         Args:
             guid (UUID4): The ID of the account to be updated.
             data (AccountUpdate): The updated account data.
 
         Returns:
-            List[AccountOutput]: List of updated account data.
+            Optional[AccountOutput]: The updated account, or None if it does not exist.
         """
-        async with self._db.get_session() as session:
-            account_db = await session.get(Account, guid)
-            updated_data_dict = data.model_dump(exclude_unset=True)
-            account_db.sqlmodel_update(updated_data_dict)
-            session.add(account_db)
-            await session.commit()
-            await session.refresh(account_db)
 
-            return self.__map_account_to_schema([account_db])
+        async def update_account(session: AsyncSession) -> Optional[AccountOutput]:
+            result = await session.exec(
+                update(Account)
+                .where(Account.guid == guid)
+                # RETURNING does not see values written by the update trigger
+                .values(**data.model_dump(exclude_unset=True), last_updated_at=UTC_NOW)
+                .returning(Account)
+            )
+            account = result.scalars().first()
+
+            return self.__map_account_to_schema([account])[0] if account else None
+
+        return await self._db.execute_write(update_account)
 
     async def delete(self, guid: str) -> bool:
         """
@@ -76,17 +251,20 @@ class AccountRepository(AbstractRepository):
         Returns:
             bool: True if deletion was successful, False otherwise.
         """
-        async with self._db.get_session() as session:
-            try:
-                account = await session.get(Account, guid)
-                await session.delete(account)
-                await session.commit()
-                return True
-            except Exception as e:
-                logger.exception(
-                    f"Unexpected error in deletion of account {guid}: {str(e)}"
-                )
-                return False
+
+        async def delete_account(session: AsyncSession) -> bool:
+            account = await session.get(Account, guid)
+            await session.delete(account)
+            await session.flush()
+            return True
+
+        try:
+            return await self._db.execute_write(delete_account)
+        except Exception as e:
+            logger.exception(
+                f"Unexpected error in deletion of account {guid}: {str(e)}"
+            )
+            return False
 
     async def account_exists_by_guid(self, guid: str) -> bool:
         """
@@ -98,15 +276,76 @@ class AccountRepository(AbstractRepository):
         Returns:
             bool: True if the account exists, False otherwise.
         """
-        async with self._db.get_session() as session:
-            account_result = await session.exec(
-                select(Account).where(Account.guid == guid)
-            )
+        async with self._db.get_read_session() as session:
+            account_result = await session.exec(_ACCOUNT_EXISTS, params={"guid": guid})
 
             account = account_result.fetchall()
 
             return bool(account)
 
+    @staticmethod
+    async def __map_rows_to_schema(
+        session: AsyncSession,
+        account_rows: Sequence[Row],
+        include: RelationshipLoading,
+    ) -> List[AccountOutput]:
+        """
+        Map account rows to AccountOutput schema, with their customers.
+
+        Args:
+            session (AsyncSession): The session the account rows were read in.
+            account_rows (Sequence[Row]): Rows of the AccountBase columns,
+                followed by their customers' columns if the load is joined.
+            include (RelationshipLoading): How the accounts' customers are loaded.
+
+        Returns:
+            List[AccountOutput]: List of AccountOutput instances.
+        """
+        customers = defaultdict(list)
+
+        if include is RelationshipLoading.JOINED:
+            unique_rows = {}
+            for row in account_rows:
+                unique_rows.setdefault(row.guid, row)
+                if row.customer_guid is not None:
+                    customers[row.guid].append(
+                        CustomerOutput(
+                            guid=row.customer_guid,
+                            first_name=row.customer_first_name,
+                            middle_names=row.customer_middle_names,
+                            last_name=row.customer_last_name,
+                            date_of_birth=row.customer_date_of_birth,
+                            phone_number=row.customer_phone_number,
+                            email_address=row.customer_email_address,
+                            address=row.customer_address,
+                        )
+                    )
+            account_rows = list(unique_rows.values())
+
+        elif include is RelationshipLoading.SELECTIN and account_rows:
+            customer_rows = await session.exec(
+                _ACCOUNT_CUSTOMER_ROWS,
+                params={"guids": [account.guid for account in account_rows]},
+            )
+            for customer in customer_rows:
+                customers[customer.account_guid].append(
+                    CustomerOutput(
+                        guid=customer.guid,
+                        first_name=customer.first_name,
+                        middle_names=customer.middle_names,
+                        last_name=customer.last_name,
+                        date_of_birth=customer.date_of_birth,
+                        phone_number=customer.phone_number,
+                        email_address=customer.email_address,
+                        address=customer.address,
+                    )
+                )
+
+        return [
+            AccountOutput(**account._mapping, customers=customers[account.guid])
+            for account in account_rows
+        ]
+
     @staticmethod
     def __map_account_to_schema(accounts: List[Type[Account]]) -> List[AccountOutput]:
         """
@@ -142,7 +381,7 @@ class AccountRepository(AbstractRepository):
 
 
 async def get_account_repository(
-    db_client: Annotated[DatabaseClient, Depends(get_database_client)]
+    unit_of_work: Annotated[UnitOfWork, Depends(get_unit_of_work)]
 ) -> AccountRepository:
-    """Dependency provider for AccountRepository."""
-    return AccountRepository(db=db_client)
+    """Dependency provider for AccountRepository, scoped to the current request."""
+    return AccountRepository(db=unit_of_work)
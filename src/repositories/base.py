@@ -1,10 +1,11 @@
 import uuid
 from abc import ABC, abstractmethod
-from typing import Generic, List, TypeVar
+from typing import Generic, List, Optional, TypeVar
 
 from sqlmodel import Session
 
 from src.db.database import DatabaseClient
+from src.db.unit_of_work import UnitOfWork
 
 
 # T (from Python 3.12 is throwing errors)
@@ -21,34 +22,39 @@ class AbstractRepository[T](ABC):  # noqa: E999
     Base repository class to be used for all repositories which require all methods.
     """
 
-    def __init__(self, db: DatabaseClient):
+    def __init__(self, db: DatabaseClient | UnitOfWork):
         """
         Initialises the repository with a database connection pool.
 
         Args:
-            db (DatabaseClient): An instance of the db connection pool.
+            db (DatabaseClient | UnitOfWork): The db connection pool, or a
+                unit of work sharing one session across a request.
         """
         self._db = db
 
     @abstractmethod
-    def get_by_guid(self, guid: uuid.UUID) -> ModelType:
+    def find_by_guid(self, guid: uuid.UUID) -> Optional[ModelType]:
         """
-        Retrieves data for a given object from the database.
+        Retrieves data for a given object from the database, if it exists.
         The exact object is specified upon implementation.
 
         Args:
             guid (uuid.UUID): ID for the given object.
 
         Returns:
-            T: The domain object.
+            Optional[T]: The domain object, or None.
         """
         raise NotImplementedError
 
-    def get_all(self) -> List[ModelType]:
+    def get_page(self, after: Optional[str], limit: int) -> List[ModelType]:
         """
-        Retrieves data from the database as domain objects.
+        Retrieves a page of domain objects ordered by guid.
         The exact object type is specified upon implementation.
 
+        Args:
+            after (Optional[str]): The last guid of the previous page, or None.
+            limit (int): The maximum number of objects in the page.
+
         Returns:
             List[T]: A list of domain objects
         """
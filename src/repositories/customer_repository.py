@@ -1,51 +1,222 @@
-from typing import Annotated, List, Optional, Type
+from collections import defaultdict
+from typing import Annotated, List, Optional, Sequence, Type
 
 from fastapi import Depends
+from sqlalchemy import Row, bindparam, func, update
 from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
 
-from src.db.database import DatabaseClient, get_database_client
+from src.db.json_documents import json_object
+from src.db.statement_cache import statement_cache
+from src.db.unit_of_work import UnitOfWork, get_unit_of_work
+from src.enums.relationship_loading import RelationshipLoading
 from src.logger import logger
-from src.models.banking_models import Account, Customer
+from src.models.banking_models import UTC_NOW, Account, Customer, CustomerAccountLink
 from src.repositories.base import AbstractAllRepository
+from src.schemas.account.account_base import AccountBase
 from src.schemas.account.account_input import AccountInput
 from src.schemas.account.account_output import AccountOutput
+from src.schemas.customer.customer_base import CustomerBase
 from src.schemas.customer.customer_input import CustomerInput
 from src.schemas.customer.customer_output import CustomerOutput
 from src.schemas.customer.customer_update import CustomerUpdate
 
+# Hot lookups, built once and reused on every call
+_CUSTOMER_EXISTS = statement_cache.add(
+    "customer_exists",
+    select(Customer.guid).where(Customer.guid == bindparam("guid")).limit(1),
+)
+
+# Listings and details read only the columns of the output schemas, as rows,
+# so no ORM entities are built and tracked just to be copied into DTOs
+_CUSTOMER_COLUMNS = [getattr(Customer, name) for name in CustomerBase.model_fields]
+_ACCOUNT_COLUMNS = [getattr(Account, name) for name in AccountBase.model_fields]
+
+_CUSTOMER_ROW_BY_GUID = statement_cache.add(
+    "customer_row_by_guid",
+    select(*_CUSTOMER_COLUMNS).where(Customer.guid == bindparam("guid")),
+)
+_CUSTOMER_PAGE = statement_cache.add(
+    "customer_page",
+    select(*_CUSTOMER_COLUMNS)
+    .where(Customer.guid > bindparam("after"))
+    .order_by(Customer.guid)
+    .limit(bindparam("limit")),
+)
+_CUSTOMER_ACCOUNT_ROWS = statement_cache.add(
+    "customer_account_rows",
+    select(CustomerAccountLink.customer_guid, *_ACCOUNT_COLUMNS)
+    .join(Account, Account.guid == CustomerAccountLink.account_guid)
+    .where(CustomerAccountLink.customer_guid.in_(bindparam("guids", expanding=True))),
+)
+
+# Joined loads repeat a customer's columns on a row per account, followed by
+# the account's columns (prefixed, to keep them apart), or NULLs if it has none
+_JOINED_ACCOUNT_COLUMNS = [
+    column.label(f"account_{column.key}") for column in _ACCOUNT_COLUMNS
+]
+_CUSTOMER_ROW_BY_GUID_JOINED = statement_cache.add(
+    "customer_row_by_guid_joined",
+    select(*_CUSTOMER_COLUMNS, *_JOINED_ACCOUNT_COLUMNS)
+    .outerjoin(CustomerAccountLink, CustomerAccountLink.customer_guid == Customer.guid)
+    .outerjoin(Account, Account.guid == CustomerAccountLink.account_guid)
+    .where(Customer.guid == bindparam("guid")),
+)
+# The page is limited in a subquery, so that the limit counts customers
+_customer_page = _CUSTOMER_PAGE.subquery()
+_CUSTOMER_PAGE_JOINED = statement_cache.add(
+    "customer_page_joined",
+    select(_customer_page, *_JOINED_ACCOUNT_COLUMNS)
+    .outerjoin(
+        CustomerAccountLink, CustomerAccountLink.customer_guid == _customer_page.c.guid
+    )
+    .outerjoin(Account, Account.guid == CustomerAccountLink.account_guid),
+)
+
+# Documents are built by SQLite's JSON functions: each customer is read as one
+# JSON text, with its accounts nested, ready to be returned as it is
+_customer_accounts_json = (
+    select(
+        func.json_group_array(
+            json_object(_ACCOUNT_COLUMNS, customers=func.json_array())
+        )
+    )
+    .select_from(CustomerAccountLink)
+    .join(Account, Account.guid == CustomerAccountLink.account_guid)
+    .where(CustomerAccountLink.customer_guid == Customer.guid)
+    .scalar_subquery()
+)
+_CUSTOMER_DOCUMENT = json_object(
+    _CUSTOMER_COLUMNS, accounts=_customer_accounts_json
+).label("document")
+_CUSTOMER_DOCUMENT_BY_GUID = statement_cache.add(
+    "customer_document_by_guid",
+    select(Customer.guid, _CUSTOMER_DOCUMENT).where(Customer.guid == bindparam("guid")),
+)
+_CUSTOMER_DOCUMENT_PAGE = statement_cache.add(
+    "customer_document_page",
+    select(Customer.guid, _CUSTOMER_DOCUMENT)
+    .where(Customer.guid > bindparam("after"))
+    .order_by(Customer.guid)
+    .limit(bindparam("limit")),
+)
+
+# Sorts before every 16-byte guid, so the first page is also a range search
+_FIRST_PAGE = b""
+
 
 class CustomerRepository(AbstractAllRepository):
     """
     Repository class for handling customers.
     """
 
-    async def get_all(self) -> List[Optional[CustomerOutput]]:
+    async def get_page(
+        self,
+        after: Optional[str],
+        limit: int,
+        include: RelationshipLoading = RelationshipLoading.SELECTIN,
+    ) -> List[CustomerOutput]:
+        """
+        Retrieves a page of customers in guid order.
+
+        Each page is a range search of the primary key, starting after the
+        last guid of the previous page, so its cost does not grow with the
+        number of pages before it.
+
+        Args:
+            after (Optional[str]): The last guid of the previous page, or None
+                for the first page.
+            limit (int): The maximum number of customers to return.
+            include (RelationshipLoading): How the customers' accounts are loaded.
+
+        Returns:
+            List[CustomerOutput]: The customers following the given guid.
+        """
+        statement = (
+            _CUSTOMER_PAGE_JOINED
+            if include is RelationshipLoading.JOINED
+            else _CUSTOMER_PAGE
+        )
+
+        async with self._db.get_read_session() as session:
+            result = await session.exec(
+                statement, params={"after": after or _FIRST_PAGE, "limit": limit}
+            )
+            customers = await self.__map_rows_to_schema(
+                session, result.fetchall(), include
+            )
+
+            # Sharded reads concatenate a page from every shard
+            return sorted(customers, key=lambda customer: customer.guid)[:limit]
+
+    async def find_by_guid(
+        self, guid: str, include: RelationshipLoading = RelationshipLoading.SELECTIN
+    ) -> Optional[CustomerOutput]:
+        """
+        Retrieves customer by guid, or None if there is no such customer.
+
+        Args:
+            guid (str): Unique identifer for the customer record.
+            include (RelationshipLoading): How the customer's accounts are loaded.
+
+        Returns:
+            Optional[CustomerOutput]: The customer with specified guid, if it exists.
+        """
+        statement = (
+            _CUSTOMER_ROW_BY_GUID_JOINED
+            if include is RelationshipLoading.JOINED
+            else _CUSTOMER_ROW_BY_GUID
+        )
+
+        async with self._db.get_read_session() as session:
+            result = await session.exec(statement, params={"guid": guid})
+            customers = await self.__map_rows_to_schema(
+                session, result.fetchall(), include
+            )
+
+            return customers[0] if customers else None
+
+    async def get_page_documents(self, after: Optional[str], limit: int) -> List[Row]:
         """
-        Retrieves all customers.
+        Retrieves a page of customers in guid order, as JSON documents.
+
+        Each document nests the customer's accounts and is built by a single
+        statement, serialised like CustomerOutput.
+
+        Args:
+            after (Optional[str]): The last guid of the previous page, or None
+                for the first page.
+            limit (int): The maximum number of customers to return.
 
         Returns:
-            List[Optional[CustomerOutput]]: List of all customers.
+            List[Row]: Rows of each customer's guid and its JSON document.
         """
-        async with self._db.get_session() as session:
-            customers = await session.exec(select(Customer))
-            customers_list = customers.fetchall()
+        async with self._db.get_read_session() as session:
+            result = await session.exec(
+                _CUSTOMER_DOCUMENT_PAGE,
+                params={"after": after or _FIRST_PAGE, "limit": limit},
+            )
 
-            return self.__map_customer_to_schema(customers_list)
+            # Sharded reads concatenate a page from every shard
+            return sorted(result.fetchall(), key=lambda row: row.guid)[:limit]
 
-    async def get_by_guid(self, guid: str) -> List[CustomerOutput]:
+    async def find_document_by_guid(self, guid: str) -> Optional[str]:
         """
-        Retrieves customer by guid.
+        Retrieves a customer's JSON document by guid, or None if it does not exist.
 
         Args:
             guid (str): Unique identifer for the customer record.
 
         Returns:
-            List[CustomerOutput]: List containing Customer record with specified guid.
+            Optional[str]: The customer's JSON document, with its accounts nested.
         """
-        async with self._db.get_session() as session:
-            filtered_customer = await session.get(Customer, guid)
+        async with self._db.get_read_session() as session:
+            result = await session.exec(
+                _CUSTOMER_DOCUMENT_BY_GUID, params={"guid": guid}
+            )
+            row = result.first()
 
-            return self.__map_customer_to_schema([filtered_customer])
+            return row.document if row else None
 
     async def create(self, data: CustomerInput, account_data: AccountInput) -> Customer:
         """
@@ -58,37 +229,49 @@ class CustomerRepository(AbstractAllRepository):
         Returns:
             Customer: The created customer.
         """
-        async with self._db.get_session() as session:
+
+        async def create_customer(session: AsyncSession) -> List[CustomerOutput]:
             new_customer = Customer(**data.model_dump())
             new_account = Account(**account_data.model_dump())
             new_customer.accounts = [new_account]
 
             session.add(new_customer)
-            await session.commit()
+            await session.flush()
             await session.refresh(new_customer)
 
             return self.__map_customer_to_schema([new_customer])
 
-    async def update(self, guid: str, data: CustomerUpdate) -> List[CustomerOutput]:
+        return await self._db.execute_write(create_customer)
+
+    async def update(self, guid: str, data: CustomerUpdate) -> Optional[CustomerOutput]:
         """
         Updates a customer.
 
+        The row is updated and read back by a single UPDATE ... RETURNING
+        statement, so neither an existence check nor a refresh is needed.
+
         Args:
             guid (str): The ID of the customer to be updated.
             data (CustomerUpdate): The updated customer data.
 
         Returns:
-            List[CustomerOutput]: List of updated customer data.
+            Optional[CustomerOutput]: The updated customer, or None if it does
+                not exist.
         """
-        async with self._db.get_session() as session:
-            customer_db = await session.get(Customer, guid)
-            updated_data_dict = data.model_dump(exclude_unset=True)
-            customer_db.sqlmodel_update(updated_data_dict)
-            session.add(customer_db)
-            await session.commit()
-            await session.refresh(customer_db)
 
-            return self.__map_customer_to_schema([customer_db])
+        async def update_customer(session: AsyncSession) -> Optional[CustomerOutput]:
+            result = await session.exec(
+                update(Customer)
+                .where(Customer.guid == guid)
+                # RETURNING does not see values written by the update trigger
+                .values(**data.model_dump(exclude_unset=True), last_updated_at=UTC_NOW)
+                .returning(Customer)
+            )
+            customer = result.scalars().first()
+
+            return self.__map_customer_to_schema([customer])[0] if customer else None
+
+        return await self._db.execute_write(update_customer)
 
     async def delete(self, guid: str) -> bool:
         """
@@ -100,17 +283,20 @@ class CustomerRepository(AbstractAllRepository):
         Returns:
             bool: True if deletion was successful, False otherwise.
         """
-        async with self._db.get_session() as session:
-            try:
-                customer = await session.get(Customer, guid)
-                await session.delete(customer)
-                await session.commit()
-                return True
-            except Exception as e:
-                logger.exception(
-                    f"Unexpected error in deletion of customer {guid}: {str(e)}"
-                )
-                return False
+
+        async def delete_customer(session: AsyncSession) -> bool:
+            customer = await session.get(Customer, guid)
+            await session.delete(customer)
+            await session.flush()
+            return True
+
+        try:
+            return await self._db.execute_write(delete_customer)
+        except Exception as e:
+            logger.exception(
+                f"Unexpected error in deletion of customer {guid}: {str(e)}"
+            )
+            return False
 
     async def customer_exists_by_guid(self, guid: str) -> bool:
         """
@@ -122,14 +308,67 @@ class CustomerRepository(AbstractAllRepository):
         Returns:
             bool: True if the customer exists, False otherwise.
         """
-        async with self._db.get_session() as session:
+        async with self._db.get_read_session() as session:
             customer_result = await session.exec(
-                select(Customer).where(Customer.guid == guid)
+                _CUSTOMER_EXISTS, params={"guid": guid}
             )
             customer = customer_result.fetchall()
 
             return bool(customer)
 
+    @staticmethod
+    async def __map_rows_to_schema(
+        session: AsyncSession,
+        customer_rows: Sequence[Row],
+        include: RelationshipLoading,
+    ) -> List[CustomerOutput]:
+        """
+        Map customer rows to CustomerOutput schema, with their accounts.
+
+        Args:
+            session (AsyncSession): The session the customer rows were read in.
+            customer_rows (Sequence[Row]): Rows of the CustomerBase columns,
+                followed by their accounts' columns if the load is joined.
+            include (RelationshipLoading): How the customers' accounts are loaded.
+
+        Returns:
+            List[CustomerOutput]: List of CustomerOutput instances.
+        """
+        accounts = defaultdict(list)
+
+        if include is RelationshipLoading.JOINED:
+            unique_rows = {}
+            for row in customer_rows:
+                unique_rows.setdefault(row.guid, row)
+                if row.account_guid is not None:
+                    accounts[row.guid].append(
+                        AccountOutput(
+                            guid=row.account_guid,
+                            account_name=row.account_account_name,
+                            status=row.account_status,
+                        )
+                    )
+            customer_rows = list(unique_rows.values())
+
+        elif include is RelationshipLoading.SELECTIN and customer_rows:
+            account_rows = await session.exec(
+                _CUSTOMER_ACCOUNT_ROWS,
+                params={"guids": [customer.guid for customer in customer_rows]},
+            )
+            for account in account_rows:
+                accounts[account.customer_guid].append(
+                    AccountOutput(
+                        guid=account.guid,
+                        account_name=account.account_name,
+                        status=account.status,
+                    )
+                )
+
+        return [
+            CustomerOutput(**customer._mapping, accounts=accounts[customer.guid])
+            for customer in customer_rows
+        ]
+
     @staticmethod
     def __map_customer_to_schema(
         customers: List[Type[Customer]],
@@ -167,7 +406,7 @@ class CustomerRepository(AbstractAllRepository):
 
 
 async def get_customer_repository(
-    db_client: Annotated[DatabaseClient, Depends(get_database_client)]
+    unit_of_work: Annotated[UnitOfWork, Depends(get_unit_of_work)]
 ) -> CustomerRepository:
-    """Dependency provider for CustomerRepository."""
-    return CustomerRepository(db=db_client)
+    """Dependency provider for CustomerRepository, scoped to the current request."""
+    return CustomerRepository(db=unit_of_work)
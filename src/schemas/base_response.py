@@ -12,3 +12,4 @@ class GenericResponseModel(BaseModel):
     message: Optional[str] = None
     data: List[T]
     status_code: Optional[int] = None
+    next_cursor: Optional[str] = None
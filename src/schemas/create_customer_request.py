@@ -1,13 +1,13 @@
 from datetime import date
 from typing import Annotated, Optional
-from uuid import uuid4
 
 from pydantic import BaseModel, ConfigDict, Field, StringConstraints
 
 from src.enums.account_status import AccountStatus
 from src.schemas.common import CommonRestModelConfig
 from src.utils.constants import EXAMPLE_GUID_1
-from src.utils.regex_patterns import NAME_PATTERN, UUID4_PATTERN
+from src.utils.guid_functions import generate_guid
+from src.utils.regex_patterns import GUID_PATTERN, NAME_PATTERN
 
 
 class CreateCustomerRequest(BaseModel):
@@ -19,12 +19,12 @@ class CreateCustomerRequest(BaseModel):
     """
 
     customer_guid: Annotated[
-        str, StringConstraints(pattern=UUID4_PATTERN, strict=True)
+        str, StringConstraints(pattern=GUID_PATTERN, strict=True)
     ] = Field(
-        default=uuid4(),
+        default_factory=generate_guid,
         description="Unique identifier for the customer record.",
         examples=[EXAMPLE_GUID_1],
-        json_schema_extra={"pattern": UUID4_PATTERN},
+        json_schema_extra={"pattern": GUID_PATTERN},
     )
     first_name: Annotated[str, StringConstraints(pattern=NAME_PATTERN, strict=True)] = (
         Field(
@@ -68,12 +68,12 @@ class CreateCustomerRequest(BaseModel):
         examples=["123 Baker Street, London, E12 345"],
     )
     account_guid: Annotated[
-        str, StringConstraints(pattern=UUID4_PATTERN, strict=True)
+        str, StringConstraints(pattern=GUID_PATTERN, strict=True)
     ] = Field(
-        default=uuid4(),
+        default_factory=generate_guid,
         description="Unique identifier for the account.",
         examples=[EXAMPLE_GUID_1],
-        pattern=UUID4_PATTERN,
+        pattern=GUID_PATTERN,
     )
     account_name: str = Field(
         default={},
@@ -1,12 +1,12 @@
 from datetime import date
 from typing import Annotated, Optional
-from uuid import uuid4
 
 from pydantic import BaseModel, ConfigDict, Field, StringConstraints
 
 from src.schemas.common import CommonRestModelConfig
 from src.utils.constants import EXAMPLE_GUID_1, EXAMPLE_GUID_2
-from src.utils.regex_patterns import NAME_PATTERN, UUID4_PATTERN
+from src.utils.guid_functions import generate_guid
+from src.utils.regex_patterns import GUID_PATTERN, NAME_PATTERN
 
 
 class CustomerBase(BaseModel):
@@ -14,12 +14,12 @@ class CustomerBase(BaseModel):
     Base for the Customer Data Transfer Objects (DTOs).
     """
 
-    guid: Annotated[str, StringConstraints(pattern=UUID4_PATTERN, strict=True)] = Field(
-        default=uuid4(),
+    guid: Annotated[str, StringConstraints(pattern=GUID_PATTERN, strict=True)] = Field(
+        default_factory=generate_guid,
         description="Unique identifer for the customer record",
         strict=True,
         examples=[EXAMPLE_GUID_1, EXAMPLE_GUID_2],
-        json_schema_extra={"pattern": UUID4_PATTERN},
+        json_schema_extra={"pattern": GUID_PATTERN},
     )
     first_name: Annotated[str, StringConstraints(pattern=NAME_PATTERN, strict=True)] = (
         Field(
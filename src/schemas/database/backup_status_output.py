@@ -0,0 +1,34 @@
+from typing import Optional
+
+from pydantic import BaseModel, ConfigDict, Field
+
+from src.schemas.common import CommonRestModelConfig
+
+
+class BackupStatusOutput(BaseModel):
+    """
+    Rest Model for the Backup Status Output Data Transfer Object (DTO).
+
+    Used to return the progress of an online backup to the client.
+    """
+
+    target: str = Field(
+        ...,
+        description="File the backup is written to",
+        examples=["backups/bank-20240101T020000Z.db"],
+    )
+    state: str = Field(
+        ...,
+        description="Progress of the backup",
+        examples=["pending", "running", "completed", "failed"],
+    )
+    pages_copied: int = Field(..., description="Database pages copied so far")
+    total_pages: int = Field(..., description="Pages in the source database")
+    restarts: int = Field(..., description="Copies restarted by concurrent writes")
+    elapsed_ms: float = Field(..., description="Time spent copying (ms)")
+    pages_per_second: float = Field(..., description="Copy throughput")
+    error: Optional[str] = Field(None, description="Why the backup failed")
+
+    model_config = ConfigDict(
+        **CommonRestModelConfig.__dict__, title="BackupStatusOutput"
+    )
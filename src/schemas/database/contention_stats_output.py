@@ -0,0 +1,21 @@
+from pydantic import BaseModel, ConfigDict, Field
+
+from src.schemas.common import CommonRestModelConfig
+
+
+class ContentionStatsOutput(BaseModel):
+    """
+    Rest Model for the Contention Stats Output Data Transfer Object (DTO).
+
+    Used to return write lock contention statistics to the client.
+    """
+
+    lock_errors: int = Field(..., description="Writes which found the database locked")
+    retries: int = Field(..., description="Writes retried after a backoff")
+    give_ups: int = Field(..., description="Writes failed after exhausting retries")
+    total_wait_ms: float = Field(..., description="Time spent backing off")
+    max_wait_ms: float = Field(..., description="Longest single backoff")
+
+    model_config = ConfigDict(
+        **CommonRestModelConfig.__dict__, title="ContentionStatsOutput"
+    )
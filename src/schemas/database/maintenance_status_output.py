@@ -0,0 +1,35 @@
+from datetime import datetime
+from typing import Optional
+
+from pydantic import BaseModel, ConfigDict, Field
+
+from src.schemas.common import CommonRestModelConfig
+
+
+class MaintenanceStatusOutput(BaseModel):
+    """
+    Rest Model for the Maintenance Status Output Data Transfer Object (DTO).
+
+    Used to return when a database maintenance task last ran to the client.
+    """
+
+    task: str = Field(
+        ...,
+        description="Maintenance task",
+        examples=["optimize", "incremental_vacuum"],
+    )
+    runs: int = Field(..., description="Runs since startup")
+    last_run_at: Optional[datetime] = Field(None, description="Start of the last run")
+    last_duration_ms: Optional[float] = Field(
+        None, description="Duration of the last run (ms)"
+    )
+    last_result: Optional[str] = Field(
+        None,
+        description="Outcome of the last run",
+        examples=["ANALYZE on 1 database(s)", "freed 512 pages, 0 free pages left"],
+    )
+    last_error: Optional[str] = Field(None, description="Why the last run failed")
+
+    model_config = ConfigDict(
+        **CommonRestModelConfig.__dict__, title="MaintenanceStatusOutput"
+    )
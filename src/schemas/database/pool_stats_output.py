@@ -0,0 +1,28 @@
+from pydantic import BaseModel, ConfigDict, Field
+
+from src.schemas.common import CommonRestModelConfig
+
+
+class PoolStatsOutput(BaseModel):
+    """
+    Rest Model for the Pool Stats Output Data Transfer Object (DTO).
+
+    Used to return connection pool statistics to the client.
+    """
+
+    engine: str = Field(
+        ..., description="Engine owning the pool", examples=["primary", "read"]
+    )
+    pool_class: str = Field(
+        ..., description="Connection pool implementation", examples=["QueuePool"]
+    )
+    size: int = Field(..., description="Configured number of pooled connections")
+    checked_out: int = Field(..., description="Connections currently in use")
+    idle: int = Field(..., description="Connections waiting in the pool")
+    overflow: int = Field(..., description="Connections open beyond the pool size")
+    checkouts: int = Field(..., description="Checkouts since startup")
+    timeouts: int = Field(..., description="Checkouts that hit the pool timeout")
+    average_wait_ms: float = Field(..., description="Mean checkout wait (ms)")
+    max_wait_ms: float = Field(..., description="Longest checkout wait (ms)")
+
+    model_config = ConfigDict(**CommonRestModelConfig.__dict__, title="PoolStatsOutput")
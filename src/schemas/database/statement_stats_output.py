@@ -0,0 +1,24 @@
+from pydantic import BaseModel, ConfigDict, Field
+
+from src.schemas.common import CommonRestModelConfig
+
+
+class StatementStatsOutput(BaseModel):
+    """
+    Rest Model for the Statement Stats Output Data Transfer Object (DTO).
+
+    Used to return compiled statement cache statistics to the client.
+    """
+
+    name: str = Field(
+        ...,
+        description="Name of the cached statement",
+        examples=["account_row_by_guid"],
+    )
+    hits: int = Field(..., description="Executions reusing the compiled statement")
+    misses: int = Field(..., description="Executions which compiled the statement")
+    hit_ratio: float = Field(..., description="Fraction of executions which hit")
+
+    model_config = ConfigDict(
+        **CommonRestModelConfig.__dict__, title="StatementStatsOutput"
+    )
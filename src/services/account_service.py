@@ -1,7 +1,9 @@
-from typing import Annotated
+from typing import Annotated, Optional
 
 from fastapi import Depends, HTTPException
 
+from src.enums.relationship_loading import RelationshipLoading
+from src.errors.exceptions import InvalidCursorError
 from src.repositories.account_repository import (
     AccountRepository,
     get_account_repository,
@@ -9,6 +11,8 @@ from src.repositories.account_repository import (
 from src.schemas.account.account_update import AccountUpdate
 from src.schemas.base_response import GenericResponseModel
 from src.utils.constants import (
+    BAD_REQUEST,
+    DEFAULT_PAGE_SIZE,
     INTERNAL_SERVER_ERROR,
     NOT_FOUND,
     OK,
@@ -18,6 +22,7 @@ from src.utils.constants import (
     SUCCESS_FALSE,
     SUCCESS_TRUE,
 )
+from src.utils.pagination import decode_cursor, encode_cursor
 
 
 class AccountService:
@@ -37,36 +42,75 @@ class AccountService:
         """
         self.account_repository = account_repository
 
-    async def get_all(self) -> GenericResponseModel:
+    async def get_all(
+        self,
+        cursor: Optional[str] = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+        include: RelationshipLoading = RelationshipLoading.SELECTIN,
+    ) -> GenericResponseModel:
         """
-        Retrieve all accounts.
+        Retrieve a page of accounts.
+
+        Args:
+            cursor (Optional[str]): The next_cursor of the previous page, or
+                None for the first page.
+            limit (int): The maximum number of accounts in the page.
+            include (RelationshipLoading): How the accounts' customers are loaded.
 
         Returns:
             GenericResponseModel: The wrapper for the response from the database.
-            The retrieved data is in the wrapper's data attribute.
+            The retrieved data is in the wrapper's data attribute, and the
+            cursor of the following page (if any) in its next_cursor attribute.
+
+        Raises:
+            HTTPException: If the cursor is invalid.
         """
+        try:
+            after = decode_cursor(cursor) if cursor else None
+        except InvalidCursorError as e:
+            raise HTTPException(status_code=BAD_REQUEST, detail=e.message)
+
+        # One extra account tells whether another page follows
+        if include is RelationshipLoading.JSON:
+            accounts = await self.account_repository.get_page_documents(
+                after, limit + 1
+            )
+            page = accounts[:limit]
+            data = [account.document for account in page]
+        else:
+            accounts = await self.account_repository.get_page(after, limit + 1, include)
+            page = accounts[:limit]
+            data = [account.model_dump_json() for account in page]
+
         return GenericResponseModel(
             status_code=OK,
             success=SUCCESS_TRUE,
             message=SUCCESS_ACCOUNT_DATA_FOUND,
-            data=[
-                account.model_dump_json()
-                for account in await self.account_repository.get_all()
-            ],
+            data=data,
+            next_cursor=encode_cursor(page[-1].guid) if len(accounts) > limit else None,
         )
 
-    async def get_account(self, guid: str) -> GenericResponseModel:
+    async def get_account(
+        self, guid: str, include: RelationshipLoading = RelationshipLoading.SELECTIN
+    ) -> GenericResponseModel:
         """
         Retrieve an account by ID.
 
         Args:
             guid (str): The ID of the account.
+            include (RelationshipLoading): How the account's customers are loaded.
 
         Returns:
             GenericResponseModel: The wrapper for the response from the database.
             The retrieved data is in the wrapper's data attribute.
         """
-        if not await self.account_repository.account_exists_by_guid(guid):
+        if include is RelationshipLoading.JSON:
+            document = await self.account_repository.find_document_by_guid(guid)
+        else:
+            account = await self.account_repository.find_by_guid(guid, include)
+            document = account.model_dump_json() if account else None
+
+        if document is None:
             raise HTTPException(
                 status_code=NOT_FOUND, detail=f"Account not found: {guid}"
             )
@@ -75,10 +119,7 @@ class AccountService:
             status_code=OK,
             success=SUCCESS_TRUE,
             message=SUCCESS_ACCOUNT_DATA_FOUND,
-            data=[
-                account.model_dump_json()
-                for account in await self.account_repository.get_by_guid(guid)
-            ],
+            data=[document],
         )
 
     async def update(self, guid: str, data: AccountUpdate) -> GenericResponseModel:
@@ -93,7 +134,9 @@ class AccountService:
             GenericResponseModel: The wrapper for the response from the database.
             The retrieved data is in the wrapper's data attribute.
         """
-        if not await self.account_repository.account_exists_by_guid(guid):
+        account = await self.account_repository.update(guid, data)
+
+        if account is None:
             raise HTTPException(
                 status_code=NOT_FOUND, detail=f"Account not found: {guid}"
             )
@@ -102,10 +145,7 @@ class AccountService:
             status_code=OK,
             success=SUCCESS_TRUE,
             message=SUCCESS_ACCOUNT_UPDATED,
-            data=[
-                account.model_dump_json()
-                for account in await self.account_repository.update(guid, data)
-            ],
+            data=[account.model_dump_json()],
         )
 
     async def delete(self, guid: str) -> GenericResponseModel:
@@ -0,0 +1,154 @@
+from typing import Annotated
+
+from fastapi import Depends, HTTPException
+
+from src.db.database import DatabaseClient, get_database_client
+from src.errors.exceptions import BackupInProgressError
+from src.schemas.base_response import GenericResponseModel
+from src.utils.constants import (
+    ACCEPTED,
+    CONFLICT,
+    OK,
+    SUCCESS_BACKUP_STARTED,
+    SUCCESS_BACKUP_STATUS_FOUND,
+    SUCCESS_CONTENTION_STATS_FOUND,
+    SUCCESS_MAINTENANCE_STATUS_FOUND,
+    SUCCESS_POOL_STATS_FOUND,
+    SUCCESS_STATEMENT_STATS_FOUND,
+    SUCCESS_TRUE,
+)
+
+
+class AdminService:
+    """
+    Service class for operational endpoints.
+
+    This class exposes runtime information about the database layer
+    to operators tuning the application.
+    """
+
+    def __init__(self, db_client: DatabaseClient):
+        """
+        Initialises the service with a DatabaseClient instance.
+
+        Args:
+            db_client (DatabaseClient): DatabaseClient instance.
+        """
+        self.db_client = db_client
+
+    async def get_pool_stats(self) -> GenericResponseModel:
+        """
+        Retrieve connection pool statistics.
+
+        Returns:
+            GenericResponseModel: The wrapper for the pool statistics.
+            The statistics are in the wrapper's data attribute.
+        """
+        return GenericResponseModel(
+            status_code=OK,
+            success=SUCCESS_TRUE,
+            message=SUCCESS_POOL_STATS_FOUND,
+            data=[
+                pool_stats.model_dump_json()
+                for pool_stats in self.db_client.get_pool_stats()
+            ],
+        )
+
+    async def get_statement_stats(self) -> GenericResponseModel:
+        """
+        Retrieve compiled statement cache statistics.
+
+        Returns:
+            GenericResponseModel: The wrapper for the statement statistics.
+            The statistics are in the wrapper's data attribute.
+        """
+        return GenericResponseModel(
+            status_code=OK,
+            success=SUCCESS_TRUE,
+            message=SUCCESS_STATEMENT_STATS_FOUND,
+            data=[
+                statement_stats.model_dump_json()
+                for statement_stats in self.db_client.get_statement_stats()
+            ],
+        )
+
+    async def get_contention_stats(self) -> GenericResponseModel:
+        """
+        Retrieve write lock contention statistics.
+
+        Returns:
+            GenericResponseModel: The wrapper for the contention statistics.
+            The statistics are in the wrapper's data attribute.
+        """
+        return GenericResponseModel(
+            status_code=OK,
+            success=SUCCESS_TRUE,
+            message=SUCCESS_CONTENTION_STATS_FOUND,
+            data=[self.db_client.get_contention_stats().model_dump_json()],
+        )
+
+    async def start_backup(self) -> GenericResponseModel:
+        """
+        Start an online backup of the database in the background.
+
+        Returns:
+            GenericResponseModel: The wrapper for the pending backups.
+            The backups are in the wrapper's data attribute.
+
+        Raises:
+            HTTPException: If a backup is already running.
+        """
+        try:
+            backup_status = await self.db_client.start_backup()
+        except BackupInProgressError as e:
+            raise HTTPException(status_code=CONFLICT, detail=e.message)
+
+        return GenericResponseModel(
+            status_code=ACCEPTED,
+            success=SUCCESS_TRUE,
+            message=SUCCESS_BACKUP_STARTED,
+            data=[backup.model_dump_json() for backup in backup_status],
+        )
+
+    async def get_backup_status(self) -> GenericResponseModel:
+        """
+        Retrieve the progress of the latest backup.
+
+        Returns:
+            GenericResponseModel: The wrapper for the backup progress.
+            The progress is in the wrapper's data attribute.
+        """
+        return GenericResponseModel(
+            status_code=OK,
+            success=SUCCESS_TRUE,
+            message=SUCCESS_BACKUP_STATUS_FOUND,
+            data=[
+                backup.model_dump_json()
+                for backup in self.db_client.get_backup_status()
+            ],
+        )
+
+    async def get_maintenance_status(self) -> GenericResponseModel:
+        """
+        Retrieve when each database maintenance task last ran.
+
+        Returns:
+            GenericResponseModel: The wrapper for the maintenance status.
+            The status of each task is in the wrapper's data attribute.
+        """
+        return GenericResponseModel(
+            status_code=OK,
+            success=SUCCESS_TRUE,
+            message=SUCCESS_MAINTENANCE_STATUS_FOUND,
+            data=[
+                task_status.model_dump_json()
+                for task_status in self.db_client.get_maintenance_status()
+            ],
+        )
+
+
+async def get_admin_service(
+    db_client: Annotated[DatabaseClient, Depends(get_database_client)]
+) -> AdminService:
+    """Dependency provider for AdminService."""
+    return AdminService(db_client=db_client)
@@ -1,7 +1,9 @@
-from typing import Annotated
+from typing import Annotated, Optional
 
 from fastapi import Depends, HTTPException
 
+from src.enums.relationship_loading import RelationshipLoading
+from src.errors.exceptions import InvalidCursorError
 from src.repositories.customer_repository import (
     CustomerRepository,
     get_customer_repository,
@@ -13,7 +15,9 @@ from src.schemas.customer.customer_input import CustomerInput
 from src.schemas.customer.customer_output import CustomerOutput
 from src.schemas.customer.customer_update import CustomerUpdate
 from src.utils.constants import (
+    BAD_REQUEST,
     CREATED,
+    DEFAULT_PAGE_SIZE,
     INTERNAL_SERVER_ERROR,
     NOT_FOUND,
     OK,
@@ -24,6 +28,7 @@ from src.utils.constants import (
     SUCCESS_FALSE,
     SUCCESS_TRUE,
 )
+from src.utils.pagination import decode_cursor, encode_cursor
 
 
 class CustomerService:
@@ -63,36 +68,79 @@ class CustomerService:
             data=[customer.model_dump_json() for customer in customer],
         )
 
-    async def get_all(self) -> GenericResponseModel:
+    async def get_all(
+        self,
+        cursor: Optional[str] = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+        include: RelationshipLoading = RelationshipLoading.SELECTIN,
+    ) -> GenericResponseModel:
         """
-        Retrieve all customers.
+        Retrieve a page of customers.
+
+        Args:
+            cursor (Optional[str]): The next_cursor of the previous page, or
+                None for the first page.
+            limit (int): The maximum number of customers in the page.
+            include (RelationshipLoading): How the customers' accounts are loaded.
 
         Returns:
             GenericResponseModel: The wrapper for the response from the database.
-            The retrieved data is in the wrapper's data attribute.
+            The retrieved data is in the wrapper's data attribute, and the
+            cursor of the following page (if any) in its next_cursor attribute.
+
+        Raises:
+            HTTPException: If the cursor is invalid.
         """
+        try:
+            after = decode_cursor(cursor) if cursor else None
+        except InvalidCursorError as e:
+            raise HTTPException(status_code=BAD_REQUEST, detail=e.message)
+
+        # One extra customer tells whether another page follows
+        if include is RelationshipLoading.JSON:
+            customers = await self.customer_repository.get_page_documents(
+                after, limit + 1
+            )
+            page = customers[:limit]
+            data = [customer.document for customer in page]
+        else:
+            customers = await self.customer_repository.get_page(
+                after, limit + 1, include
+            )
+            page = customers[:limit]
+            data = [customer.model_dump_json() for customer in page]
+
         return GenericResponseModel(
             status_code=OK,
             success=SUCCESS_TRUE,
             message=SUCCESS_CUSTOMER_DATA_FOUND,
-            data=[
-                customer.model_dump_json()
-                for customer in await self.customer_repository.get_all()
-            ],
+            data=data,
+            next_cursor=(
+                encode_cursor(page[-1].guid) if len(customers) > limit else None
+            ),
         )
 
-    async def get_customer(self, guid: str) -> GenericResponseModel:
+    async def get_customer(
+        self, guid: str, include: RelationshipLoading = RelationshipLoading.SELECTIN
+    ) -> GenericResponseModel:
         """
         Retrieve a customer by ID.
 
         Args:
             guid (str): The ID of the customer.
+            include (RelationshipLoading): How the customer's accounts are loaded.
 
         Returns:
             GenericResponseModel: The wrapper for the response from the database.
             The retrieved data is in the wrapper's data attribute.
         """
-        if not await self.customer_repository.customer_exists_by_guid(guid):
+        if include is RelationshipLoading.JSON:
+            document = await self.customer_repository.find_document_by_guid(guid)
+        else:
+            customer = await self.customer_repository.find_by_guid(guid, include)
+            document = customer.model_dump_json() if customer else None
+
+        if document is None:
             raise HTTPException(
                 status_code=NOT_FOUND, detail=f"Customer not found: {guid}"
             )
@@ -101,10 +149,7 @@ class CustomerService:
             status_code=OK,
             success=SUCCESS_TRUE,
             message=SUCCESS_CUSTOMER_DATA_FOUND,
-            data=[
-                customer.model_dump_json()
-                for customer in await self.customer_repository.get_by_guid(guid)
-            ],
+            data=[document],
         )
 
     async def update(self, guid: str, data: CustomerUpdate) -> GenericResponseModel:
@@ -119,7 +164,9 @@ class CustomerService:
             GenericResponseModel: The wrapper for the response from the database.
             The retrieved data is in the wrapper's data attribute.
         """
-        if not await self.customer_repository.customer_exists_by_guid(guid):
+        customer = await self.customer_repository.update(guid, data)
+
+        if customer is None:
             raise HTTPException(
                 status_code=NOT_FOUND, detail=f"Customer not found: {guid}"
             )
@@ -128,10 +175,7 @@ class CustomerService:
             status_code=OK,
             success=SUCCESS_TRUE,
             message=SUCCESS_CUSTOMER_UPDATED,
-            data=[
-                customer.model_dump_json()
-                for customer in await self.customer_repository.update(guid, data)
-            ],
+            data=[customer.model_dump_json()],
         )
 
     async def delete(self, guid: str) -> GenericResponseModel:
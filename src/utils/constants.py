@@ -6,9 +6,17 @@ EXAMPLE_GUID_2 = "254e6eb6-78a5-4481-ac7a-b551de0e1b48"
 
 # HTTP Status Codes
 OK = http.HTTPStatus.OK
+BAD_REQUEST = http.HTTPStatus.BAD_REQUEST
 CREATED = http.HTTPStatus.CREATED
+ACCEPTED = http.HTTPStatus.ACCEPTED
 NOT_FOUND = http.HTTPStatus.NOT_FOUND
+CONFLICT = http.HTTPStatus.CONFLICT
 INTERNAL_SERVER_ERROR = http.HTTPStatus.INTERNAL_SERVER_ERROR
+SERVICE_UNAVAILABLE = http.HTTPStatus.SERVICE_UNAVAILABLE
+
+# Pagination of list endpoints
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 100
 
 
 # Error messages
@@ -28,3 +36,11 @@ SUCCESS_CUSTOMER_UPDATED = "Customer record updated"
 SUCCESS_ACCOUNT_DATA_FOUND = "Available account data returned"
 SUCCESS_ACCOUNT_DELETED = "Account record deleted"
 SUCCESS_ACCOUNT_UPDATED = "Account record updated"
+
+# Success messages - Admin
+SUCCESS_POOL_STATS_FOUND = "Connection pool statistics returned"
+SUCCESS_STATEMENT_STATS_FOUND = "Statement cache statistics returned"
+SUCCESS_CONTENTION_STATS_FOUND = "Write contention statistics returned"
+SUCCESS_BACKUP_STARTED = "Database backup started"
+SUCCESS_BACKUP_STATUS_FOUND = "Database backup status returned"
+SUCCESS_MAINTENANCE_STATUS_FOUND = "Database maintenance status returned"
@@ -0,0 +1,32 @@
+import os
+import time
+import uuid
+
+
+def uuid7() -> uuid.UUID:
+    """
+    Returns a time-ordered version 7 UUID (RFC 9562).
+
+    The first 48 bits are the Unix time in milliseconds and the next 12 bits
+    the fraction of the current millisecond, so keys generated by a process
+    sort in creation order. The remaining 62 bits are random.
+    """
+    nanoseconds = time.time_ns()
+    milliseconds, remainder = divmod(nanoseconds, 1_000_000)
+    sub_milliseconds = remainder * 4096 // 1_000_000
+    random_bits = int.from_bytes(os.urandom(8), "big") & (2**62 - 1)
+
+    return uuid.UUID(
+        int=(milliseconds & (2**48 - 1)) << 80
+        | 0x7 << 76
+        | sub_milliseconds << 64
+        | 0b10 << 62
+        | random_bits
+    )
+
+
+def generate_guid() -> str:
+    """
+    Returns a new server-generated guid, as a canonical UUIDv7 string.
+    """
+    return str(uuid7())
@@ -0,0 +1,25 @@
+import base64
+import uuid
+
+from src.errors.exceptions import InvalidCursorError
+
+
+def encode_cursor(guid: str) -> str:
+    """
+    Returns the opaque cursor of the page following the given guid.
+    """
+    return base64.urlsafe_b64encode(uuid.UUID(guid).bytes).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> str:
+    """
+    Returns the guid which the page of a cursor follows.
+
+    Raises:
+        InvalidCursorError: If the cursor was not issued by encode_cursor.
+    """
+    try:
+        key = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        return str(uuid.UUID(bytes=key))
+    except ValueError:
+        raise InvalidCursorError(f"Invalid page cursor: {cursor}")
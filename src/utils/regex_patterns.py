@@ -1,7 +1,8 @@
 import re
 
-UUID4_PATTERN = re.compile(
-    "^[a-f0-9]{8}-[a-f0-9]{4}-4[a-f0-9]{3}-[89ab][a-f0-9]{3}-[a-f0-9]{12}$"
+# Random (version 4) or time-ordered (version 7) guids
+GUID_PATTERN = re.compile(
+    "^[a-f0-9]{8}-[a-f0-9]{4}-[47][a-f0-9]{3}-[89ab][a-f0-9]{3}-[a-f0-9]{12}$"
 )
 NAME_PATTERN = re.compile(
     "^(?=.{1,60}$)[^ -!@#$%^&*()_+\-=\[\]{};:'\\|,.<>\/\?][a-zA-Z- ']+[^ =\[\]{}#;:'\\|,.<>\/\?$@^!&%()-]$"
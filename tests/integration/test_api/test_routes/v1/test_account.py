@@ -123,6 +123,21 @@ class TestAccountRouter:
         for field in valid_customer_data_two[0].keys():
             assert response_customer_data[field] == valid_customer_data_two[0][field]
 
+    async def test_update_account_uses_one_connection(
+        self, new_db_client, valid_account_data, seed_db_customer_account, client
+    ):
+        """Tests PUT /accounts/{guid} checks out one connection for the request."""
+
+        checkouts_before = new_db_client.get_pool_stats()[0].checkouts
+
+        response = await client.put(
+            f"/accounts/{valid_account_data['guid']}",
+            json={"account_name": "New Account Name 1122"},
+        )
+
+        assert response.status_code == 200
+        assert new_db_client.get_pool_stats()[0].checkouts == checkouts_before + 1
+
     async def test_delete_valid_account_returns_200(
         self, client, seed_db_customer_account, valid_account_data
     ):
@@ -1,4 +1,5 @@
 import json
+import uuid
 
 import pytest
 from fastapi import FastAPI
@@ -232,6 +233,85 @@ class TestCustomerRouter:
         for field in expected_resp_attrs.keys():
             assert response_json[field] == expected_resp_attrs[field]
 
+    async def test_post_customer_without_guids_generates_uuid7(
+        self,
+        valid_input_customer_account_data,
+        client,
+    ):
+        """Tests POST /customers generates time-ordered guids when none are sent."""
+        del valid_input_customer_account_data["customer_guid"]
+        del valid_input_customer_account_data["account_guid"]
+
+        response = await client.post(
+            "/customers", json=valid_input_customer_account_data
+        )
+
+        assert response.status_code == 201
+        response_customer_data = json.loads(response.json()["data"][0])
+
+        assert uuid.UUID(response_customer_data["guid"]).version == 7
+        assert uuid.UUID(response_customer_data["accounts"][0]["guid"]).version == 7
+
+    async def test_get_customers_pages_with_cursor(
+        self,
+        valid_input_customer_account_data,
+        client,
+    ):
+        """Tests GET /customers pages through every customer with next_cursor."""
+        del valid_input_customer_account_data["customer_guid"]
+        del valid_input_customer_account_data["account_guid"]
+
+        for _ in range(5):
+            await client.post("/customers", json=valid_input_customer_account_data)
+
+        guids, params = [], {"limit": 2}
+        while True:
+            response_json = (await client.get("/customers", params=params)).json()
+            guids.extend(json.loads(data)["guid"] for data in response_json["data"])
+
+            if response_json["next_cursor"] is None:
+                break
+            params["cursor"] = response_json["next_cursor"]
+
+        assert len(guids) == 5
+        assert guids == sorted(guids)
+
+    async def test_get_customer_include_controls_accounts(
+        self, seed_db_customer_account, client, valid_account_data
+    ):
+        """Tests GET /customers/{guid} loads accounts as the include parameter asks."""
+        guid = seed_db_customer_account[0].guid
+
+        for include in ["selectin", "joined", "json"]:
+            response = await client.get(
+                f"/customers/{guid}", params={"include": include}
+            )
+            accounts = json.loads(response.json()["data"][0])["accounts"]
+
+            assert [account["guid"] for account in accounts] == [
+                valid_account_data["guid"]
+            ]
+
+        response = await client.get(f"/customers/{guid}", params={"include": "none"})
+
+        assert json.loads(response.json()["data"][0])["accounts"] == []
+
+        response = await client.get(f"/customers/{guid}", params={"include": "lazy"})
+
+        assert response.status_code == 422
+
+    async def test_get_customers_invalid_page_returns_4xx(self, client):
+        """Tests unhappy paths of GET /customers with paging parameters."""
+
+        response = await client.get("/customers", params={"cursor": "not-a-cursor"})
+
+        assert response.status_code == 400
+        assert response.json()["detail"] == "Invalid page cursor: not-a-cursor"
+
+        response = await client.get("/customers", params={"limit": 101})
+
+        assert response.status_code == 422
+
     async def test_post_customer_invalid_returns_422(
         self,
         valid_input_customer_account_data,
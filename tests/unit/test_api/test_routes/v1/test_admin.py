@@ -0,0 +1,143 @@
+from unittest.mock import AsyncMock
+
+import pytest
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+
+from src.api.v1.routers.admin import router
+from src.schemas.base_response import GenericResponseModel
+from src.services.admin_service import AdminService, get_admin_service
+from tests.shared.constants import test_url
+
+
+class TestAdminRouter:
+    """Test suite for /admin route."""
+
+    @pytest.fixture
+    def mock_admin_service(self):
+        """Provides mock admin service instance for testing."""
+        return AsyncMock(spec=AdminService)
+
+    @pytest.fixture(scope="function")
+    def test_app(self, mock_admin_service):
+        """
+        Fixture for app configured with mock admin service.
+        """
+        app = FastAPI()
+        app.include_router(router)
+        app.dependency_overrides[get_admin_service] = lambda: mock_admin_service
+
+        return app
+
+    @pytest.fixture(scope="function")
+    async def client(self, test_app):
+        """Fixture for test client."""
+        async with AsyncClient(
+            transport=ASGITransport(test_app), base_url=test_url
+        ) as client:
+            yield client
+
+    async def test_get_pool_stats_success(self, mock_admin_service, client):
+        """Tests happy path for GET /admin/database/pool."""
+
+        mock_admin_service.get_pool_stats.return_value = GenericResponseModel(
+            success="true",
+            message="Connection pool statistics returned",
+            status_code=200,
+            data=[{"pool_class": "AsyncAdaptedQueuePool", "checked_out": 1}],
+        )
+
+        response = await client.get("/admin/database/pool")
+
+        assert response.status_code == 200
+
+        response_json = response.json()
+        assert response_json["message"] == "Connection pool statistics returned"
+        assert response_json["data"][0]["checked_out"] == 1
+
+        mock_admin_service.get_pool_stats.assert_called_once()
+
+    async def test_get_statement_stats_success(self, mock_admin_service, client):
+        """Tests happy path for GET /admin/database/statements."""
+
+        mock_admin_service.get_statement_stats.return_value = GenericResponseModel(
+            success="true",
+            message="Statement cache statistics returned",
+            status_code=200,
+            data=[{"name": "account_row_by_guid", "hits": 9}],
+        )
+
+        response = await client.get("/admin/database/statements")
+
+        assert response.status_code == 200
+        assert response.json()["data"][0]["hits"] == 9
+
+        mock_admin_service.get_statement_stats.assert_called_once()
+
+    async def test_get_contention_stats_success(self, mock_admin_service, client):
+        """Tests happy path for GET /admin/database/contention."""
+
+        mock_admin_service.get_contention_stats.return_value = GenericResponseModel(
+            success="true",
+            message="Write contention statistics returned",
+            status_code=200,
+            data=[{"lock_errors": 4, "retries": 3, "give_ups": 1}],
+        )
+
+        response = await client.get("/admin/database/contention")
+
+        assert response.status_code == 200
+        assert response.json()["data"][0]["give_ups"] == 1
+
+        mock_admin_service.get_contention_stats.assert_called_once()
+
+    async def test_start_backup_success(self, mock_admin_service, client):
+        """Tests happy path for POST /admin/database/backup."""
+
+        mock_admin_service.start_backup.return_value = GenericResponseModel(
+            success="true",
+            message="Database backup started",
+            status_code=202,
+            data=[{"target": "backups/bank-20240101T020000Z.db", "state": "pending"}],
+        )
+
+        response = await client.post("/admin/database/backup")
+
+        assert response.status_code == 202
+        assert response.json()["data"][0]["state"] == "pending"
+
+        mock_admin_service.start_backup.assert_called_once()
+
+    async def test_get_backup_status_success(self, mock_admin_service, client):
+        """Tests happy path for GET /admin/database/backup."""
+
+        mock_admin_service.get_backup_status.return_value = GenericResponseModel(
+            success="true",
+            message="Database backup status returned",
+            status_code=200,
+            data=[{"state": "completed", "pages_copied": 120, "total_pages": 120}],
+        )
+
+        response = await client.get("/admin/database/backup")
+
+        assert response.status_code == 200
+        assert response.json()["data"][0]["pages_copied"] == 120
+
+        mock_admin_service.get_backup_status.assert_called_once()
+
+    async def test_get_maintenance_status_success(self, mock_admin_service, client):
+        """Tests happy path for GET /admin/database/maintenance."""
+
+        mock_admin_service.get_maintenance_status.return_value = GenericResponseModel(
+            success="true",
+            message="Database maintenance status returned",
+            status_code=200,
+            data=[{"task": "optimize", "runs": 2, "last_duration_ms": 4.2}],
+        )
+
+        response = await client.get("/admin/database/maintenance")
+
+        assert response.status_code == 200
+        assert response.json()["data"][0]["task"] == "optimize"
+
+        mock_admin_service.get_maintenance_status.assert_called_once()
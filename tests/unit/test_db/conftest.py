@@ -0,0 +1,32 @@
+from typing import Callable, Tuple
+
+import pytest
+
+from src.enums.account_status import AccountStatus
+from src.schemas.account.account_input import AccountInput
+from src.schemas.customer.customer_input import CustomerInput
+
+
+@pytest.fixture
+def customer_account_input() -> Callable[[str], Tuple[CustomerInput, AccountInput]]:
+    """Fixture building valid customer and account input for a customer guid."""
+
+    def build(guid: str) -> Tuple[CustomerInput, AccountInput]:
+        customer_input = CustomerInput(
+            guid=guid,
+            first_name="Jamie",
+            last_name="Bloggs",
+            date_of_birth="1999-09-13",
+            phone_number="07712 345678",
+            email_address="jamie.bloggs@gmails.com",
+            address="123 Barnes Street, London, W17 4DD",
+        )
+        # Derive a distinct, stable account guid from the customer guid
+        account_input = AccountInput(
+            guid=guid[::-1].replace("-", "")[:8] + guid[8:],
+            account_name="Test Account ABC",
+            status=AccountStatus.ACTIVE,
+        )
+        return customer_input, account_input
+
+    return build
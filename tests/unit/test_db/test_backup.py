@@ -0,0 +1,183 @@
+import sqlite3
+from contextlib import closing
+from unittest.mock import patch
+
+import pytest
+
+from src.core.settings import AppSettings
+from src.db.backup import BackupJob, create_backup_jobs, database_files
+from src.db.database import DatabaseClient
+from src.errors.exceptions import BackupInProgressError, DBConfigError
+from src.repositories.customer_repository import CustomerRepository
+
+GUID = "3566661b-bba9-4bd0-a82c-2966c34db25f"
+
+
+@pytest.fixture
+def source_database(tmp_path) -> str:
+    """Fixture providing a read-only URI of a WAL database spanning many pages."""
+    path = tmp_path / "source.db"
+
+    with sqlite3.connect(path) as connection:
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("CREATE TABLE item (id INTEGER PRIMARY KEY, body TEXT)")
+        connection.executemany(
+            "INSERT INTO item (body) VALUES (?)", [("x" * 500,) for _ in range(400)]
+        )
+
+    return f"file:{path}?mode=ro"
+
+
+@pytest.fixture
+def app_settings(tmp_path) -> AppSettings:
+    """Fixture providing settings for a file database backed up to tmp_path."""
+    app_settings = AppSettings()
+    app_settings.DATABASE_URL = f"sqlite+aiosqlite:///{tmp_path / 'bank.db'}"
+    app_settings.DB_BACKUP_DIR = str(tmp_path / "backups")
+    app_settings.DB_BACKUP_PAGES_PER_STEP = 4
+    app_settings.DB_BACKUP_STEP_PAUSE_MS = 0
+    app_settings.DB_SHARD_COUNT = 1
+    app_settings.DB_IN_MEMORY = False
+    app_settings.DB_WRITE_BATCHING = False
+    app_settings.DB_BACKEND = "aiosqlite"
+    return app_settings
+
+
+def count_rows(path, table: str) -> int:
+    """Count the rows of a table in a SQLite file."""
+    with sqlite3.connect(path) as connection:
+        return connection.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+
+
+def test_database_files_single_database(app_settings, tmp_path):
+    """Tests the DATABASE_URL file is opened read-only."""
+    assert database_files(app_settings) == {
+        "bank": f"file:{tmp_path / 'bank.db'}?mode=ro"
+    }
+
+
+def test_database_files_sharded(app_settings):
+    """Tests every shard file is backed up."""
+    app_settings.DB_SHARD_COUNT = 3
+
+    assert list(database_files(app_settings)) == [
+        "bank_shard0",
+        "bank_shard1",
+        "bank_shard2",
+    ]
+
+
+@pytest.mark.parametrize(
+    "database_url",
+    [
+        "sqlite+aiosqlite:///:memory:",
+        "sqlite+aiosqlite:///file:bank?mode=memory&cache=shared&uri=true",
+    ],
+)
+def test_database_files_require_sqlite_file(app_settings, database_url):
+    """Tests in-memory DATABASE_URLs have no file to back up."""
+    app_settings.DATABASE_URL = database_url
+
+    with pytest.raises(DBConfigError):
+        database_files(app_settings)
+
+
+def test_create_backup_jobs_use_backup_dir(app_settings, tmp_path):
+    """Tests backups are written to timestamped files in DB_BACKUP_DIR."""
+    (backup_job,) = create_backup_jobs({"bank": "file:bank.db"}, app_settings)
+
+    assert backup_job.target.parent == tmp_path / "backups"
+    assert backup_job.target.name.startswith("bank-")
+    assert backup_job.pages_per_step == 4
+
+
+@pytest.mark.asyncio
+class TestBackupJob:
+    """Test suite for BackupJob class."""
+
+    async def test_copies_database_in_steps(self, source_database, tmp_path):
+        """Tests the backup copies every page and reports its progress."""
+        target = tmp_path / "backups" / "source.db"
+        backup_job = BackupJob(
+            source_database, target, pages_per_step=8, step_pause_ms=0
+        )
+
+        assert backup_job.snapshot().state == "pending"
+
+        await backup_job.run()
+        backup_status = backup_job.snapshot()
+
+        assert backup_status.state == "completed"
+        assert backup_status.pages_copied == backup_status.total_pages > 8
+        assert backup_status.pages_per_second > 0
+        assert backup_status.restarts == 0
+        assert count_rows(target, "item") == 400
+
+    async def test_restarted_copy_finishes_in_one_step(self, source_database, tmp_path):
+        """Tests a copy restarted by concurrent writes still completes."""
+        source_path = tmp_path / "source.db"
+        target = tmp_path / "backups" / "source.db"
+        backup_job = BackupJob(
+            source_database, target, pages_per_step=8, step_pause_ms=0, max_restarts=0
+        )
+        record_progress = backup_job._record_progress
+
+        def write_after_first_step(status, remaining, total):
+            record_progress(status, remaining, total)
+
+            if backup_job.pages_copied == 8:
+                with closing(sqlite3.connect(source_path)) as connection:
+                    with connection:
+                        connection.execute("INSERT INTO item (body) VALUES ('new')")
+
+        backup_job._record_progress = write_after_first_step
+        await backup_job.run()
+
+        assert backup_job.snapshot().state == "completed"
+        assert backup_job.snapshot().restarts == 1
+        assert count_rows(target, "item") == count_rows(source_path, "item")
+
+    async def test_failure_is_recorded(self, tmp_path):
+        """Tests a failed backup reports its error instead of raising."""
+        backup_job = BackupJob(
+            f"file:{tmp_path / 'missing.db'}?mode=ro",
+            tmp_path / "backups" / "missing.db",
+            pages_per_step=8,
+            step_pause_ms=0,
+        )
+
+        await backup_job.run()
+
+        assert backup_job.snapshot().state == "failed"
+        assert "unable to open" in backup_job.snapshot().error
+
+
+@pytest.mark.asyncio
+class TestDatabaseClientBackup:
+    """Test suite for backups started through DatabaseClient."""
+
+    async def test_backup_runs_in_background(
+        self, app_settings, tmp_path, customer_account_input
+    ):
+        """Tests a backup captures committed writes and refuses to overlap."""
+        with patch("src.db.database.get_app_settings", return_value=app_settings):
+            db_client = DatabaseClient()
+            await db_client.initialise()
+
+        await CustomerRepository(db_client).create(*customer_account_input(GUID))
+
+        assert db_client.get_backup_status() == []
+
+        (backup_status,) = await db_client.start_backup()
+
+        assert backup_status.state == "pending"
+
+        with pytest.raises(BackupInProgressError):
+            await db_client.start_backup()
+
+        # Closing the client waits for the backup to finish
+        await db_client.close()
+        (backup_status,) = db_client.get_backup_status()
+
+        assert backup_status.state == "completed"
+        assert count_rows(backup_status.target, "customer") == 1
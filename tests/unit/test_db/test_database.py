@@ -1,11 +1,16 @@
 from contextlib import _AsyncGeneratorContextManager
-from unittest.mock import AsyncMock, Mock, patch
+from unittest.mock import AsyncMock, Mock, call, patch
 
 import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
 from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 
 from src.db.database import DatabaseClient
+from src.errors.exceptions import DBConfigError
+from src.schemas.database.pool_stats_output import PoolStatsOutput
 
 
 @pytest.fixture
@@ -14,6 +19,35 @@ def connection_url() -> str:
     return "sqlite:///test.db"
 
 
+@pytest.fixture
+def mock_app_settings(connection_url) -> Mock:
+    """Fixture providing mocked application settings."""
+    mock_app_settings = Mock()
+    mock_app_settings.DATABASE_URL = connection_url
+    mock_app_settings.DATABASE_READ_URL = None
+    mock_app_settings.DB_POOL_SIZE = 5
+    mock_app_settings.DB_MAX_OVERFLOW = 10
+    mock_app_settings.DB_POOL_TIMEOUT = 30
+    mock_app_settings.DB_POOL_RECYCLE = -1
+    mock_app_settings.DB_POOL_PRE_PING = False
+    mock_app_settings.DB_ECHO = False
+    mock_app_settings.DB_SLOW_QUERY_MS = 200
+    mock_app_settings.DB_QUERY_LOG_SAMPLE_RATE = 0
+    mock_app_settings.DB_QUERY_PLAN_GUARD = "off"
+    mock_app_settings.DB_QUERY_PLAN_MIN_ROWS = 1000
+    mock_app_settings.DB_AUTO_MIGRATE = True
+    mock_app_settings.SQLITE_PRAGMA_PROFILE = "durable"
+    mock_app_settings.DB_SHARD_COUNT = 1
+    mock_app_settings.DB_WRITE_BATCHING = False
+    mock_app_settings.DB_IN_MEMORY = False
+    mock_app_settings.DB_BACKEND = "aiosqlite"
+    mock_app_settings.DB_WRITE_RETRY_ATTEMPTS = 5
+    mock_app_settings.DB_WRITE_RETRY_BACKOFF_MS = 10
+    mock_app_settings.DB_WRITE_RETRY_MAX_BACKOFF_MS = 200
+    mock_app_settings.DB_WRITE_RETRY_BUDGET_MS = 15000
+    return mock_app_settings
+
+
 @pytest.fixture
 def mock_engine() -> AsyncMock:
     """Fixture providing a mocked Async SQLAlchemy engine."""
@@ -36,31 +70,37 @@ class TestDatabaseClient:
         assert db._initialised is False
         assert db._engine is None
         assert db._session_factory is None
+        assert db._read_engine is None
+        assert db._read_session_factory is None
         assert db._app_settings is None
 
     @pytest.mark.asyncio
+    @patch("src.db.database.statement_cache")
+    @patch("src.db.database.SlowQueryLogger")
     @patch("src.db.database.get_app_settings")
     @patch("src.db.database.create_async_engine")
     @patch("src.db.database.sessionmaker")
-    @patch("src.db.database.SQLModel")
+    @patch("src.db.database.SchemaMigrator")
     async def test_initialise_creates_async_engine_and_tables(
         self,
-        mock_sqlmodel,
+        mock_schema_migrator,
         mock_sessionmaker,
         mock_create_engine,
         mock_get_app_settings,
+        mock_slow_query_logger,
+        mock_statement_cache,
         connection_url,
+        mock_app_settings,
         mock_engine,
         mock_session_factory,
     ):
         """Test initialise logic - DatabaseClient instance not initialised."""
-        mock_app_settings = Mock()
-        mock_app_settings.DATABASE_URL = connection_url
         mock_get_app_settings.return_value = mock_app_settings
 
-        mock_sqlmodel.metadata.return_value = Mock()
-
         mock_connection = AsyncMock()
+        mock_connection.__aenter__.return_value = mock_connection
+        mock_connection.run_sync.side_effect = [False, ["0001"]]
+        mock_engine.connect.return_value = mock_connection
         mock_engine.begin.return_value = mock_connection
         mock_create_engine.return_value = mock_engine
         mock_sessionmaker.return_value = mock_session_factory
@@ -80,15 +120,156 @@ class TestDatabaseClient:
         assert db._initialised is True
 
         mock_engine.begin.assert_called_once()
-        mock_create_engine.assert_called_once_with(url=connection_url, echo=True)
+        assert mock_connection.run_sync.call_args_list == [
+            call(mock_schema_migrator.return_value.is_current),
+            call(mock_schema_migrator.return_value.upgrade),
+        ]
+
+        pool_options = {
+            "poolclass": AsyncAdaptedQueuePool,
+            "pool_size": 5,
+            "max_overflow": 10,
+            "pool_timeout": 30,
+            "pool_recycle": -1,
+            "pool_pre_ping": False,
+        }
+        assert mock_create_engine.call_args_list == [
+            call(url=connection_url, echo=False, **pool_options),
+            call(url=db._read_url(), echo=False, **pool_options),
+        ]
+        assert db._read_engine == mock_engine
+        assert db._read_session_factory == mock_session_factory
+
+        mock_slow_query_logger.assert_called_once_with(slow_query_ms=200, sample_rate=0)
+        assert mock_slow_query_logger.return_value.register.call_count == 2
+        assert mock_statement_cache.register.call_count == 2
+
+    @pytest.mark.asyncio
+    @patch("src.db.database.SchemaMigrator")
+    async def test_create_tables_skipped_when_schema_current(
+        self, mock_schema_migrator, mock_app_settings, mock_engine
+    ):
+        """Tests warm start-up runs no DDL when the fingerprint matches."""
+        mock_connection = AsyncMock()
+        mock_connection.__aenter__.return_value = mock_connection
+        mock_connection.run_sync.return_value = True
+        mock_engine.connect.return_value = mock_connection
+
+        db = DatabaseClient()
+        db._app_settings = mock_app_settings
+        db._engine = mock_engine
+
+        await db._create_tables()
+
+        mock_connection.run_sync.assert_called_once_with(
+            mock_schema_migrator.return_value.is_current
+        )
+        mock_engine.begin.assert_not_called()
+
+    @pytest.mark.asyncio
+    @patch("src.db.database.SchemaMigrator")
+    async def test_create_tables_refuses_outdated_schema(
+        self, mock_schema_migrator, mock_app_settings, mock_engine
+    ):
+        """Tests start-up fails when migrations are pending and auto-migrate is off."""
+        mock_app_settings.DB_AUTO_MIGRATE = False
+        mock_connection = AsyncMock()
+        mock_connection.__aenter__.return_value = mock_connection
+        mock_connection.run_sync.return_value = False
+        mock_engine.connect.return_value = mock_connection
+
+        db = DatabaseClient()
+        db._app_settings = mock_app_settings
+        db._engine = mock_engine
+
+        with pytest.raises(DBConfigError) as exc_info:
+            await db._create_tables()
+
+        assert "python -m src.db.migrations" in exc_info.value.message
+        mock_engine.begin.assert_not_called()
+
+    def test_pool_options_skipped_for_in_memory_sqlite(self, mock_app_settings):
+        """Tests in-memory SQLite keeps the dialect's default pool."""
+        db = DatabaseClient()
+        db._app_settings = mock_app_settings
+
+        assert db._pool_options("sqlite+aiosqlite:///:memory:") == {}
+
+    @pytest.mark.parametrize(
+        "database_url, expected_read_url",
+        [
+            (
+                "sqlite+aiosqlite:///test.db",
+                "sqlite+aiosqlite:///file:test.db?mode=ro&uri=true",
+            ),
+            (
+                "sqlite+aiosqlite:////var/data/bank.db",
+                "sqlite+aiosqlite:///file:/var/data/bank.db?mode=ro&uri=true",
+            ),
+            (
+                "sqlite+aiosqlite:///file:bank.db?uri=true",
+                "sqlite+aiosqlite:///file:bank.db?mode=ro&uri=true",
+            ),
+            ("sqlite+aiosqlite:///:memory:", None),
+            ("postgresql+asyncpg://user@host/bank", None),
+        ],
+    )
+    def test_read_url_derived_from_database_url(
+        self, mock_app_settings, database_url, expected_read_url
+    ):
+        """Tests read-only URL derivation for the read engine."""
+        mock_app_settings.DATABASE_URL = database_url
+
+        db = DatabaseClient()
+        db._app_settings = mock_app_settings
+        read_url = db._read_url()
+
+        if expected_read_url is None:
+            assert read_url is None
+        else:
+            assert read_url.render_as_string() == expected_read_url
+
+    def test_read_url_explicit(self, mock_app_settings):
+        """Tests an explicit DATABASE_READ_URL takes precedence."""
+        mock_app_settings.DATABASE_READ_URL = "sqlite+aiosqlite:///replica.db"
+
+        db = DatabaseClient()
+        db._app_settings = mock_app_settings
+
+        assert db._read_url() == "sqlite+aiosqlite:///replica.db"
+
+    @pytest.mark.asyncio
+    async def test_read_session_uses_read_only_engine(
+        self, mock_app_settings, tmp_path
+    ):
+        """Tests reads go to a read-only engine which rejects writes."""
+        mock_app_settings.DATABASE_URL = f"sqlite+aiosqlite:///{tmp_path / 'rw.db'}"
+
+        with patch("src.db.database.get_app_settings") as mock_get_app_settings:
+            mock_get_app_settings.return_value = mock_app_settings
+            db = DatabaseClient()
+            await db.initialise()
+
+        async with db.get_session() as session:
+            await session.exec(text("CREATE TABLE marker (id INTEGER)"))
+            await session.commit()
+
+        async with db.get_read_session() as session:
+            assert (await session.exec(text("SELECT count(*) FROM marker"))).one()
+            with pytest.raises(OperationalError, match="readonly"):
+                await session.exec(text("INSERT INTO marker VALUES (1)"))
+
+        assert [stats.engine for stats in db.get_pool_stats()] == ["primary", "read"]
+        await db._engine.dispose()
+        await db._read_engine.dispose()
 
     @patch("src.db.database.get_app_settings")
     @patch("src.db.database.create_async_engine")
     @patch("src.db.database.sessionmaker")
-    @patch("src.db.database.SQLModel")
+    @patch("src.db.database.SchemaMigrator")
     def test_initialised_already(
         self,
-        mock_sqlmodel,
+        mock_schema_migrator,
         mock_sessionmaker,
         mock_create_engine,
         mock_get_app_settings,
@@ -100,9 +281,8 @@ class TestDatabaseClient:
         mock_app_settings = Mock()
         mock_get_app_settings.return_value = mock_app_settings
 
-        mock_sqlmodel.metadata.return_value = Mock()
-
         mock_connection = AsyncMock()
+        mock_connection.__aenter__.return_value = mock_connection
         mock_engine.begin.return_value = mock_connection
         mock_create_engine.return_value = mock_engine
         mock_sessionmaker.return_value = mock_session_factory
@@ -125,3 +305,22 @@ class TestDatabaseClient:
         session = db.get_session()
 
         assert isinstance(session, _AsyncGeneratorContextManager)
+
+    @pytest.mark.asyncio
+    async def test_get_session_records_checkout(self, mock_app_settings):
+        """Tests connection checkouts are reflected in the pool statistics."""
+        mock_app_settings.DATABASE_URL = "sqlite+aiosqlite:///:memory:"
+
+        with patch("src.db.database.get_app_settings") as mock_get_app_settings:
+            mock_get_app_settings.return_value = mock_app_settings
+            db = DatabaseClient()
+            await db.initialise()
+
+        async with db.get_session():
+            (stats,) = db.get_pool_stats()
+
+        assert isinstance(stats, PoolStatsOutput)
+        assert stats.pool_class == "StaticPool"
+        assert stats.checkouts == 1
+        assert stats.timeouts == 0
+        assert stats.max_wait_ms >= stats.average_wait_ms >= 0
@@ -0,0 +1,151 @@
+import asyncio
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from src.core.settings import AppSettings
+from src.db.database import DatabaseClient
+from src.db.maintenance import DatabaseMaintenance
+from src.db.sqlite_pragmas import register_pragma_profile
+
+
+@pytest.fixture
+async def engine(tmp_path):
+    """Fixture providing an engine on a database with free pages."""
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'bank.db'}")
+    register_pragma_profile(engine, "balanced")
+
+    async with engine.begin() as conn:
+        await conn.execute(text("CREATE TABLE item (id INTEGER PRIMARY KEY, body)"))
+        await conn.execute(
+            text("INSERT INTO item (body) VALUES (randomblob(2000))"),
+            [{} for _ in range(200)],
+        )
+        await conn.execute(text("CREATE INDEX ix_item_body ON item (body)"))
+        await conn.execute(text("DELETE FROM item"))
+
+    yield engine
+
+    await engine.dispose()
+
+
+def create_maintenance(engine, **options) -> DatabaseMaintenance:
+    """Create a scheduler for a single engine."""
+    options = {
+        "interval_s": 3600,
+        "idle_s": 0,
+        "vacuum_pages_per_slice": 16,
+        "vacuum_max_slices": 1000,
+        **options,
+    }
+    return DatabaseMaintenance([engine], [engine], **options)
+
+
+async def scalar(engine, statement: str):
+    """Run a single-value query on a new connection."""
+    async with engine.connect() as conn:
+        return await conn.scalar(text(statement))
+
+
+@pytest.mark.asyncio
+class TestDatabaseMaintenance:
+    """Test suite for DatabaseMaintenance class."""
+
+    async def test_new_databases_use_incremental_auto_vacuum(self, engine):
+        """Tests the pragma profiles create databases which can be vacuumed."""
+        assert await scalar(engine, "PRAGMA auto_vacuum") == 2
+
+    async def test_run_analyzes_and_vacuums(self, engine):
+        """Tests a run gathers statistics and releases every free page."""
+        maintenance = create_maintenance(engine)
+
+        assert await scalar(engine, "PRAGMA freelist_count") > 16
+
+        await maintenance.run()
+        optimize, vacuum = maintenance.snapshot()
+
+        assert await scalar(engine, "PRAGMA freelist_count") == 0
+        assert await scalar(
+            engine, "SELECT COUNT(*) FROM sqlite_master WHERE name = 'sqlite_stat1'"
+        )
+        assert optimize.runs == vacuum.runs == 1
+        assert optimize.last_result == "ANALYZE on 1 database(s)"
+        assert vacuum.last_result.endswith(" pages, 0 free pages left")
+        assert vacuum.last_run_at is not None
+        assert vacuum.last_duration_ms > 0
+        assert vacuum.last_error is None
+
+    async def test_vacuum_stops_when_traffic_arrives(self, engine):
+        """Tests only one slice is vacuumed while a connection is in use."""
+        maintenance = create_maintenance(engine)
+
+        async with engine.connect():
+            await maintenance.run()
+
+        _, vacuum = maintenance.snapshot()
+
+        assert vacuum.last_result.startswith("freed 16 pages, ")
+        assert await scalar(engine, "PRAGMA freelist_count") > 0
+
+    async def test_vacuum_reports_databases_without_auto_vacuum(self, tmp_path):
+        """Tests free pages of a database created without auto_vacuum are reported."""
+        engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'old.db'}")
+
+        async with engine.begin() as conn:
+            await conn.execute(text("CREATE TABLE item (body)"))
+            await conn.execute(
+                text("INSERT INTO item (body) VALUES (randomblob(8000))")
+            )
+            await conn.execute(text("DELETE FROM item"))
+
+        maintenance = create_maintenance(engine)
+        await maintenance.run()
+        _, vacuum = maintenance.snapshot()
+        await engine.dispose()
+
+        assert vacuum.last_result.startswith("freed 0 pages, ")
+        assert "need a one-off VACUUM" in vacuum.last_result
+
+    async def test_failed_task_is_recorded(self, engine):
+        """Tests a failing task records its error and the next task still runs."""
+        maintenance = create_maintenance(engine)
+
+        with patch.object(maintenance, "_optimize", side_effect=RuntimeError("boom")):
+            await maintenance.run()
+
+        optimize, vacuum = maintenance.snapshot()
+
+        assert optimize.last_error == "boom"
+        assert optimize.runs == 1
+        assert vacuum.last_error is None
+
+    async def test_client_runs_maintenance_in_background(self, tmp_path):
+        """Tests DatabaseClient runs maintenance once started, and stops it."""
+        app_settings = AppSettings()
+        app_settings.DATABASE_URL = f"sqlite+aiosqlite:///{tmp_path / 'bank.db'}"
+        app_settings.DB_MAINTENANCE_IDLE_S = 0
+
+        with patch("src.db.database.get_app_settings", return_value=app_settings):
+            db_client = DatabaseClient()
+            await db_client.initialise()
+
+        assert db_client.get_maintenance_status() == []
+
+        db_client.start_maintenance()
+
+        for _ in range(100):
+            if all(status.runs for status in db_client.get_maintenance_status()):
+                break
+            await asyncio.sleep(0.05)
+
+        assert [status.task for status in db_client.get_maintenance_status()] == [
+            "optimize",
+            "incremental_vacuum",
+        ]
+        assert all(status.runs == 1 for status in db_client.get_maintenance_status())
+
+        await db_client.close()
+
+        assert db_client.get_maintenance_status() == []
@@ -0,0 +1,114 @@
+import asyncio
+import sqlite3
+import uuid
+from unittest.mock import patch
+
+import pytest
+
+from src.core.settings import AppSettings
+from src.db.database import DatabaseClient
+from src.db.memory_snapshot import InMemoryDatabase
+from src.errors.exceptions import DBConfigError
+from src.repositories.customer_repository import CustomerRepository
+
+GUID = "3566661b-bba9-4bd0-a82c-2966c34db25f"
+
+
+@pytest.fixture
+def app_settings(tmp_path) -> AppSettings:
+    """Fixture providing settings for an in-memory database with a snapshot file."""
+    app_settings = AppSettings()
+    app_settings.DATABASE_URL = f"sqlite+aiosqlite:///{tmp_path / 'bank.db'}"
+    app_settings.DB_IN_MEMORY = True
+    app_settings.DB_SNAPSHOT_INTERVAL_S = 0
+    app_settings.DB_WRITE_BATCHING = False
+    app_settings.DB_SHARD_COUNT = 1
+    return app_settings
+
+
+async def create_db_client(app_settings: AppSettings) -> DatabaseClient:
+    """Initialise a DatabaseClient with the given settings."""
+    with patch("src.db.database.get_app_settings", return_value=app_settings):
+        db_client = DatabaseClient()
+        await db_client.initialise()
+
+    return db_client
+
+
+def snapshot_customers(tmp_path) -> list:
+    """Read the customer guids saved in the snapshot file."""
+    with sqlite3.connect(tmp_path / "bank.db") as snapshot:
+        return [
+            str(uuid.UUID(bytes=row[0]))
+            for row in snapshot.execute("SELECT guid FROM customer")
+        ]
+
+
+@pytest.mark.parametrize(
+    "database_url, snapshot_path",
+    [
+        ("sqlite+aiosqlite:///bank.db", "bank.db"),
+        ("sqlite+aiosqlite:///file:/var/data/bank.db?uri=true", "/var/data/bank.db"),
+    ],
+)
+def test_snapshot_path_from_database_url(database_url, snapshot_path):
+    """Tests the DATABASE_URL file is used as the snapshot."""
+    in_memory_database = InMemoryDatabase(database_url, snapshot_interval_s=0)
+
+    assert str(in_memory_database.snapshot_path) == snapshot_path
+    assert in_memory_database.url.query["cache"] == "shared"
+
+
+@pytest.mark.parametrize(
+    "database_url",
+    ["sqlite+aiosqlite:///:memory:", "postgresql+asyncpg://user@host/bank"],
+)
+def test_snapshot_requires_sqlite_file(database_url):
+    """Tests in-memory mode is refused without a file to snapshot to."""
+    with pytest.raises(DBConfigError):
+        InMemoryDatabase(database_url, snapshot_interval_s=0)
+
+
+@pytest.mark.asyncio
+class TestInMemoryDatabase:
+    """Test suite for the in-memory mode of DatabaseClient."""
+
+    async def test_snapshot_saved_on_close_and_restored(
+        self, app_settings, tmp_path, customer_account_input
+    ):
+        """Tests writes reach the file on shutdown and are loaded on start-up."""
+        db_client = await create_db_client(app_settings)
+        await CustomerRepository(db_client).create(*customer_account_input(GUID))
+
+        assert not (tmp_path / "bank.db").exists()
+        assert db_client.get_pool_stats()[0].size == 1
+
+        await db_client.close()
+        assert snapshot_customers(tmp_path) == [GUID]
+
+        db_client = await create_db_client(app_settings)
+        customer = await CustomerRepository(db_client).find_by_guid(GUID)
+
+        assert customer.guid == GUID
+        await db_client.close()
+
+    async def test_snapshot_saved_periodically(
+        self, app_settings, tmp_path, customer_account_input
+    ):
+        """Tests snapshots are taken in the background at the configured interval."""
+        app_settings.DB_SNAPSHOT_INTERVAL_S = 0.05
+        db_client = await create_db_client(app_settings)
+        await CustomerRepository(db_client).create(*customer_account_input(GUID))
+
+        await asyncio.sleep(0.2)
+
+        assert db_client._in_memory_database.snapshots >= 1
+        assert snapshot_customers(tmp_path) == [GUID]
+        await db_client.close()
+
+    async def test_write_batching_refused(self, app_settings):
+        """Tests in-memory mode cannot be combined with group commit."""
+        app_settings.DB_WRITE_BATCHING = True
+
+        with pytest.raises(DBConfigError):
+            await create_db_client(app_settings)
@@ -0,0 +1,349 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import (
+    Column,
+    Integer,
+    MetaData,
+    String,
+    Table,
+    insert,
+    inspect,
+    select,
+    text,
+    update,
+)
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.schema import CreateTable
+
+from src.db.migrations import (
+    MIGRATIONS,
+    Migration,
+    SchemaMigrator,
+    schema_fingerprint,
+)
+from src.enums.account_status import AccountStatus
+from src.models.banking_models import Account, Customer, CustomerAccountLink, SQLModel
+
+CUSTOMER_GUID = "3566661b-bba9-4bd0-a82c-2966c34db25f"
+TRANSACTION_INDEXES = (
+    "ix_transaction_creditor_account_transaction_date",
+    "ix_transaction_debtor_account_transaction_date",
+)
+
+
+@pytest.fixture
+async def engine(tmp_path):
+    """Fixture providing an engine for an empty database file."""
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'schema.db'}")
+    yield engine
+    await engine.dispose()
+
+
+async def recorded_version(engine):
+    """Returns the version and fingerprint stored in the database."""
+    async with engine.connect() as conn:
+        result = await conn.execute(
+            text("SELECT version, fingerprint FROM schemaversion")
+        )
+        return result.all()
+
+
+@pytest.mark.asyncio
+class TestSchemaMigrator:
+    """Test suite for SchemaMigrator class."""
+
+    async def test_fresh_database_created_and_stamped(self, engine):
+        """Tests an empty database is built from the models and stamped."""
+        migrator = SchemaMigrator()
+
+        async with engine.connect() as conn:
+            assert not await conn.run_sync(migrator.is_current)
+
+        async with engine.begin() as conn:
+            applied = await conn.run_sync(migrator.upgrade)
+            tables = await conn.run_sync(
+                lambda sync_conn: inspect(sync_conn).get_table_names()
+            )
+
+        assert applied == [migration.version for migration in MIGRATIONS]
+        assert {"customer", "account", "customeraccountlink"} <= set(tables)
+        assert await recorded_version(engine) == [
+            (migrator.head, schema_fingerprint(SQLModel.metadata, engine.dialect))
+        ]
+
+        async with engine.connect() as conn:
+            assert await conn.run_sync(migrator.is_current)
+
+    async def test_current_database_not_migrated_again(self, engine):
+        """Tests upgrading a current database applies nothing."""
+        async with engine.begin() as conn:
+            await conn.run_sync(SchemaMigrator().upgrade)
+
+        async with engine.begin() as conn:
+            assert await conn.run_sync(SchemaMigrator().upgrade) == []
+
+    async def test_pending_migrations_applied_in_order(self, engine):
+        """Tests only migrations after the recorded version are applied."""
+        calls = []
+        migrations = [
+            Migration("0001", "Initial", lambda conn: calls.append("0001")),
+            Migration("0002", "Second", lambda conn: calls.append("0002")),
+        ]
+        metadata = MetaData()
+        Table("widget", metadata, Column("id", Integer, primary_key=True))
+
+        async with engine.begin() as conn:
+            await conn.run_sync(metadata.create_all)
+            await conn.run_sync(SchemaMigrator(metadata, migrations[:1]).upgrade)
+
+        assert calls == ["0001"]
+
+        async with engine.begin() as conn:
+            applied = await conn.run_sync(SchemaMigrator(metadata, migrations).upgrade)
+
+        assert applied == ["0002"]
+        assert calls == ["0001", "0002"]
+        assert (await recorded_version(engine))[0][0] == "0002"
+
+    async def test_secondary_indexes_added_to_existing_database(self, engine):
+        """Tests a database stamped before the indexes existed gains them."""
+        async with engine.begin() as conn:
+            await conn.run_sync(SchemaMigrator(migrations=MIGRATIONS[:1]).upgrade)
+            for index in ("ix_customeraccountlink_account_guid", *TRANSACTION_INDEXES):
+                await conn.execute(text(f"DROP INDEX {index}"))
+
+        async with engine.begin() as conn:
+            applied = await conn.run_sync(SchemaMigrator().upgrade)
+            transaction_indexes = await conn.run_sync(
+                lambda sync_conn: inspect(sync_conn).get_indexes("transaction")
+            )
+
+        assert applied == [migration.version for migration in MIGRATIONS[1:]]
+        assert sorted(index["name"] for index in transaction_indexes) == sorted(
+            TRANSACTION_INDEXES
+        )
+
+        async with engine.connect() as conn:
+            plan = await conn.execute(
+                text(
+                    'EXPLAIN QUERY PLAN SELECT guid FROM "transaction" '
+                    "WHERE creditor_account = :guid "
+                    "ORDER BY transaction_date DESC LIMIT 10"
+                ),
+                {"guid": CUSTOMER_GUID},
+            )
+
+        assert "ix_transaction_creditor_account_transaction_date" in plan.all()[0][3]
+
+    async def test_text_guids_converted_to_bytes(self, engine):
+        """Tests GUIDs stored as text are rewritten as 16-byte blobs."""
+        async with engine.begin() as conn:
+            await conn.run_sync(SchemaMigrator(migrations=MIGRATIONS[:2]).upgrade)
+            await conn.execute(
+                text(
+                    "INSERT INTO customer (guid, first_name, last_name, "
+                    "date_of_birth, phone_number, address, is_deleted) "
+                    "VALUES (:guid, 'Joe', 'Bloggs', '1990-01-01', '07123456789', "
+                    "'1 Road', 0)"
+                ),
+                {"guid": CUSTOMER_GUID},
+            )
+            await conn.execute(
+                text(
+                    "INSERT INTO customeraccountlink (customer_guid, account_guid, "
+                    "is_deleted) VALUES (:guid, :guid, 0)"
+                ),
+                {"guid": CUSTOMER_GUID},
+            )
+
+        async with engine.begin() as conn:
+            assert await conn.run_sync(SchemaMigrator().upgrade) == [
+                "0003",
+                "0004",
+                "0005",
+                "0006",
+            ]
+
+        async with engine.connect() as conn:
+            stored = await conn.scalar(text("SELECT typeof(guid) FROM customer"))
+            guids = await conn.execute(
+                select(Customer.guid).join(
+                    CustomerAccountLink,
+                    CustomerAccountLink.customer_guid == Customer.guid,
+                )
+            )
+
+            assert stored == "blob"
+            assert guids.scalars().all() == [CUSTOMER_GUID]
+
+    async def test_link_table_rebuilt_without_rowid(self, engine):
+        """Tests a rowid link table is rebuilt clustered, keeping its rows."""
+        async with engine.begin() as conn:
+            await conn.run_sync(SchemaMigrator(migrations=MIGRATIONS[:3]).upgrade)
+            await conn.execute(text("DROP TABLE customeraccountlink"))
+            await conn.execute(
+                text(
+                    "CREATE TABLE customeraccountlink (created_at TIMESTAMP, "
+                    "customer_guid BLOB NOT NULL, account_guid BLOB NOT NULL, "
+                    "last_updated_at TIMESTAMP, is_deleted BOOLEAN NOT NULL, "
+                    "PRIMARY KEY (customer_guid, account_guid))"
+                )
+            )
+            await conn.execute(
+                text(
+                    "CREATE INDEX ix_customeraccountlink_account_guid "
+                    "ON customeraccountlink (account_guid, customer_guid)"
+                )
+            )
+            await conn.execute(
+                insert(CustomerAccountLink).values(
+                    customer_guid=CUSTOMER_GUID, account_guid=CUSTOMER_GUID
+                )
+            )
+
+        async with engine.begin() as conn:
+            assert await conn.run_sync(SchemaMigrator().upgrade) == [
+                "0004",
+                "0005",
+                "0006",
+            ]
+
+        async with engine.connect() as conn:
+            ddl = await conn.scalar(
+                text("SELECT sql FROM sqlite_master WHERE name = 'customeraccountlink'")
+            )
+            indexes = await conn.run_sync(
+                lambda sync_conn: inspect(sync_conn).get_indexes("customeraccountlink")
+            )
+            links = await conn.execute(select(CustomerAccountLink.account_guid))
+
+            assert ddl.rstrip().endswith("WITHOUT ROWID")
+            assert [index["name"] for index in indexes] == [
+                "ix_customeraccountlink_account_guid"
+            ]
+            assert links.scalars().all() == [CUSTOMER_GUID]
+
+    async def test_tables_rebuilt_with_timestamp_defaults(self, engine):
+        """Tests tables without SQL timestamp defaults are rebuilt with them."""
+        async with engine.begin() as conn:
+            await conn.run_sync(SchemaMigrator(migrations=MIGRATIONS[:4]).upgrade)
+            await conn.execute(text("DROP TABLE account"))
+            await conn.execute(
+                text(
+                    "CREATE TABLE account (guid BLOB NOT NULL, created_at TIMESTAMP, "
+                    "account_name VARCHAR(100) NOT NULL, status VARCHAR(8), "
+                    "last_updated_at TIMESTAMP, is_deleted BOOLEAN NOT NULL, "
+                    "PRIMARY KEY (guid))"
+                )
+            )
+            await conn.execute(
+                insert(Account).values(
+                    guid=CUSTOMER_GUID,
+                    created_at=datetime(2024, 1, 1),
+                    account_name="Savings",
+                    status=AccountStatus.ACTIVE,
+                    last_updated_at=datetime(2024, 1, 1),
+                )
+            )
+
+        async with engine.begin() as conn:
+            assert await conn.run_sync(SchemaMigrator().upgrade) == ["0005", "0006"]
+            await conn.execute(update(Account).values(account_name="Current"))
+
+        async with engine.connect() as conn:
+            account = (
+                await conn.execute(select(Account.created_at, Account.last_updated_at))
+            ).one()
+            triggers = await conn.execute(
+                text("SELECT name FROM sqlite_master WHERE type = 'trigger'")
+            )
+
+            assert account.created_at == datetime(2024, 1, 1)
+            assert account.last_updated_at > datetime(2024, 1, 1)
+            assert "trg_account_last_updated_at" in triggers.scalars().all()
+
+    async def test_active_transaction_index_dropped(self, engine):
+        """Tests the unused partial index on transactions is dropped."""
+        async with engine.begin() as conn:
+            await conn.run_sync(SchemaMigrator(migrations=MIGRATIONS[:5]).upgrade)
+            await conn.execute(
+                text(
+                    "CREATE INDEX ix_transaction_active_transaction_date "
+                    'ON "transaction" (transaction_date) WHERE is_deleted = 0'
+                )
+            )
+
+        async with engine.begin() as conn:
+            assert await conn.run_sync(SchemaMigrator().upgrade) == ["0006"]
+            transaction_indexes = await conn.run_sync(
+                lambda sync_conn: inspect(sync_conn).get_indexes("transaction")
+            )
+
+        assert sorted(index["name"] for index in transaction_indexes) == sorted(
+            TRANSACTION_INDEXES
+        )
+
+
+@pytest.mark.asyncio
+async def test_timestamps_set_by_the_database(engine):
+    """Tests timestamps default in SQL and updates stamp last_updated_at."""
+    async with engine.begin() as conn:
+        await conn.run_sync(SchemaMigrator().upgrade)
+        await conn.execute(
+            insert(Account).values(
+                guid=CUSTOMER_GUID, account_name="Savings", status=AccountStatus.ACTIVE
+            )
+        )
+        created = (
+            await conn.execute(select(Account.created_at, Account.last_updated_at))
+        ).one()
+
+    await asyncio.sleep(0.01)
+
+    async with engine.begin() as conn:
+        await conn.execute(update(Account).values(account_name="Current"))
+        updated = (
+            await conn.execute(select(Account.created_at, Account.last_updated_at))
+        ).one()
+        await conn.execute(update(Account).values(last_updated_at=datetime(2024, 1, 1)))
+        explicit = await conn.scalar(select(Account.last_updated_at))
+
+    utc_now = datetime.now(timezone.utc).replace(tzinfo=None)
+
+    assert abs(created.created_at - utc_now) < timedelta(seconds=5)
+    assert created.created_at == created.last_updated_at
+    assert updated.created_at == created.created_at
+    assert updated.last_updated_at > created.last_updated_at
+    assert explicit == datetime(2024, 1, 1)
+
+
+def test_timestamp_defaults_compile_for_other_dialects():
+    """Tests the timestamp defaults use the dialect's own clock outside SQLite."""
+    for table in SQLModel.metadata.sorted_tables:
+        ddl = str(CreateTable(table).compile(dialect=postgresql.dialect()))
+
+        assert "strftime" not in ddl
+        if "last_updated_at" in table.columns:
+            assert (
+                "last_updated_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP"
+                in ddl
+            )
+
+
+def test_fingerprint_changes_with_models():
+    """Tests the fingerprint reflects column changes."""
+    dialect = sqlite.dialect()
+    before = MetaData()
+    Table("widget", before, Column("id", Integer, primary_key=True))
+    after = MetaData()
+    Table(
+        "widget",
+        after,
+        Column("id", Integer, primary_key=True),
+        Column("name", String(20)),
+    )
+
+    assert schema_fingerprint(before, dialect) != schema_fingerprint(after, dialect)
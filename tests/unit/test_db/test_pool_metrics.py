@@ -0,0 +1,51 @@
+import sqlite3
+
+import pytest
+from sqlalchemy.pool import QueuePool, StaticPool
+
+from src.db.pool_metrics import PoolMetrics
+
+
+class TestPoolMetrics:
+    """Test suite for PoolMetrics class."""
+
+    def test_snapshot_reports_queue_pool_occupancy(self):
+        """Tests checked out, idle and overflow counts come from the pool."""
+        pool = QueuePool(lambda: sqlite3.connect(":memory:"), pool_size=1)
+        metrics = PoolMetrics("primary")
+
+        first = pool.connect()
+        second = pool.connect()
+        metrics.record_checkout(0.002)
+        metrics.record_checkout(0.004)
+
+        stats = metrics.snapshot(pool)
+
+        assert stats.engine == "primary"
+        assert stats.pool_class == "QueuePool"
+        assert stats.size == 1
+        assert stats.checked_out == 2
+        assert stats.idle == 0
+        assert stats.overflow == 1
+        assert stats.checkouts == 2
+        assert stats.average_wait_ms == pytest.approx(3)
+        assert stats.max_wait_ms == pytest.approx(4)
+
+        first.close()
+        second.close()
+
+        assert metrics.snapshot(pool).checked_out == 0
+
+    def test_snapshot_unsized_pool(self):
+        """Tests pools without a fixed size report zero occupancy."""
+        pool = StaticPool(lambda: sqlite3.connect(":memory:"))
+        metrics = PoolMetrics("primary")
+        metrics.record_timeout()
+
+        stats = metrics.snapshot(pool)
+
+        assert stats.pool_class == "StaticPool"
+        assert stats.size == 0
+        assert stats.checked_out == 0
+        assert stats.timeouts == 1
+        assert stats.average_wait_ms == 0
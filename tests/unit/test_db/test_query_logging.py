@@ -0,0 +1,59 @@
+import logging
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from src.db.query_logging import SlowQueryLogger, track_query_origin
+
+
+@pytest.fixture
+async def engine():
+    """Fixture providing an in-memory async engine."""
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    yield engine
+    await engine.dispose()
+
+
+async def run_query(engine):
+    """Executes a statement from a tracked origin."""
+    with track_query_origin():
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+
+
+@pytest.mark.asyncio
+class TestSlowQueryLogger:
+    """Test suite for SlowQueryLogger class."""
+
+    async def test_slow_query_logged_as_warning(self, engine, caplog):
+        """Tests statements above the threshold are logged with their origin."""
+        SlowQueryLogger(slow_query_ms=0).register(engine)
+
+        with caplog.at_level(logging.INFO, logger="src.logger"):
+            await run_query(engine)
+
+        (record,) = caplog.records
+        assert record.levelno == logging.WARNING
+        assert record.getMessage().startswith("Slow query (")
+        assert "from unknown: SELECT 1" in record.getMessage()
+
+    async def test_fast_query_not_logged(self, engine, caplog):
+        """Tests statements below the threshold are not logged."""
+        SlowQueryLogger(slow_query_ms=60_000).register(engine)
+
+        with caplog.at_level(logging.INFO, logger="src.logger"):
+            await run_query(engine)
+
+        assert caplog.records == []
+
+    async def test_fast_query_sampled(self, engine, caplog):
+        """Tests sampled statements are logged at info level."""
+        SlowQueryLogger(slow_query_ms=60_000, sample_rate=1).register(engine)
+
+        with caplog.at_level(logging.INFO, logger="src.logger"):
+            await run_query(engine)
+
+        (record,) = caplog.records
+        assert record.levelno == logging.INFO
+        assert record.getMessage().startswith("Sampled query (")
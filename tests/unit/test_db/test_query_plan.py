@@ -0,0 +1,300 @@
+import sqlite3
+import uuid
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy import event, text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from src.core.settings import AppSettings
+from src.db.database import DatabaseClient
+from src.db.query_plan import QueryPlanGuard, allow_full_scan
+from src.enums.relationship_loading import RelationshipLoading
+from src.errors.exceptions import DBConfigError, FullTableScanError
+from src.repositories.account_repository import AccountRepository
+from src.repositories.customer_repository import CustomerRepository
+from src.schemas.account.account_update import AccountUpdate
+from src.schemas.customer.customer_update import CustomerUpdate
+
+CUSTOMERS = 20
+GUIDS = [str(uuid.UUID(int=index + 1, version=4)) for index in range(CUSTOMERS)]
+
+
+@pytest.fixture
+async def engine(tmp_path):
+    """Fixture providing an engine with a 20 row customer table."""
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'plan.db'}")
+
+    async with engine.begin() as conn:
+        await conn.execute(
+            text("CREATE TABLE customer (guid TEXT PRIMARY KEY, last_name TEXT)")
+        )
+        await conn.execute(
+            text("INSERT INTO customer VALUES (:guid, 'Bloggs')"),
+            [{"guid": guid} for guid in GUIDS],
+        )
+
+    yield engine
+
+    await engine.dispose()
+
+
+async def run_from_repository(engine, statement: str, origin: str = "Repo.find"):
+    """Execute a statement as if issued by a repository method."""
+    with patch("src.db.query_plan.current_query_origin", return_value=origin):
+        async with engine.connect() as conn:
+            return (await conn.execute(text(statement), {"guid": GUIDS[0]})).all()
+
+
+@pytest.fixture
+async def guarded_db_client(tmp_path, customer_account_input):
+    """Fixture providing a client which raises on full scans of 10+ rows."""
+    app_settings = AppSettings()
+    app_settings.DATABASE_URL = f"sqlite+aiosqlite:///{tmp_path / 'bank.db'}"
+    app_settings.DB_QUERY_PLAN_GUARD = "raise"
+    app_settings.DB_QUERY_PLAN_MIN_ROWS = 10
+
+    with patch("src.db.database.get_app_settings", return_value=app_settings):
+        db_client = DatabaseClient()
+        await db_client.initialise()
+
+    customer_repository = CustomerRepository(db_client)
+
+    for guid in GUIDS:
+        await customer_repository.create(*customer_account_input(guid))
+
+    yield db_client
+
+    await db_client.close()
+
+
+def test_unknown_mode_rejected():
+    """Tests an unknown DB_QUERY_PLAN_GUARD is a configuration error."""
+    with pytest.raises(DBConfigError):
+        QueryPlanGuard(mode="strict", min_rows=0)
+
+
+@pytest.mark.asyncio
+class TestQueryPlanGuard:
+    """Test suite for QueryPlanGuard class."""
+
+    async def test_full_scan_raises(self, engine):
+        """Tests a repository query scanning a large table fails."""
+        QueryPlanGuard(mode="raise", min_rows=10).register(engine)
+
+        with pytest.raises(FullTableScanError) as exc_info:
+            await run_from_repository(
+                engine, "SELECT guid FROM customer WHERE last_name = 'Bloggs'"
+            )
+
+        assert "Repo.find on customer (20 rows)" in exc_info.value.message
+
+    async def test_index_search_allowed(self, engine):
+        """Tests a primary key lookup passes the guard."""
+        QueryPlanGuard(mode="raise", min_rows=10).register(engine)
+
+        rows = await run_from_repository(
+            engine, "SELECT last_name FROM customer WHERE guid = :guid"
+        )
+
+        assert rows == [("Bloggs",)]
+
+    async def test_small_table_scan_allowed(self, engine):
+        """Tests scans are tolerated below the row threshold."""
+        QueryPlanGuard(mode="raise", min_rows=CUSTOMERS).register(engine)
+
+        rows = await run_from_repository(engine, "SELECT guid FROM customer")
+
+        assert len(rows) == CUSTOMERS
+
+    async def test_queries_outside_repositories_ignored(self, engine):
+        """Tests statements without a repository origin are not explained."""
+        QueryPlanGuard(mode="raise", min_rows=10).register(engine)
+
+        async with engine.connect() as conn:
+            rows = (await conn.execute(text("SELECT guid FROM customer"))).all()
+
+        assert len(rows) == CUSTOMERS
+
+    async def test_allowed_method_ignored(self, engine):
+        """Tests methods exempted with allow_full_scan may scan."""
+
+        class ReportRepository:
+            @allow_full_scan
+            async def export(self):
+                pass
+
+        QueryPlanGuard(mode="raise", min_rows=10).register(engine)
+
+        rows = await run_from_repository(
+            engine,
+            "SELECT guid FROM customer",
+            origin=ReportRepository.export.__qualname__,
+        )
+
+        assert len(rows) == CUSTOMERS
+
+    async def test_warn_mode_logs(self, engine):
+        """Tests warn mode logs the plan and lets the query run."""
+        QueryPlanGuard(mode="warn", min_rows=10).register(engine)
+
+        with patch("src.db.query_plan.logger") as mock_logger:
+            rows = await run_from_repository(engine, "SELECT guid FROM customer")
+
+        assert len(rows) == CUSTOMERS
+        assert "plan: SCAN customer" in mock_logger.warning.call_args.args[0]
+
+
+@pytest.mark.asyncio
+class TestRepositoryQueryPlans:
+    """Checks the hot repository paths search rather than scan tables."""
+
+    async def test_customer_repository(self, guarded_db_client):
+        """Tests customer lookups, updates and deletes use indexes."""
+        customer_repository = CustomerRepository(guarded_db_client)
+
+        assert await customer_repository.find_by_guid(GUIDS[1])
+        assert await customer_repository.customer_exists_by_guid(GUIDS[1])
+        assert await customer_repository.update(
+            GUIDS[1], CustomerUpdate(last_name="Smith")
+        )
+        assert await customer_repository.delete(GUIDS[1])
+        assert len(await customer_repository.get_page(None, CUSTOMERS)) == CUSTOMERS - 1
+
+    async def test_account_repository(self, guarded_db_client, customer_account_input):
+        """Tests account lookups, updates and deletes use indexes."""
+        account_repository = AccountRepository(guarded_db_client)
+        _, account_input = customer_account_input(GUIDS[1])
+
+        assert await account_repository.account_exists_by_guid(account_input.guid)
+        assert await account_repository.find_by_guid(account_input.guid)
+        assert await account_repository.update(
+            account_input.guid, AccountUpdate(account_name="Savings")
+        )
+        assert len(await account_repository.get_page(None, CUSTOMERS)) == CUSTOMERS
+
+    async def test_pages_search_primary_key(
+        self, guarded_db_client, customer_account_input
+    ):
+        """Tests paging through customers and accounts uses their primary keys."""
+        account_guids = [customer_account_input(guid)[1].guid for guid in GUIDS]
+
+        for repository, guids in (
+            (CustomerRepository(guarded_db_client), GUIDS),
+            (AccountRepository(guarded_db_client), account_guids),
+        ):
+            paged, after = [], None
+            while page := await repository.get_page(after, 7):
+                paged.extend(record.guid for record in page)
+                after = page[-1].guid
+
+            assert paged == sorted(guids)
+
+    async def test_row_projections_match_entity_mapping(
+        self, guarded_db_client, customer_account_input
+    ):
+        """Tests records read as rows equal the DTOs update() maps from entities."""
+        _, account_input = customer_account_input(GUIDS[1])
+
+        for repository, guid, data in (
+            (CustomerRepository(guarded_db_client), GUIDS[1], CustomerUpdate()),
+            (AccountRepository(guarded_db_client), account_input.guid, AccountUpdate()),
+        ):
+            page = await repository.get_page(None, CUSTOMERS)
+            (record,) = [record for record in page if record.guid == guid]
+
+            assert record == await repository.update(guid, data)
+
+    @pytest.mark.parametrize(
+        "include, statements_per_read",
+        [
+            (RelationshipLoading.NONE, 1),
+            (RelationshipLoading.SELECTIN, 2),
+            (RelationshipLoading.JOINED, 1),
+        ],
+    )
+    async def test_include_chooses_relationship_loading(
+        self, guarded_db_client, customer_account_input, include, statements_per_read
+    ):
+        """Tests each include mode loads related records with its own statements."""
+        statements = []
+        for engine in {guarded_db_client._engine, guarded_db_client._read_engine}:
+            event.listen(
+                engine.sync_engine,
+                "before_cursor_execute",
+                lambda conn, cursor, statement, *args: statements.append(statement),
+            )
+        _, account_input = customer_account_input(GUIDS[1])
+
+        customers = await CustomerRepository(guarded_db_client).get_page(
+            None, CUSTOMERS, include
+        )
+        account = await AccountRepository(guarded_db_client).find_by_guid(
+            account_input.guid, include
+        )
+
+        assert len(statements) == 2 * statements_per_read
+        assert [customer.guid for customer in customers] == GUIDS
+
+        if include is RelationshipLoading.NONE:
+            assert not any(customer.accounts for customer in customers)
+            assert account.customers == []
+        else:
+            assert all(len(customer.accounts) == 1 for customer in customers)
+            assert [customer.guid for customer in account.customers] == [GUIDS[1]]
+
+    async def test_json_documents_match_schema_dumps(
+        self, guarded_db_client, customer_account_input
+    ):
+        """Tests documents built in SQL equal the DTOs' JSON, from index searches."""
+        _, account_input = customer_account_input(GUIDS[1])
+
+        for repository, guid in (
+            (CustomerRepository(guarded_db_client), GUIDS[1]),
+            (AccountRepository(guarded_db_client), account_input.guid),
+        ):
+            documents = await repository.get_page_documents(None, CUSTOMERS)
+            page = await repository.get_page(None, CUSTOMERS)
+
+            assert [row.document for row in documents] == [
+                record.model_dump_json() for record in page
+            ]
+            assert (await repository.find_document_by_guid(guid)) == (
+                await repository.find_by_guid(guid)
+            ).model_dump_json()
+            assert await repository.find_document_by_guid(GUIDS[0][::-1]) is None
+
+    async def test_link_traversals_search_one_index(
+        self, guarded_db_client, customer_account_input, tmp_path
+    ):
+        """Tests loading either side's linked records reads one index range."""
+        statements = []
+        for engine in {guarded_db_client._engine, guarded_db_client._read_engine}:
+            event.listen(
+                engine.sync_engine,
+                "before_cursor_execute",
+                lambda conn, cursor, statement, parameters, *args: statements.append(
+                    (statement, parameters)
+                ),
+            )
+        _, account_input = customer_account_input(GUIDS[1])
+
+        await CustomerRepository(guarded_db_client).find_by_guid(GUIDS[1])
+        await AccountRepository(guarded_db_client).find_by_guid(account_input.guid)
+
+        with sqlite3.connect(tmp_path / "bank.db") as conn:
+            link_plans = [
+                detail
+                for statement, parameters in statements
+                if "FROM customeraccountlink JOIN" in statement
+                for *_, detail in conn.execute(
+                    f"EXPLAIN QUERY PLAN {statement}", parameters
+                )
+                if "customeraccountlink" in detail
+            ]
+
+        assert link_plans == [
+            "SEARCH customeraccountlink USING PRIMARY KEY (customer_guid=?)",
+            "SEARCH customeraccountlink USING COVERING INDEX "
+            "ix_customeraccountlink_account_guid (account_guid=?)",
+        ]
@@ -0,0 +1,163 @@
+import json
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy import select, text
+
+from src.core.settings import AppSettings
+from src.db.database import DatabaseClient
+from src.db.sharding import shard_id_for, shard_urls
+from src.enums.relationship_loading import RelationshipLoading
+from src.errors.exceptions import ShardRoutingError
+from src.models.banking_models import Customer, CustomerAccountLink
+from src.repositories.account_repository import AccountRepository
+from src.repositories.customer_repository import CustomerRepository
+from src.schemas.account.account_update import AccountUpdate
+from src.schemas.customer.customer_update import CustomerUpdate
+
+SHARD_IDS = ["0", "1", "2"]
+CUSTOMER_GUIDS = [
+    "3566661b-bba9-4bd0-a82c-2966c34db25f",
+    "b7630c77-412e-4fbd-9ee2-ac043002e0d1",
+    "6e7e9655-c6ad-4069-80a6-2c6bb6cd114e",
+    "0c1d7e8a-5a0f-4a3e-9d55-8d1a9f3c2b61",
+    "f2b8c1a4-93d7-4e2b-a0c6-5e7d8f9a1b23",
+    "9a4e2c6b-1d3f-4b5a-8c7e-2f1a0b9c8d74",
+]
+
+
+@pytest.fixture
+async def sharded_db_client(customer_account_input):
+    """Fixture providing a client sharded over three in-memory databases."""
+    app_settings = AppSettings()
+    app_settings.DATABASE_URL = "sqlite+aiosqlite:///:memory:"
+    app_settings.DB_SHARD_COUNT = len(SHARD_IDS)
+
+    with patch("src.db.database.get_app_settings", return_value=app_settings):
+        db_client = DatabaseClient()
+        await db_client.initialise()
+
+    customer_repo = CustomerRepository(db_client)
+    for guid in CUSTOMER_GUIDS:
+        await customer_repo.create(*customer_account_input(guid))
+
+    yield db_client
+
+    for engine in db_client._shard_engines.values():
+        await engine.dispose()
+
+
+def test_shard_id_for_is_stable_and_spread():
+    """Tests placement is deterministic and uses every shard."""
+    placements = [shard_id_for(guid, SHARD_IDS) for guid in CUSTOMER_GUIDS]
+
+    assert placements == [shard_id_for(guid, SHARD_IDS) for guid in CUSTOMER_GUIDS]
+    assert set(placements) == set(SHARD_IDS)
+
+
+@pytest.mark.parametrize(
+    "database_url, expected_shard_url",
+    [
+        ("sqlite+aiosqlite:///data/bank.db", "sqlite+aiosqlite:///data/bank_shard1.db"),
+        ("sqlite+aiosqlite:///:memory:", "sqlite+aiosqlite:///:memory:"),
+    ],
+)
+def test_shard_urls(database_url, expected_shard_url):
+    """Tests a URL is derived for each shard from DATABASE_URL."""
+    urls = shard_urls(database_url, 2)
+
+    assert list(urls) == ["0", "1"]
+    assert urls["1"].render_as_string() == expected_shard_url
+
+
+@pytest.mark.asyncio
+class TestShardedDatabaseClient:
+    """Test suite for DatabaseClient in sharded mode."""
+
+    async def test_customer_rows_stored_on_their_shard(self, sharded_db_client):
+        """Tests customers, their accounts and links live on a single shard."""
+        for shard_id, engine in sharded_db_client._shard_engines.items():
+            expected_guids = {
+                guid
+                for guid in CUSTOMER_GUIDS
+                if shard_id_for(guid, SHARD_IDS) == shard_id
+            }
+
+            async with engine.connect() as conn:
+                customers = await conn.execute(select(Customer.guid))
+                links = await conn.execute(select(CustomerAccountLink.customer_guid))
+                account_count = await conn.execute(text("SELECT count(*) FROM account"))
+
+                assert set(customers.scalars()) == expected_guids
+                assert set(links.scalars()) == expected_guids
+                assert account_count.scalar() == len(expected_guids)
+
+    async def test_repositories_route_transparently(
+        self, sharded_db_client, customer_account_input
+    ):
+        """Tests repository reads scatter-gather and writes reach the right shard."""
+        customer_repo = CustomerRepository(sharded_db_client)
+        account_repo = AccountRepository(sharded_db_client)
+        guid = CUSTOMER_GUIDS[0]
+        account_guid = customer_account_input(guid)[1].guid
+
+        accounts = await account_repo.get_page(None, len(CUSTOMER_GUIDS))
+        assert len(accounts) == len(CUSTOMER_GUIDS)
+        for include in RelationshipLoading:
+            page = await customer_repo.get_page(None, len(CUSTOMER_GUIDS), include)
+            assert [customer.guid for customer in page] == sorted(CUSTOMER_GUIDS)
+        documents = await customer_repo.get_page_documents(None, len(CUSTOMER_GUIDS))
+        assert [row.guid for row in documents] == sorted(CUSTOMER_GUIDS)
+        account_document = await account_repo.find_document_by_guid(account_guid)
+        assert json.loads(account_document)["customers"][0]["guid"] == guid
+
+        customer = await customer_repo.find_by_guid(guid)
+        assert customer.accounts[0].guid == account_guid
+        assert await account_repo.account_exists_by_guid(account_guid)
+
+        account = await account_repo.update(
+            account_guid, AccountUpdate(account_name="New Account Name")
+        )
+        assert account.account_name == "New Account Name"
+        assert account.customers[0].guid == guid
+
+        assert await customer_repo.delete(guid)
+        assert not await customer_repo.customer_exists_by_guid(guid)
+        customers = await customer_repo.get_page(None, len(CUSTOMER_GUIDS))
+        assert len(customers) == len(CUSTOMER_GUIDS) - 1
+
+    async def test_uppercase_guid_routed_to_its_shard(self, sharded_db_client):
+        """Tests a customer is found by any spelling of its guid."""
+        customer_repo = CustomerRepository(sharded_db_client)
+
+        for guid in CUSTOMER_GUIDS:
+            assert shard_id_for(guid.upper(), SHARD_IDS) == shard_id_for(
+                guid, SHARD_IDS
+            )
+            assert await customer_repo.customer_exists_by_guid(guid.upper())
+            assert (await customer_repo.find_by_guid(guid.upper())).guid == guid
+            assert await customer_repo.update(
+                guid.upper(), CustomerUpdate(last_name="Smith")
+            )
+
+    async def test_cross_shard_flush_rejected(self, sharded_db_client):
+        """Tests a flush writing to two shards is refused."""
+        guids = {shard_id_for(guid, SHARD_IDS): guid for guid in CUSTOMER_GUIDS}
+
+        async with sharded_db_client.get_session() as session:
+            for shard_id in ("0", "1"):
+                customer = await session.get(Customer, guids[shard_id])
+                customer.first_name = "Changed"
+
+            with pytest.raises(ShardRoutingError):
+                await session.flush()
+
+    async def test_pool_stats_reported_per_shard(self, sharded_db_client):
+        """Tests pool statistics list every shard."""
+        stats = sharded_db_client.get_pool_stats()
+
+        assert [pool_stats.engine for pool_stats in stats] == [
+            "shard0",
+            "shard1",
+            "shard2",
+        ]
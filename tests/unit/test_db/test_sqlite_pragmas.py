@@ -0,0 +1,69 @@
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from src.db.sqlite_pragmas import (
+    PRAGMA_PROFILES,
+    get_pragma_profile,
+    register_pragma_profile,
+)
+from src.errors.exceptions import DBConfigError
+
+
+class TestSqlitePragmas:
+    """Test suite for SQLite pragma profiles."""
+
+    def test_get_pragma_profile_case_insensitive(self):
+        """Tests profiles are looked up regardless of case."""
+        assert get_pragma_profile("Balanced") == PRAGMA_PROFILES["balanced"]
+
+    def test_get_pragma_profile_unknown(self):
+        """Tests an unknown profile name raises a configuration error."""
+        with pytest.raises(DBConfigError) as exc_info:
+            get_pragma_profile("reckless")
+
+        assert "reckless" in exc_info.value.message
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("profile_name", list(PRAGMA_PROFILES))
+    async def test_profile_applied_on_connect(self, tmp_path, profile_name):
+        """Tests every new connection receives the profile's pragmas."""
+        engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'p.db'}")
+        register_pragma_profile(engine, profile_name)
+        expected = PRAGMA_PROFILES[profile_name]
+
+        async with engine.connect() as conn:
+            journal_mode = await conn.scalar(text("PRAGMA journal_mode"))
+            synchronous = await conn.scalar(text("PRAGMA synchronous"))
+            busy_timeout = await conn.scalar(text("PRAGMA busy_timeout"))
+            cache_size = await conn.scalar(text("PRAGMA cache_size"))
+
+        await engine.dispose()
+
+        synchronous_levels = {"OFF": 0, "NORMAL": 1, "FULL": 2}
+        assert journal_mode == "wal"
+        assert synchronous == synchronous_levels[expected["synchronous"]]
+        assert busy_timeout == expected["busy_timeout"]
+        assert cache_size == expected["cache_size"]
+
+    @pytest.mark.asyncio
+    async def test_read_only_profile_skips_writer_pragmas(self, tmp_path):
+        """Tests read-only connections open without changing the journal mode."""
+        db_path = tmp_path / "ro.db"
+        writer = create_async_engine(f"sqlite+aiosqlite:///{db_path}")
+        register_pragma_profile(writer, "durable")
+        reader = create_async_engine(
+            f"sqlite+aiosqlite:///file:{db_path}?mode=ro&uri=true"
+        )
+        register_pragma_profile(reader, "durable", read_only=True)
+
+        async with writer.connect() as conn:
+            await conn.execute(text("CREATE TABLE t (id INTEGER)"))
+            await conn.commit()
+
+        async with reader.connect() as conn:
+            assert await conn.scalar(text("PRAGMA journal_mode")) == "wal"
+            assert await conn.scalar(text("PRAGMA busy_timeout")) == 5000
+
+        await reader.dispose()
+        await writer.dispose()
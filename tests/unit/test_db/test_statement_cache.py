@@ -0,0 +1,62 @@
+import pytest
+from sqlalchemy import bindparam, column, select, text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from src.db.statement_cache import StatementCache
+
+
+@pytest.fixture
+async def engine():
+    """Fixture providing an in-memory async engine."""
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    yield engine
+    await engine.dispose()
+
+
+@pytest.mark.asyncio
+class TestStatementCache:
+    """Test suite for StatementCache class."""
+
+    async def test_hits_counted_per_statement(self, engine):
+        """Tests the first execution compiles and later ones reuse the result."""
+        statement_cache = StatementCache()
+        statement_cache.register(engine)
+        statement = statement_cache.add(
+            "select_value", select(column("value")).select_from(text("marker"))
+        )
+        by_value = statement_cache.add(
+            "select_by_value",
+            select(column("value"))
+            .select_from(text("marker"))
+            .where(column("value") == bindparam("value")),
+        )
+
+        async with engine.connect() as conn:
+            await conn.execute(text("CREATE TABLE marker (value INTEGER)"))
+            for value in range(3):
+                await conn.execute(statement)
+                await conn.execute(by_value, {"value": value})
+            await conn.execute(text("SELECT 1"))
+
+        stats = {stats.name: stats for stats in statement_cache.snapshot()}
+
+        assert list(stats) == ["select_value", "select_by_value"]
+        assert (stats["select_value"].hits, stats["select_value"].misses) == (2, 1)
+        assert stats["select_by_value"].hit_ratio == pytest.approx(2 / 3)
+
+    async def test_unused_statement_reports_zero(self):
+        """Tests statements which never ran report no hits."""
+        statement_cache = StatementCache()
+        statement_cache.add("unused", select(column("value")))
+
+        (stats,) = statement_cache.snapshot()
+
+        assert (stats.hits, stats.misses, stats.hit_ratio) == (0, 0, 0.0)
+
+    async def test_duplicate_name_rejected(self):
+        """Tests two statements cannot share a name."""
+        statement_cache = StatementCache()
+        statement_cache.add("unused", select(column("value")))
+
+        with pytest.raises(ValueError):
+            statement_cache.add("unused", select(column("value")))
@@ -0,0 +1,209 @@
+import asyncio
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import ContextVar
+from unittest.mock import Mock, patch
+
+import pytest
+from sqlalchemy import select, update
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+
+from src.core.settings import AppSettings
+from src.db.database import DatabaseClient
+from src.db.threadpool_session import ThreadPoolSession
+from src.db.unit_of_work import UnitOfWork
+from src.errors.exceptions import DBConfigError
+from src.models.banking_models import Customer
+from src.repositories.account_repository import AccountRepository
+from src.repositories.customer_repository import CustomerRepository
+from src.schemas.customer.customer_update import CustomerUpdate
+
+GUID = "3566661b-bba9-4bd0-a82c-2966c34db25f"
+
+request_id: ContextVar[str] = ContextVar("request_id", default="")
+
+
+@pytest.fixture
+def app_settings(tmp_path) -> AppSettings:
+    """Fixture providing settings for the threadpool backend on a file database."""
+    app_settings = AppSettings()
+    app_settings.DATABASE_URL = f"sqlite+aiosqlite:///{tmp_path / 'bank.db'}"
+    app_settings.DB_BACKEND = "threadpool"
+    app_settings.DB_THREADPOOL_SIZE = 2
+    return app_settings
+
+
+@pytest.fixture
+async def threadpool_db_client(app_settings):
+    """Fixture providing a client using the threadpool backend."""
+    with patch("src.db.database.get_app_settings", return_value=app_settings):
+        db_client = DatabaseClient()
+        await db_client.initialise()
+
+    yield db_client
+
+    await db_client.close()
+
+
+@pytest.fixture
+def executor():
+    """Fixture providing a single worker thread."""
+    executor = ThreadPoolExecutor(max_workers=1)
+    yield executor
+    executor.shutdown()
+
+
+@pytest.mark.asyncio
+class TestThreadPoolSession:
+    """Test suite for ThreadPoolSession class."""
+
+    async def test_calls_run_on_worker_thread_with_context(self, executor):
+        """Tests calls leave the event loop thread but keep context variables."""
+        sync_session = Mock()
+        sync_session.get.side_effect = lambda entity, ident: (
+            request_id.get(),
+            threading.get_ident(),
+        )
+        session = ThreadPoolSession(
+            sync_session, executor, asyncio.Semaphore(1), 1, asyncio.Lock()
+        )
+        request_id.set("request-1")
+
+        value, thread_ident = await session.get(Mock(), GUID)
+
+        assert value == "request-1"
+        assert thread_ident != threading.get_ident()
+
+    async def test_sessions_wait_for_a_connection_slot(self, executor):
+        """Tests sessions beyond the pool's capacity wait on the loop, then time out."""
+        connection_slots = asyncio.Semaphore(1)
+        write_lock = asyncio.Lock()
+        first = ThreadPoolSession(Mock(), executor, connection_slots, 1, write_lock)
+        second = ThreadPoolSession(Mock(), executor, connection_slots, 0.05, write_lock)
+
+        await first.connection()
+
+        with pytest.raises(PoolTimeoutError):
+            await second.connection()
+
+        await first.close()
+        await second.connection()
+
+        first.sync_session.close.assert_called_once()
+        assert connection_slots.locked()
+
+    async def test_writers_take_turns_on_the_loop(self, executor):
+        """Tests a second writer waits for the first one's commit before flushing."""
+        connection_slots = asyncio.Semaphore(2)
+        write_lock = asyncio.Lock()
+        first = ThreadPoolSession(Mock(), executor, connection_slots, 1, write_lock)
+        second = ThreadPoolSession(Mock(), executor, connection_slots, 1, write_lock)
+
+        await first.flush()
+        second_flush = asyncio.create_task(second.flush())
+        await asyncio.sleep(0.05)
+
+        assert not second_flush.done()
+        second.sync_session.flush.assert_not_called()
+
+        await first.commit()
+        await second_flush
+        await second.close()
+
+        second.sync_session.flush.assert_called_once()
+        assert not write_lock.locked()
+
+    async def test_dml_statements_take_the_write_lock(self, executor):
+        """Tests an UPDATE waits for the write lock, while a SELECT does not."""
+        connection_slots = asyncio.Semaphore(2)
+        write_lock = asyncio.Lock()
+        first = ThreadPoolSession(Mock(), executor, connection_slots, 1, write_lock)
+        second = ThreadPoolSession(Mock(), executor, connection_slots, 1, write_lock)
+
+        await first.exec(update(Customer).values(first_name="Jill"))
+        await second.exec(select(Customer))
+        second_update = asyncio.create_task(
+            second.exec(update(Customer).values(first_name="Jack"))
+        )
+        await asyncio.sleep(0.05)
+
+        assert write_lock.locked()
+        assert not second_update.done()
+
+        await first.commit()
+        await second_update
+        await second.rollback()
+
+        assert not write_lock.locked()
+
+
+@pytest.mark.asyncio
+class TestThreadPoolBackend:
+    """Test suite for the threadpool backend of DatabaseClient."""
+
+    async def test_repositories_run_unchanged(
+        self, threadpool_db_client, customer_account_input
+    ):
+        """Tests repositories work on either backend."""
+        customer_repo = CustomerRepository(threadpool_db_client)
+        customer_input, account_input = customer_account_input(GUID)
+        await customer_repo.create(customer_input, account_input)
+
+        async with UnitOfWork(threadpool_db_client) as unit_of_work:
+            customer_repo = CustomerRepository(unit_of_work)
+            assert await customer_repo.customer_exists_by_guid(GUID)
+            await customer_repo.update(GUID, CustomerUpdate(first_name="Jill"))
+
+        customer = await CustomerRepository(threadpool_db_client).find_by_guid(GUID)
+        assert customer.first_name == "Jill"
+        assert customer.accounts[0].guid == account_input.guid
+
+        account_repo = AccountRepository(threadpool_db_client)
+        assert await account_repo.delete(account_input.guid) is True
+
+        pool_stats = threadpool_db_client.get_pool_stats()
+        assert [stats.engine for stats in pool_stats] == ["primary", "read"]
+        assert {stats.pool_class for stats in pool_stats} == {"QueuePool"}
+        assert pool_stats[0].checkouts >= 3
+
+    async def test_concurrent_updates_and_creates_take_turns(
+        self, threadpool_db_client, customer_account_input
+    ):
+        """Tests UPDATE ... RETURNING waits for the write lock like a flush does."""
+        guids = [str(uuid.UUID(int=index + 1, version=4)) for index in range(40)]
+        customer_repo = CustomerRepository(threadpool_db_client)
+        for guid in guids[:20]:
+            await customer_repo.create(*customer_account_input(guid))
+
+        results = await asyncio.gather(
+            *[
+                customer_repo.update(guid, CustomerUpdate(first_name="Jill"))
+                for guid in guids[:20]
+            ],
+            *[
+                customer_repo.create(*customer_account_input(guid))
+                for guid in guids[20:]
+            ],
+        )
+
+        assert all(customer.first_name == "Jill" for customer in results[:20])
+        assert len(await customer_repo.get_page(None, len(guids))) == len(guids)
+
+    @pytest.mark.parametrize(
+        "setting, value",
+        [
+            ("DB_BACKEND", "greenlet"),
+            ("DATABASE_URL", "sqlite+aiosqlite:///:memory:"),
+            ("DB_SHARD_COUNT", 2),
+        ],
+    )
+    async def test_unsupported_configuration_refused(
+        self, app_settings, setting, value
+    ):
+        """Tests unknown backends and unsupported combinations fail at start-up."""
+        setattr(app_settings, setting, value)
+
+        with patch("src.db.database.get_app_settings", return_value=app_settings):
+            with pytest.raises(DBConfigError):
+                await DatabaseClient().initialise()
@@ -0,0 +1,132 @@
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+from sqlalchemy.exc import OperationalError
+
+from src.db.unit_of_work import UnitOfWork, get_unit_of_work
+from src.db.write_retry import WriteRetry
+from src.errors.exceptions import DatabaseContentionError
+
+
+@pytest.fixture
+def mock_session() -> AsyncMock:
+    """Fixture providing a mocked session."""
+    return AsyncMock()
+
+
+@pytest.fixture
+def mock_db_client(mock_session) -> Mock:
+    """Fixture providing a mocked database client."""
+    mock_db_client = Mock()
+    mock_db_client.open_session = AsyncMock(return_value=mock_session)
+    mock_db_client.batches_writes = False
+    mock_db_client.write_retry = WriteRetry(
+        max_attempts=3, base_backoff_ms=1, max_backoff_ms=1, budget_ms=1000
+    )
+    return mock_db_client
+
+
+@pytest.mark.asyncio
+class TestUnitOfWork:
+    """Test suite for UnitOfWork class."""
+
+    async def test_session_shared_and_committed_once(
+        self, mock_db_client, mock_session
+    ):
+        """Tests repositories share one session, committed at exit."""
+        async with UnitOfWork(mock_db_client) as unit_of_work:
+            async with unit_of_work.get_read_session() as read_session:
+                pass
+            result = await unit_of_work.execute_write(AsyncMock(return_value=True))
+
+            assert read_session is mock_session
+            assert result is True
+            mock_session.commit.assert_not_called()
+
+        mock_db_client.open_session.assert_called_once_with(False)
+        mock_session.commit.assert_called_once()
+        mock_session.rollback.assert_not_called()
+        mock_session.close.assert_called_once()
+
+    async def test_writes_handed_to_batcher(self, mock_db_client, mock_session):
+        """Tests writes go to the client's group commit when batching is enabled."""
+        mock_db_client.batches_writes = True
+        mock_db_client.execute_write = AsyncMock(return_value=True)
+        operation = AsyncMock()
+
+        async with UnitOfWork(mock_db_client) as unit_of_work:
+            assert await unit_of_work.execute_write(operation) is True
+
+        mock_db_client.execute_write.assert_called_once_with(operation)
+        mock_db_client.open_session.assert_not_called()
+
+    async def test_first_write_retried_while_locked(self, mock_db_client, mock_session):
+        """Tests only the write taking the lock is retried, after a rollback."""
+        locked = OperationalError("INSERT", {}, Exception("database is locked"))
+        first_write = AsyncMock(side_effect=[locked, "first"])
+        second_write = AsyncMock(side_effect=locked)
+
+        async with UnitOfWork(mock_db_client) as unit_of_work:
+            assert await unit_of_work.execute_write(first_write) == "first"
+            mock_session.rollback.assert_called_once()
+
+            with pytest.raises(OperationalError):
+                await unit_of_work.execute_write(second_write)
+
+        second_write.assert_called_once_with(mock_session)
+        assert mock_db_client.write_retry.snapshot().retries == 1
+
+    async def test_locked_commit_raises_contention_error(
+        self, mock_db_client, mock_session
+    ):
+        """Tests a commit failing on the lock is rolled back and reported as busy."""
+        locked = OperationalError("COMMIT", {}, Exception("database is locked"))
+        mock_session.commit.side_effect = locked
+
+        with pytest.raises(DatabaseContentionError):
+            async with UnitOfWork(mock_db_client) as unit_of_work:
+                await unit_of_work.execute_write(AsyncMock())
+
+        mock_session.rollback.assert_called_once()
+        mock_session.close.assert_called_once()
+        assert mock_db_client.write_retry.snapshot().give_ups == 1
+
+    async def test_rolled_back_on_exception(self, mock_db_client, mock_session):
+        """Tests the transaction is rolled back when the request fails."""
+        with pytest.raises(ValueError):
+            async with UnitOfWork(mock_db_client) as unit_of_work:
+                async with unit_of_work.get_session():
+                    raise ValueError("Request failed")
+
+        mock_session.commit.assert_not_called()
+        mock_session.rollback.assert_called_once()
+        mock_session.close.assert_called_once()
+
+    async def test_read_only_never_commits(self, mock_db_client, mock_session):
+        """Tests a read-only unit of work uses the read engine and never commits."""
+        async with UnitOfWork(mock_db_client, read_only=True) as unit_of_work:
+            async with unit_of_work.get_session():
+                pass
+
+        mock_db_client.open_session.assert_called_once_with(True)
+        mock_session.commit.assert_not_called()
+        mock_session.rollback.assert_called_once()
+
+    async def test_no_session_opened_when_unused(self, mock_db_client):
+        """Tests no connection is checked out if no repository queries."""
+        async with UnitOfWork(mock_db_client):
+            pass
+
+        mock_db_client.open_session.assert_not_called()
+
+    @pytest.mark.parametrize(
+        "method, read_only", [("GET", True), ("PUT", False), ("DELETE", False)]
+    )
+    async def test_get_unit_of_work_read_only_for_safe_methods(
+        self, mock_db_client, method, read_only
+    ):
+        """Tests the dependency binds safe methods to the read engine."""
+        request = Mock(method=method)
+
+        async for unit_of_work in get_unit_of_work(request, mock_db_client):
+            assert unit_of_work.read_only is read_only
@@ -0,0 +1,175 @@
+import asyncio
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from sqlalchemy.exc import OperationalError
+
+from src.core.settings import AppSettings
+from src.db.database import DatabaseClient
+from src.db.write_batcher import WriteBatcher
+from src.db.write_retry import WriteRetry
+from src.errors.exceptions import DatabaseContentionError
+from src.models.banking_models import Customer
+from src.repositories.customer_repository import CustomerRepository
+
+
+class FakeSessionScope:
+    """Records the sessions opened by the batcher."""
+
+    def __init__(self):
+        self.sessions = []
+
+    @asynccontextmanager
+    async def __call__(self):
+        session = AsyncMock()
+        self.sessions.append(session)
+        yield session
+
+
+async def write(value, session):
+    """Operation returning its value, failing for exceptions."""
+    await asyncio.sleep(0)
+    if isinstance(value, Exception):
+        raise value
+    return value
+
+
+@pytest.mark.asyncio
+class TestWriteBatcher:
+    """Test suite for WriteBatcher class."""
+
+    async def test_concurrent_writes_share_one_commit(self):
+        """Tests concurrent writes commit together and each get their result."""
+        session_scope = FakeSessionScope()
+        write_batcher = WriteBatcher(session_scope, max_batch_size=10, max_delay_ms=50)
+
+        results = await asyncio.gather(
+            *(
+                write_batcher.submit(lambda session, i=i: write(i, session))
+                for i in range(5)
+            )
+        )
+
+        assert results == [0, 1, 2, 3, 4]
+        (session,) = session_scope.sessions
+        session.commit.assert_called_once()
+
+    async def test_full_batch_commits_without_waiting(self):
+        """Tests batches are capped at the batch size and commit once full."""
+        session_scope = FakeSessionScope()
+        write_batcher = WriteBatcher(
+            session_scope, max_batch_size=2, max_delay_ms=60000
+        )
+
+        results = await asyncio.wait_for(
+            asyncio.gather(
+                *(
+                    write_batcher.submit(lambda session, i=i: write(i, session))
+                    for i in range(4)
+                )
+            ),
+            timeout=5,
+        )
+
+        assert results == [0, 1, 2, 3]
+        assert len(session_scope.sessions) == 2
+
+    async def test_failure_reported_to_its_caller_only(self):
+        """Tests a failing write is retried alone and the others still commit."""
+        session_scope = FakeSessionScope()
+        write_batcher = WriteBatcher(session_scope, max_batch_size=10, max_delay_ms=50)
+        error = ValueError("Invalid write")
+
+        results = await asyncio.gather(
+            write_batcher.submit(lambda session: write(1, session)),
+            write_batcher.submit(lambda session: write(error, session)),
+            write_batcher.submit(lambda session: write(3, session)),
+            return_exceptions=True,
+        )
+
+        assert results == [1, error, 3]
+        # The failed batch, then one transaction per write
+        assert len(session_scope.sessions) == 4
+        assert [session.commit.call_count for session in session_scope.sessions] == [
+            0,
+            1,
+            0,
+            1,
+        ]
+
+    async def test_locked_batch_retried_as_a_whole(self):
+        """Tests a batch which finds the database locked is committed on retry."""
+        session_scope = FakeSessionScope()
+        write_retry = WriteRetry(
+            max_attempts=3, base_backoff_ms=1, max_backoff_ms=1, budget_ms=1000
+        )
+        write_batcher = WriteBatcher(
+            session_scope, max_batch_size=10, max_delay_ms=50, write_retry=write_retry
+        )
+        locked = [OperationalError("INSERT", {}, Exception("database is locked"))]
+
+        async def write_once_locked(session):
+            if locked:
+                raise locked.pop()
+            return await write(2, session)
+
+        results = await asyncio.gather(
+            write_batcher.submit(lambda session: write(1, session)),
+            write_batcher.submit(write_once_locked),
+        )
+
+        assert results == [1, 2]
+        assert len(session_scope.sessions) == 2
+        assert write_retry.snapshot().retries == 1
+
+    async def test_contention_fails_the_whole_batch(self):
+        """Tests writes are not applied one by one once the retries give up."""
+        session_scope = FakeSessionScope()
+        write_retry = WriteRetry(
+            max_attempts=1, base_backoff_ms=1, max_backoff_ms=1, budget_ms=1000
+        )
+        write_batcher = WriteBatcher(
+            session_scope, max_batch_size=10, max_delay_ms=50, write_retry=write_retry
+        )
+        locked = OperationalError("INSERT", {}, Exception("database is locked"))
+
+        results = await asyncio.gather(
+            write_batcher.submit(lambda session: write(1, session)),
+            write_batcher.submit(lambda session: write(locked, session)),
+            return_exceptions=True,
+        )
+
+        assert all(isinstance(result, DatabaseContentionError) for result in results)
+        assert len(session_scope.sessions) == 1
+
+
+@pytest.mark.asyncio
+async def test_repository_writes_batched(tmp_path, customer_account_input):
+    """Tests concurrent customer creations are committed in group commits."""
+    app_settings = AppSettings()
+    app_settings.DATABASE_URL = f"sqlite+aiosqlite:///{tmp_path / 'batch.db'}"
+    app_settings.DB_WRITE_BATCHING = True
+    app_settings.DB_WRITE_BATCH_WINDOW_MS = 20
+
+    with patch("src.db.database.get_app_settings", return_value=app_settings):
+        db_client = DatabaseClient()
+        await db_client.initialise()
+
+    customer_repo = CustomerRepository(db_client)
+    guids = [f"3566661b-bba9-4bd0-a82c-2966c34db2{index:02d}" for index in range(20)]
+
+    created = await asyncio.gather(
+        *(customer_repo.create(*customer_account_input(g)) for g in guids)
+    )
+
+    assert [customer[0].guid for customer in created] == guids
+    page = await customer_repo.get_page(None, len(guids))
+    assert [customer.guid for customer in page] == guids
+    assert db_client.get_pool_stats()[0].checkouts < len(guids)
+
+    async with db_client.get_session() as session:
+        assert len((await session.exec(Customer.__table__.select())).all()) == 20
+
+    await db_client._engine.dispose()
+    await db_client._read_engine.dispose()
@@ -0,0 +1,90 @@
+from unittest.mock import AsyncMock
+
+import pytest
+from sqlalchemy.exc import OperationalError
+
+from src.db.write_retry import WriteRetry, is_lock_contention
+from src.errors.exceptions import DatabaseContentionError
+from src.schemas.database.contention_stats_output import ContentionStatsOutput
+
+
+def locked_error() -> OperationalError:
+    """Error raised by aiosqlite when another connection holds the write lock."""
+    return OperationalError("INSERT", {}, Exception("database is locked"))
+
+
+@pytest.mark.parametrize(
+    "error, expected",
+    [
+        (locked_error(), True),
+        (OperationalError("SELECT", {}, Exception("database table is locked")), True),
+        (OperationalError("SELECT", {}, Exception("no such table: account")), False),
+        (ValueError("database is locked"), False),
+    ],
+)
+def test_is_lock_contention(error, expected):
+    """Tests only SQLite lock errors are treated as retryable."""
+    assert is_lock_contention(error) is expected
+
+
+@pytest.mark.asyncio
+class TestWriteRetry:
+    """Test suite for WriteRetry class."""
+
+    async def test_locked_write_retried_until_it_succeeds(self):
+        """Tests a write is retried while locked and contention is recorded."""
+        write_retry = WriteRetry(
+            max_attempts=5, base_backoff_ms=1, max_backoff_ms=2, budget_ms=1000
+        )
+        attempt = AsyncMock(side_effect=[locked_error(), locked_error(), "written"])
+
+        assert await write_retry.run(attempt) == "written"
+
+        assert attempt.call_count == 3
+        stats = write_retry.snapshot()
+        assert isinstance(stats, ContentionStatsOutput)
+        assert stats.lock_errors == 2
+        assert stats.retries == 2
+        assert stats.give_ups == 0
+        assert 0 <= stats.max_wait_ms <= stats.total_wait_ms <= 4
+
+    async def test_other_errors_not_retried(self):
+        """Tests errors unrelated to locking propagate straight away."""
+        write_retry = WriteRetry(
+            max_attempts=5, base_backoff_ms=1, max_backoff_ms=2, budget_ms=1000
+        )
+        attempt = AsyncMock(side_effect=ValueError("Invalid write"))
+
+        with pytest.raises(ValueError):
+            await write_retry.run(attempt)
+
+        attempt.assert_called_once()
+        assert write_retry.snapshot().lock_errors == 0
+
+    async def test_gives_up_after_max_attempts(self):
+        """Tests a write which stays locked fails with DatabaseContentionError."""
+        write_retry = WriteRetry(
+            max_attempts=3, base_backoff_ms=1, max_backoff_ms=2, budget_ms=1000
+        )
+        attempt = AsyncMock(side_effect=locked_error())
+
+        with pytest.raises(DatabaseContentionError) as exc_info:
+            await write_retry.run(attempt)
+
+        assert isinstance(exc_info.value.__cause__, OperationalError)
+        assert attempt.call_count == 3
+        stats = write_retry.snapshot()
+        assert (stats.lock_errors, stats.retries, stats.give_ups) == (3, 2, 1)
+
+    async def test_gives_up_when_backoff_exceeds_budget(self):
+        """Tests no backoff is started which would overrun the time budget."""
+        write_retry = WriteRetry(
+            max_attempts=10, base_backoff_ms=5000, max_backoff_ms=5000, budget_ms=0
+        )
+        attempt = AsyncMock(side_effect=locked_error())
+
+        with pytest.raises(DatabaseContentionError):
+            await write_retry.run(attempt)
+
+        attempt.assert_called_once()
+        assert write_retry.snapshot().total_wait_ms == 0
@@ -0,0 +1,27 @@
+import pytest
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+
+from src.errors.exceptions import DatabaseContentionError
+from src.errors.handlers import database_contention_handler
+from tests.shared.constants import test_url
+
+
+@pytest.mark.asyncio
+async def test_database_contention_returns_service_unavailable():
+    """Tests a write which gave up on the database lock is reported as a 503."""
+    app = FastAPI()
+    app.add_exception_handler(DatabaseContentionError, database_contention_handler)
+
+    @app.post("/customers")
+    async def create_customer():
+        raise DatabaseContentionError("The database is busy. Please retry the request.")
+
+    async with AsyncClient(transport=ASGITransport(app), base_url=test_url) as client:
+        response = await client.post("/customers")
+
+    assert response.status_code == 503
+    assert response.headers["Retry-After"] == "1"
+    assert response.json() == {
+        "detail": "The database is busy. Please retry the request."
+    }
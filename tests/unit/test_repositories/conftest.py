@@ -1,7 +1,8 @@
-from unittest.mock import Mock, patch
+from unittest.mock import patch
 
 import pytest
 
+from src.core.settings import AppSettings
 from src.db.database import DatabaseClient
 from src.enums.account_status import AccountStatus
 from src.repositories.customer_repository import CustomerRepository
@@ -50,7 +51,7 @@ def valid_account_data():
 @pytest.fixture
 @patch("src.db.database.get_app_settings")
 async def in_memory_db_client(mock_get_app_settings):
-    mock_app_settings = Mock()
+    mock_app_settings = AppSettings()
     mock_app_settings.DATABASE_URL = "sqlite+aiosqlite:///:memory:"
     mock_get_app_settings.return_value = mock_app_settings
 
@@ -1,3 +1,4 @@
+import logging
 from unittest.mock import MagicMock
 
 import pytest
@@ -8,23 +9,24 @@ from src.repositories.account_repository import (
     get_account_repository,
 )
 from src.schemas.account.account_update import AccountUpdate
+from src.utils.constants import DEFAULT_PAGE_SIZE
 
 
 @pytest.mark.asyncio
 class TestAccountRepository:
     """Test suite for Account Repository."""
 
-    async def test_account_repository_retrieve_all_success(
+    async def test_account_repository_retrieve_page_success(
         self,
         in_memory_db_client,
         customer_in_memory_db,
         valid_account_data,
         valid_customer_data_two,
     ):
-        """Tests happy path of get all method of AccountRepository"""
+        """Tests happy path of get page method of AccountRepository"""
 
         account_repo = AccountRepository(in_memory_db_client)
-        all_accounts = await account_repo.get_all()
+        all_accounts = await account_repo.get_page(None, DEFAULT_PAGE_SIZE)
 
         assert len(all_accounts) == 1
 
@@ -65,11 +67,7 @@ class TestAccountRepository:
 
         account_repo = AccountRepository(in_memory_db_client)
         account_guid = customer_in_memory_db.accounts[0].guid
-        retrieved_account = await account_repo.get_by_guid(account_guid)
-
-        assert len(retrieved_account) == 1
-
-        account_record = retrieved_account[0]
+        account_record = await account_repo.find_by_guid(account_guid)
 
         for field in ["account_name", "status"]:
             assert getattr(account_record, field) == valid_account_data[field]
@@ -106,11 +104,7 @@ class TestAccountRepository:
 
         account_repo = AccountRepository(in_memory_db_client)
         account_guid = customer_in_memory_db.accounts[0].guid
-        updated_account = await account_repo.update(account_guid, data)
-
-        assert len(updated_account) == 1
-
-        account_record = updated_account[0]
+        account_record = await account_repo.update(account_guid, data)
 
         assert account_record.guid == account_guid
         assert account_record.account_name == updated_data["account_name"]
@@ -150,6 +144,23 @@ class TestAccountRepository:
             await account_repo.account_exists_by_guid(nonexistent_account_guid) is False
         )  # noqa
 
+    async def test_queries_attributed_to_repository_method(
+        self, in_memory_db_client, customer_in_memory_db, caplog
+    ):
+        """Tests slow query logs name the repository method issuing them."""
+        in_memory_db_client._query_logger.slow_query_seconds = 0
+        account_repo = AccountRepository(in_memory_db_client)
+        account_guid = customer_in_memory_db.accounts[0].guid
+
+        with caplog.at_level(logging.INFO, logger="src.logger"):
+            await account_repo.find_by_guid(account_guid)
+
+        assert caplog.records
+        assert all(
+            "from AccountRepository.find_by_guid:" in record.getMessage()
+            for record in caplog.records
+        )
+
     async def test_get_account_repository_instance(self):
         """Tests dependency provider for AccountRepository."""
 
@@ -10,24 +10,25 @@ from src.repositories.customer_repository import (
 from src.schemas.account.account_input import AccountInput
 from src.schemas.customer.customer_input import CustomerInput
 from src.schemas.customer.customer_update import CustomerUpdate
+from src.utils.constants import DEFAULT_PAGE_SIZE
 
 
 @pytest.mark.asyncio
 class TestCustomerRepository:
     """Test suite for Customer Repository."""
 
-    async def test_customer_repository_retrieve_all_success(
+    async def test_customer_repository_retrieve_page_success(
         self,
         in_memory_db_client,
         customer_in_memory_db,
         valid_customer_data_two,
         valid_account_data,
     ):
-        """Tests happy path of get all method of CustomerRepository"""
+        """Tests happy path of get page method of CustomerRepository"""
 
         customer_repo = CustomerRepository(in_memory_db_client)
 
-        all_customers = await customer_repo.get_all()
+        all_customers = await customer_repo.get_page(None, DEFAULT_PAGE_SIZE)
 
         assert len(all_customers) == 1
 
@@ -67,11 +68,7 @@ class TestCustomerRepository:
         """Tests customer record can be successfully retrieved with the guid."""
 
         customer_repo = CustomerRepository(in_memory_db_client)
-        retrieved_customer = await customer_repo.get_by_guid(customer_in_memory_db.guid)
-
-        assert len(retrieved_customer) == 1
-
-        customer_record = retrieved_customer[0]
+        customer_record = await customer_repo.find_by_guid(customer_in_memory_db.guid)
 
         for field in [
             "first_name",
@@ -97,6 +94,16 @@ class TestCustomerRepository:
 
         assert str(account_record.guid) == valid_account_data["guid"]
 
+    async def test_find_nonexistent_customer_returns_none(self, in_memory_db_client):
+        """Tests find_by_guid returns None for a customer which does not exist."""
+
+        customer_repo = CustomerRepository(in_memory_db_client)
+
+        assert (
+            await customer_repo.find_by_guid("6f2ac0a4-8dcb-4bb0-9e2e-3ce86a8ef1f3")
+            is None
+        )
+
     async def test_create_customer_success(
         self,
         in_memory_db_client,
@@ -161,11 +168,7 @@ class TestCustomerRepository:
         data = CustomerUpdate(**updated_data)
 
         customer_repo = CustomerRepository(in_memory_db_client)
-        updated_customer = await customer_repo.update(customer_in_memory_db.guid, data)
-
-        assert len(updated_customer) == 1
-
-        customer_record = updated_customer[0]
+        customer_record = await customer_repo.update(customer_in_memory_db.guid, data)
 
         for field in updated_data.keys():
             assert getattr(customer_record, field) == updated_data[field]
@@ -187,6 +190,21 @@ class TestCustomerRepository:
 
         assert str(account_record.guid) == valid_account_data["guid"]
 
+    async def test_update_nonexistent_customer_returns_none(
+        self, in_memory_db_client, customer_in_memory_db
+    ):
+        """Tests updating a customer which does not exist writes nothing."""
+
+        customer_repo = CustomerRepository(in_memory_db_client)
+        nonexistent_customer_guid = "6f2ac0a4-8dcb-4bb0-9e2e-3ce86a8ef1f3"
+
+        assert (
+            await customer_repo.update(
+                nonexistent_customer_guid, CustomerUpdate(middle_names="Andrew")
+            )
+            is None
+        )
+
     async def test_delete_customer_success(
         self,
         in_memory_db_client,
@@ -223,6 +241,27 @@ class TestCustomerRepository:
             is False
         )  # noqa
 
+    async def test_customer_exists_reuses_compiled_statement(
+        self, in_memory_db_client, customer_in_memory_db
+    ):
+        """Tests repeated existence checks hit the compiled statement cache."""
+        customer_repo = CustomerRepository(in_memory_db_client)
+
+        def customer_exists_stats():
+            return next(
+                stats
+                for stats in in_memory_db_client.get_statement_stats()
+                if stats.name == "customer_exists"
+            )
+
+        await customer_repo.customer_exists_by_guid(customer_in_memory_db.guid)
+        hits_before = customer_exists_stats().hits
+
+        for _ in range(3):
+            await customer_repo.customer_exists_by_guid(customer_in_memory_db.guid)
+
+        assert customer_exists_stats().hits == hits_before + 3
+
     async def test_get_customer_repository_instance(self):
         """Tests dependency provider for CustomerRepository."""
 
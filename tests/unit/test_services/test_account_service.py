@@ -3,6 +3,7 @@ import json
 import pytest
 
 from src.enums.account_status import AccountStatus
+from src.enums.relationship_loading import RelationshipLoading
 from src.schemas.account.account_output import AccountOutput
 from src.schemas.account.account_update import AccountUpdate
 from src.schemas.base_response import GenericResponseModel
@@ -50,7 +51,7 @@ class TestAccountService:
             )
         ]
 
-        mock_account_repository.get_all.return_value = mock_repo_output
+        mock_account_repository.get_page.return_value = mock_repo_output
 
         all_accounts = await account_service.get_all()
 
@@ -60,12 +61,15 @@ class TestAccountService:
             "success": "true",
             "message": "Available account data returned",
             "data": [account.model_dump_json() for account in mock_repo_output],
+            "next_cursor": None,
         }
 
         for field in expected_response_attrs.keys():
             assert getattr(all_accounts, field) == expected_response_attrs[field]
 
-        mock_account_repository.get_all.assert_called_once()
+        mock_account_repository.get_page.assert_called_once_with(
+            None, 51, RelationshipLoading.SELECTIN
+        )
 
     async def test_retrieve_single_account_success(self, account_service_with_repo):
         """Tests happy path of get_account method of AccountService."""
@@ -95,8 +99,7 @@ class TestAccountService:
             )
         ]
 
-        mock_account_repository.get_by_guid.return_value = mock_repo_output
-        mock_account_repository.account_exists_by_guid.return_value = True
+        mock_account_repository.find_by_guid.return_value = mock_repo_output[0]
 
         retrieved_account = await account_service.get_account(test_account_guid)
 
@@ -110,7 +113,9 @@ class TestAccountService:
         for field in expected_response_attrs.keys():
             assert getattr(retrieved_account, field) == expected_response_attrs[field]
 
-        mock_account_repository.get_by_guid.assert_called_once()
+        mock_account_repository.find_by_guid.assert_called_once_with(
+            test_account_guid, RelationshipLoading.SELECTIN
+        )
 
     async def test_retrieve_single_account_failure(self, account_service_with_repo):
         """Tests unhappy path of get_account method of AccountService."""
@@ -119,8 +124,7 @@ class TestAccountService:
 
         test_account_guid = "02308a1b-781c-4f19-967f-acd957218fab"
 
-        mock_account_repository.account_exists_by_guid.return_value = False
-        mock_account_repository.get_by_guid.return_value = None
+        mock_account_repository.find_by_guid.return_value = None
 
         with pytest.raises(Exception) as exc_info:
             retrieved_account = await account_service.get_account(test_account_guid)
@@ -130,8 +134,32 @@ class TestAccountService:
         assert str(exc_info.value.detail) == f"Account not found: {test_account_guid}"
         assert str(exc_info.value.status_code) == "404"
 
-        mock_account_repository.account_exists_by_guid.assert_called_once()
-        mock_account_repository.get_by_guid.assert_not_called()
+        mock_account_repository.find_by_guid.assert_called_once_with(
+            test_account_guid, RelationshipLoading.SELECTIN
+        )
+
+    async def test_retrieve_single_account_json_not_found(
+        self, account_service_with_repo
+    ):
+        """Tests include=json answers 404 when no document is found."""
+
+        account_service, mock_account_repository = account_service_with_repo
+
+        test_account_guid = "a621d452-78cc-4a29-97ad-1aad6949bd3c"
+
+        mock_account_repository.find_document_by_guid.return_value = None
+
+        with pytest.raises(Exception) as exc_info:
+            await account_service.get_account(
+                test_account_guid, RelationshipLoading.JSON
+            )
+
+        assert str(exc_info.value.detail) == f"Account not found: {test_account_guid}"
+        assert str(exc_info.value.status_code) == "404"
+
+        mock_account_repository.find_document_by_guid.assert_called_once_with(
+            test_account_guid
+        )
 
     async def test_delete_account_success(self, account_service_with_repo):
         """Tests happy path of delete method of AccountService."""
@@ -240,8 +268,7 @@ class TestAccountService:
             )
         ]
 
-        mock_account_repository.account_exists_by_guid.return_value = True
-        mock_account_repository.update.return_value = mock_repo_output
+        mock_account_repository.update.return_value = mock_repo_output[0]
 
         update_data = AccountUpdate(account_name="Current Account - J.A. Bloggs")
 
@@ -263,8 +290,9 @@ class TestAccountService:
 
         assert account_record["account_name"] == "Current Account - J.A. Bloggs"
 
-        mock_account_repository.update.assert_called_once()
-        mock_account_repository.account_exists_by_guid.assert_called_once()
+        mock_account_repository.update.assert_called_once_with(
+            test_account_guid, update_data
+        )
 
     async def test_get_account_service_provider(self, mock_account_repository):
         """Tests dependency provider for AccountRepository."""
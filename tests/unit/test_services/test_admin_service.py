@@ -0,0 +1,162 @@
+import json
+
+import pytest
+from fastapi import HTTPException
+
+from src.errors.exceptions import BackupInProgressError
+from src.schemas.base_response import GenericResponseModel
+from src.schemas.database.backup_status_output import BackupStatusOutput
+from src.schemas.database.contention_stats_output import ContentionStatsOutput
+from src.schemas.database.maintenance_status_output import MaintenanceStatusOutput
+from src.schemas.database.pool_stats_output import PoolStatsOutput
+from src.schemas.database.statement_stats_output import StatementStatsOutput
+from src.services.admin_service import AdminService, get_admin_service
+
+
+@pytest.mark.asyncio
+class TestAdminService:
+    """Test suite for AdminService."""
+
+    async def test_get_pool_stats_success(self, mock_db_client):
+        """Tests happy path of get_pool_stats method of AdminService."""
+
+        pool_stats = PoolStatsOutput(
+            engine="primary",
+            pool_class="AsyncAdaptedQueuePool",
+            size=5,
+            checked_out=2,
+            idle=3,
+            overflow=0,
+            checkouts=40,
+            timeouts=0,
+            average_wait_ms=0.2,
+            max_wait_ms=1.5,
+        )
+        mock_db_client.get_pool_stats.return_value = [pool_stats]
+
+        admin_service = AdminService(mock_db_client)
+        response = await admin_service.get_pool_stats()
+
+        assert isinstance(response, GenericResponseModel)
+        assert response.status_code == 200
+        assert response.success == "true"
+        assert response.message == "Connection pool statistics returned"
+        assert json.loads(response.data[0]) == pool_stats.model_dump()
+
+        mock_db_client.get_pool_stats.assert_called_once()
+
+    async def test_get_statement_stats_success(self, mock_db_client):
+        """Tests happy path of get_statement_stats method of AdminService."""
+
+        statement_stats = StatementStatsOutput(
+            name="account_row_by_guid", hits=9, misses=1, hit_ratio=0.9
+        )
+        mock_db_client.get_statement_stats.return_value = [statement_stats]
+
+        admin_service = AdminService(mock_db_client)
+        response = await admin_service.get_statement_stats()
+
+        assert response.status_code == 200
+        assert response.message == "Statement cache statistics returned"
+        assert json.loads(response.data[0]) == statement_stats.model_dump()
+
+        mock_db_client.get_statement_stats.assert_called_once()
+
+    async def test_get_contention_stats_success(self, mock_db_client):
+        """Tests happy path of get_contention_stats method of AdminService."""
+
+        contention_stats = ContentionStatsOutput(
+            lock_errors=4, retries=3, give_ups=1, total_wait_ms=12.5, max_wait_ms=8.0
+        )
+        mock_db_client.get_contention_stats.return_value = contention_stats
+
+        admin_service = AdminService(mock_db_client)
+        response = await admin_service.get_contention_stats()
+
+        assert response.status_code == 200
+        assert response.message == "Write contention statistics returned"
+        assert json.loads(response.data[0]) == contention_stats.model_dump()
+
+        mock_db_client.get_contention_stats.assert_called_once()
+
+    async def test_start_backup_success(self, mock_db_client):
+        """Tests happy path of start_backup method of AdminService."""
+
+        backup_status = BackupStatusOutput(
+            target="backups/bank-20240101T020000Z.db",
+            state="pending",
+            pages_copied=0,
+            total_pages=0,
+            restarts=0,
+            elapsed_ms=0,
+            pages_per_second=0,
+        )
+        mock_db_client.start_backup.return_value = [backup_status]
+
+        admin_service = AdminService(mock_db_client)
+        response = await admin_service.start_backup()
+
+        assert response.status_code == 202
+        assert response.message == "Database backup started"
+        assert json.loads(response.data[0]) == backup_status.model_dump()
+
+        mock_db_client.start_backup.assert_called_once()
+
+    async def test_start_backup_already_running(self, mock_db_client):
+        """Tests start_backup raises a conflict while a backup is running."""
+
+        mock_db_client.start_backup.side_effect = BackupInProgressError(
+            "A backup is already running."
+        )
+
+        admin_service = AdminService(mock_db_client)
+
+        with pytest.raises(HTTPException) as exc_info:
+            await admin_service.start_backup()
+
+        assert exc_info.value.status_code == 409
+
+    async def test_get_backup_status_success(self, mock_db_client):
+        """Tests happy path of get_backup_status method of AdminService."""
+
+        mock_db_client.get_backup_status.return_value = []
+
+        admin_service = AdminService(mock_db_client)
+        response = await admin_service.get_backup_status()
+
+        assert response.status_code == 200
+        assert response.message == "Database backup status returned"
+        assert response.data == []
+
+        mock_db_client.get_backup_status.assert_called_once()
+
+    async def test_get_maintenance_status_success(self, mock_db_client):
+        """Tests happy path of get_maintenance_status method of AdminService."""
+
+        maintenance_status = MaintenanceStatusOutput(
+            task="incremental_vacuum",
+            runs=3,
+            last_run_at="2024-01-01T02:00:00Z",
+            last_duration_ms=12.5,
+            last_result="freed 512 pages, 0 free pages left",
+        )
+        mock_db_client.get_maintenance_status.return_value = [maintenance_status]
+
+        admin_service = AdminService(mock_db_client)
+        response = await admin_service.get_maintenance_status()
+
+        assert response.status_code == 200
+        assert response.message == "Database maintenance status returned"
+        assert json.loads(response.data[0])["last_result"] == (
+            "freed 512 pages, 0 free pages left"
+        )
+
+        mock_db_client.get_maintenance_status.assert_called_once()
+
+    async def test_get_admin_service_provider(self, mock_db_client):
+        """Tests dependency provider for AdminService."""
+
+        admin_service = await get_admin_service(mock_db_client)
+
+        assert isinstance(admin_service, AdminService)
+        assert admin_service.db_client == mock_db_client
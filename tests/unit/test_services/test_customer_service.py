@@ -1,9 +1,11 @@
 import json
 from datetime import date
+from types import SimpleNamespace
 
 import pytest
 
 from src.enums.account_status import AccountStatus
+from src.enums.relationship_loading import RelationshipLoading
 from src.models.banking_models import Account, Customer
 from src.schemas.account.account_output import AccountOutput
 from src.schemas.base_response import GenericResponseModel
@@ -11,6 +13,7 @@ from src.schemas.create_customer_request import CreateCustomerRequest
 from src.schemas.customer.customer_output import CustomerOutput
 from src.schemas.customer.customer_update import CustomerUpdate
 from src.services.customer_service import CustomerService, get_customer_service
+from src.utils.pagination import encode_cursor
 from tests.shared.constants import TEST_GUID_3, TEST_GUID_4
 
 
@@ -53,7 +56,7 @@ class TestCustomerService:
             )
         ]
 
-        mock_customer_repository.get_all.return_value = mock_repo_output
+        mock_customer_repository.get_page.return_value = mock_repo_output
 
         all_customers = await customer_service.get_all()
 
@@ -63,11 +66,58 @@ class TestCustomerService:
             "success": "true",
             "message": "Available customer data returned",
             "data": [customer.model_dump_json() for customer in mock_repo_output],
+            "next_cursor": None,
         }
         for field in expected_response_attrs.keys():
             assert getattr(all_customers, field) == expected_response_attrs[field]
 
-        mock_customer_repository.get_all.assert_called_once()
+        mock_customer_repository.get_page.assert_called_once_with(
+            None, 51, RelationshipLoading.SELECTIN
+        )
+
+    async def test_retrieve_all_returns_next_cursor(self, customer_service_with_repo):
+        """Tests get_all returns a cursor when more customers follow the page."""
+
+        customer_service, mock_customer_repository = customer_service_with_repo
+
+        mock_customer_repository.get_page.return_value = [
+            CustomerOutput(
+                guid=guid,
+                first_name="Jacqueline",
+                last_name="Doe",
+                date_of_birth="1994-03-24",
+                phone_number="07123456789",
+                email_address="jacqueline.a.doe@email.com",
+                address="123 Baker Street, London, EC3M 6DD",
+                accounts=[],
+            )
+            for guid in (TEST_GUID_3, TEST_GUID_4)
+        ]
+
+        first_page = await customer_service.get_all(limit=1)
+
+        assert len(first_page.data) == 1
+        assert first_page.next_cursor == encode_cursor(TEST_GUID_3)
+
+        mock_customer_repository.get_page.reset_mock()
+        await customer_service.get_all(first_page.next_cursor, limit=1)
+
+        mock_customer_repository.get_page.assert_called_once_with(
+            TEST_GUID_3, 2, RelationshipLoading.SELECTIN
+        )
+
+    async def test_retrieve_all_invalid_cursor(self, customer_service_with_repo):
+        """Tests get_all rejects a cursor it did not issue."""
+
+        customer_service, mock_customer_repository = customer_service_with_repo
+
+        with pytest.raises(Exception) as exc_info:
+            await customer_service.get_all("not-a-cursor")
+
+        assert str(exc_info.value.status_code) == "400"
+        assert exc_info.value.detail == "Invalid page cursor: not-a-cursor"
+
+        mock_customer_repository.get_page.assert_not_called()
 
     async def test_retrieve_single_customer_success(self, customer_service_with_repo):
         """Tests happy path of get_customer method of CustomerService"""
@@ -97,8 +147,7 @@ class TestCustomerService:
             )
         ]
 
-        mock_customer_repository.get_by_guid.return_value = mock_repo_output
-        mock_customer_repository.customer_exists_by_guid.return_value = True
+        mock_customer_repository.find_by_guid.return_value = mock_repo_output[0]
 
         retrieved_customer = await customer_service.get_customer(test_customer_guid)
 
@@ -112,7 +161,9 @@ class TestCustomerService:
         for field in expected_response_attrs.keys():
             assert getattr(retrieved_customer, field) == expected_response_attrs[field]
 
-        mock_customer_repository.get_by_guid.assert_called_once()
+        mock_customer_repository.find_by_guid.assert_called_once_with(
+            test_customer_guid, RelationshipLoading.SELECTIN
+        )
 
     async def test_retrieve_single_customer_failure(self, customer_service_with_repo):
         """Tests unhappy path of get_customer method of CustomerService."""
@@ -121,8 +172,7 @@ class TestCustomerService:
 
         test_customer_guid = "a621d452-78cc-4a29-97ad-1aad6949bd3c"
 
-        mock_customer_repository.customer_exists_by_guid.return_value = False
-        mock_customer_repository.get_by_guid.return_value = None
+        mock_customer_repository.find_by_guid.return_value = None
 
         with pytest.raises(Exception) as exc_info:
             retrieved_customer = await customer_service.get_customer(test_customer_guid)
@@ -132,8 +182,39 @@ class TestCustomerService:
         assert str(exc_info.value.detail) == f"Customer not found: {test_customer_guid}"
         assert str(exc_info.value.status_code) == "404"
 
-        mock_customer_repository.customer_exists_by_guid.assert_called_once()
-        mock_customer_repository.get_by_guid.assert_not_called()
+        mock_customer_repository.find_by_guid.assert_called_once_with(
+            test_customer_guid, RelationshipLoading.SELECTIN
+        )
+
+    async def test_retrieve_json_documents(self, customer_service_with_repo):
+        """Tests include=json returns the repository's documents as they are."""
+
+        customer_service, mock_customer_repository = customer_service_with_repo
+
+        documents = [
+            SimpleNamespace(guid=guid, document=f'{{"guid":"{guid}"}}')
+            for guid in (TEST_GUID_3, TEST_GUID_4)
+        ]
+        mock_customer_repository.get_page_documents.return_value = documents
+        mock_customer_repository.find_document_by_guid.return_value = documents[
+            0
+        ].document
+
+        page = await customer_service.get_all(limit=1, include=RelationshipLoading.JSON)
+        customer = await customer_service.get_customer(
+            TEST_GUID_3, RelationshipLoading.JSON
+        )
+
+        assert page.data == [documents[0].document]
+        assert page.next_cursor == encode_cursor(TEST_GUID_3)
+        assert customer.data == [documents[0].document]
+
+        mock_customer_repository.get_page_documents.assert_called_once_with(None, 2)
+        mock_customer_repository.find_document_by_guid.assert_called_once_with(
+            TEST_GUID_3
+        )
+        mock_customer_repository.get_page.assert_not_called()
+        mock_customer_repository.find_by_guid.assert_not_called()
 
     async def test_delete_customer_success(self, customer_service_with_repo):
         """Tests happy path of delete method of CustomerService."""
@@ -242,8 +323,7 @@ class TestCustomerService:
             )
         ]
 
-        mock_customer_repository.customer_exists_by_guid.return_value = True
-        mock_customer_repository.update.return_value = mock_repo_output
+        mock_customer_repository.update.return_value = mock_repo_output[0]
 
         update_data = CustomerUpdate(
             middle_names="Anu", email_address="j.a.doe@email.com"
@@ -270,8 +350,9 @@ class TestCustomerService:
         assert customer_record["middle_names"] == "Anu"
         assert customer_record["email_address"] == "j.a.doe@email.com"
 
-        mock_customer_repository.update.assert_called_once()
-        mock_customer_repository.customer_exists_by_guid.assert_called_once()
+        mock_customer_repository.update.assert_called_once_with(
+            test_customer_guid, update_data
+        )
 
     async def test_update_non_existent_customer(self, customer_service_with_repo):
         """
@@ -282,7 +363,6 @@ class TestCustomerService:
 
         test_customer_guid = "cd63c6f1-aa5e-484c-8d66-3b4f51c408af"
 
-        mock_customer_repository.customer_exists_by_guid.return_value = False
         mock_customer_repository.update.return_value = None
 
         update_data = CustomerUpdate(middle_names="Barbara")
@@ -297,8 +377,9 @@ class TestCustomerService:
         assert str(exc_info.value.status_code) == "404"
         assert str(exc_info.value.detail) == f"Customer not found: {test_customer_guid}"
 
-        mock_customer_repository.customer_exists_by_guid.assert_called_once()
-        mock_customer_repository.update.assert_not_called()
+        mock_customer_repository.update.assert_called_once_with(
+            test_customer_guid, update_data
+        )
 
     async def test_create_customer_success(self, customer_service_with_repo):
         """Tests create method of CustomerService class."""
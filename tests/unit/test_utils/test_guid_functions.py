@@ -0,0 +1,29 @@
+import time
+
+from src.utils.guid_functions import generate_guid, uuid7
+from src.utils.regex_patterns import GUID_PATTERN
+
+
+def test_uuid7_embeds_creation_time():
+    """Tests uuid7 returns a version 7 UUID carrying the current time."""
+    before = time.time_ns() // 1_000_000
+    guid = uuid7()
+    after = time.time_ns() // 1_000_000
+
+    assert guid.version == 7
+    assert before <= guid.int >> 80 <= after
+
+
+def test_uuid7_sorts_in_creation_order():
+    """Tests consecutive uuid7 values sort in the order they were created."""
+    guids = []
+    for _ in range(50):
+        guids.append(uuid7())
+        time.sleep(0.0001)
+
+    assert sorted(guids) == guids
+
+
+def test_generate_guid_matches_guid_pattern():
+    """Tests generated guids pass the schemas' validation."""
+    assert GUID_PATTERN.match(generate_guid())
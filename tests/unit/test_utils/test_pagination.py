@@ -0,0 +1,20 @@
+import pytest
+
+from src.errors.exceptions import InvalidCursorError
+from src.utils.pagination import decode_cursor, encode_cursor
+from tests.shared.constants import TEST_GUID_3
+
+
+def test_cursor_round_trip():
+    """Tests a cursor decodes to the guid it was encoded from."""
+    cursor = encode_cursor(TEST_GUID_3)
+
+    assert TEST_GUID_3 not in cursor
+    assert decode_cursor(cursor) == TEST_GUID_3
+
+
+@pytest.mark.parametrize("cursor", ["not-a-cursor", "AAAA", "Zm9v!"])
+def test_invalid_cursor_rejected(cursor):
+    """Tests cursors not issued by encode_cursor raise InvalidCursorError."""
+    with pytest.raises(InvalidCursorError):
+        decode_cursor(cursor)